@@ -0,0 +1,272 @@
+"""
+네이버 뉴스 크롤러 성능 측정
+
+기록된 검색 결과/기사 HTML(tests/fixtures)과 로컬 재생 서버를 사용해 네트워크 없이
+단계별 처리량을 측정하고 결과를 JSON으로 저장합니다. 커밋 간 결과 파일을 비교해
+변경이 크롤러를 빠르게 했는지 느리게 했는지 확인할 수 있습니다.
+
+사용법:
+    python benchmarks/run_benchmarks.py [--quick] [--output 결과.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.core.content_extractor import NaverNewsContentExtractor
+from src.core.crawler import NewsCrawler
+from src.core.extractors import NaverNewsURLExtractor
+from src.models.news import NewsArticle, canonical_article_key
+from src.utils import http_archive
+from src.utils.config import get_config
+from src.utils.file_saver import FileSaver
+from src.utils.http_archive import HttpArchive
+from src.utils.near_duplicate import NearDuplicateIndex
+from src.utils.seen_store import SeenArticleStore
+
+FIXTURE_DIR = os.path.join(PROJECT_ROOT, 'tests', 'fixtures')
+RESULT_DIR = os.path.join(PROJECT_ROOT, 'benchmarks', 'results')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """func를 repeat번 실행한 시간(초) 중 가장 짧은 값 (워밍업 1회 제외)"""
+    func()
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_search_parse(repeat: int) -> Dict[str, Any]:
+    """extract_news_urls 처리량 (페이지/초)"""
+    config = get_config()
+    html = load_fixture('naver_search.html')
+    extractor = NaverNewsURLExtractor.parser_only()
+    results = {'urls_per_page': len(extractor.extract_news_urls(html))}
+
+    original = config.crawling.partial_search_parse
+    try:
+        for label, partial in (('full_parse', False), ('partial_parse', True)):
+            config.crawling.partial_search_parse = partial
+            elapsed = measure(lambda: extractor.extract_news_urls(html), repeat)
+            results[f'{label}_pages_per_sec'] = round(repeat / elapsed, 1)
+    finally:
+        config.crawling.partial_search_parse = original
+    return results
+
+
+def bench_article_parse(repeat: int) -> Dict[str, Any]:
+    """기사 파싱 처리량 (기사/초)"""
+    config = get_config()
+    html = load_fixture('naver_article.html')
+    url = "https://n.news.naver.com/mnews/article/001/0015000000"
+    extractor = NaverNewsContentExtractor.parser_only()
+    results = {}
+
+    original = config.extraction.engine
+    try:
+        for engine in ('beautifulsoup', 'lxml'):
+            config.extraction.engine = engine
+            elapsed = measure(lambda: extractor.parse_news_content(url, html), repeat)
+            results[f'{engine}_articles_per_sec'] = round(repeat / elapsed, 1)
+    finally:
+        config.extraction.engine = original
+    return results
+
+
+def bench_dedup(count: int) -> Dict[str, Any]:
+    """중복 제거 처리량 (항목/초)"""
+    # 절반은 같은 기사의 다른 URL 형태
+    urls = [f"https://n.news.naver.com/mnews/article/{i % 50:03d}/{i // 2:010d}?sid=101" for i in range(count)]
+    titles = [f"{i // 2}번 기사 제목 경제 정책 발표와 시장 반응 정리" for i in range(count)]
+
+    def hash_dedup():
+        seen = set()
+        for url in urls:
+            key = canonical_article_key(url)
+            if key not in seen:
+                seen.add(key)
+
+    title_count = max(1, count // 10)
+
+    def title_dedup():
+        index = NearDuplicateIndex()
+        for title in titles[:title_count]:
+            index.add(title)
+
+    tmp_dir = tempfile.mkdtemp(prefix='bench_seen_')
+    try:
+        store = SeenArticleStore(os.path.join(tmp_dir, 'seen.db'), batch_size=500)
+        keys = [canonical_article_key(url) for url in urls]
+        start = time.perf_counter()
+        for key in keys:
+            if not store.contains(key):
+                store.add(key)
+        store.flush()
+        store_elapsed = time.perf_counter() - start
+        store.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        'hash_keys_per_sec': round(count / measure(hash_dedup, 1), 1),
+        'near_duplicate_titles_per_sec': round(title_count / measure(title_dedup, 1), 1),
+        'seen_store_keys_per_sec': round(count / store_elapsed, 1),
+    }
+
+
+def bench_save(count: int) -> Dict[str, Any]:
+    """FileSaver.save_articles 처리량 (MB/초)"""
+    content = load_fixture('naver_article.html')
+    articles = [NewsArticle(url=f"https://n.news.naver.com/mnews/article/001/{i:010d}",
+                            title=f"{i}번 기사", press="연합뉴스", date="2025-05-29 10:15:03",
+                            content=content, reporter="홍길동 기자") for i in range(count)]
+    saver = FileSaver()
+    tmp_dir = tempfile.mkdtemp(prefix='bench_save_')
+    try:
+        start = time.perf_counter()
+        files = saver.save_articles(articles, query='benchmark', period='1d', output_dir=tmp_dir)
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(path) for path in files)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        'articles': count,
+        'megabytes': round(size / 1024 / 1024, 2),
+        'mb_per_sec': round(size / 1024 / 1024 / elapsed, 2),
+    }
+
+
+def bench_pipeline(pages: int, workers: int, latency_ms: float) -> Dict[str, Any]:
+    """재생 서버를 대상으로 한 전체 크롤링 시간"""
+    config = get_config()
+    search_html = load_fixture('naver_search.html')
+    article_html = load_fixture('naver_article.html')
+
+    tmp_dir = tempfile.mkdtemp(prefix='bench_replay_')
+    saved = (config.network.http_mode, config.advanced.http_archive,
+             config.crawling.max_workers, config.crawling.max_requests_per_second)
+    try:
+        config.advanced.http_archive = {
+            'archive_path': os.path.join(tmp_dir, 'archive.jsonl.gz'),
+            'replay_latency_ms': latency_ms,
+            'replay_403_rate': 0.0,
+            'replay_5xx_rate': 0.0,
+            'replay_seed': 0
+        }
+        config.network.http_mode = 'replay'
+        config.crawling.max_workers = workers
+        config.crawling.max_requests_per_second = 0
+
+        crawler = NewsCrawler()
+        search_url = crawler._build_search_option("벤치마크", "1d", None, None, "relevance", "all").build_url()
+
+        # 페이지마다 서로 다른 기사 ID를 갖도록 검색 결과 고정 페이지를 변형
+        archive = HttpArchive(config.advanced.http_archive['archive_path'])
+        base_urls = [u.url for u in NaverNewsURLExtractor.parser_only().extract_news_urls(search_html)]
+        for page in range(pages):
+            page_html = search_html
+            for url in base_urls:
+                aid = url.split('?')[0].rsplit('/', 1)[1]
+                page_html = page_html.replace(aid, f"{int(aid) + page * 1000:010d}")
+            archive.record(f"{search_url}&start={page * 10 + 1}", 200, 'text/html', page_html)
+            for url in NaverNewsURLExtractor.parser_only().extract_news_urls(page_html):
+                archive.record(url.url.split('?')[0], 200, 'text/html', article_html)
+        archive.close()
+
+        start = time.perf_counter()
+        result = crawler.crawl("벤치마크", period="1d", max_pages=pages, extract_content=True,
+                               request_delay=0, content_delay=0, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        server_stats = dict(http_archive.get_replay_server().stats)
+    finally:
+        http_archive.stop_replay_server()
+        (config.network.http_mode, config.advanced.http_archive,
+         config.crawling.max_workers, config.crawling.max_requests_per_second) = saved
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        'pages': pages,
+        'workers': workers,
+        'latency_ms': latency_ms,
+        'urls': len(result.urls),
+        'articles': len(result.articles),
+        'wall_time_sec': round(elapsed, 3),
+        'articles_per_sec': round(len(result.articles) / elapsed, 1) if elapsed else 0.0,
+        'requests': server_stats['requests'],
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main(argv: List[str] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description='네이버 뉴스 크롤러 성능 측정')
+    parser.add_argument('--quick', action='store_true', help='반복 횟수를 줄여 빠르게 실행')
+    parser.add_argument('--output', default=None, help='결과 JSON 경로 (기본값: benchmarks/results/)')
+    parser.add_argument('--workers', type=int, default=4, help='전체 크롤링 측정 시 본문 추출 작업자 수')
+    parser.add_argument('--latency-ms', type=float, default=20, help='재생 서버 응답 지연(밀리초)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    scale = 1 if args.quick else 5
+    revision = git_revision()
+
+    report = {
+        'revision': revision,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'results': {}
+    }
+    benchmarks = [
+        ('extract_news_urls', lambda: bench_search_parse(20 * scale)),
+        ('extract_news_content', lambda: bench_article_parse(20 * scale)),
+        ('dedup', lambda: bench_dedup(2000 * scale)),
+        ('save_articles', lambda: bench_save(40 * scale)),
+        ('pipeline', lambda: bench_pipeline(2 * scale, args.workers, args.latency_ms)),
+    ]
+    for name, bench in benchmarks:
+        print(f"[{name}] 측정 중...", flush=True)
+        report['results'][name] = bench()
+        print(f"  {json.dumps(report['results'][name], ensure_ascii=False)}", flush=True)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        output = os.path.join(RESULT_DIR, f"{datetime.now():%Y%m%d_%H%M%S}_{revision}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
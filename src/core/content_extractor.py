@@ -5,31 +5,29 @@
 """
 
 import logging
-import re
+from typing import Optional, Tuple
+
 from bs4 import BeautifulSoup
 
+from .extraction_plan import get_extraction_plan
 from .extractors import URLExtractor
+from .parse_pool import get_parse_pool
 from ..models.news import NewsArticle
-from ..utils.config import get_config
+from ..utils import metrics
+from ..utils.selector_stats import first_match, oid_from_article_id
 
 logger = logging.getLogger(__name__)
 
 class ContentExtractor(URLExtractor):
     """콘텐츠 추출 기본 클래스"""
     
-    def extract_text_from_element(self, element) -> str:
+    def extract_text_from_element(self, element, plan=None) -> str:
         """요소에서 텍스트 추출"""
         if not element:
             return ""
             
-        # 설정에서 불필요한 요소 목록 가져오기
-        config = get_config()
-        remove_elements = config.extraction.remove_elements
-        
-        # 불필요한 요소 제거
-        for selector in remove_elements:
-            for tag in element.select(selector):
-                tag.decompose()
+        # 불필요한 요소 제거 (컴파일된 추출 계획 사용)
+        (plan or get_extraction_plan()).remove_unwanted(element)
             
         # 단락별 텍스트 추출
         paragraphs = []
@@ -51,97 +49,118 @@ class NaverNewsContentExtractor(ContentExtractor):
     
     def _load_selectors(self):
         """설정 파일에서 CSS 선택자를 로드합니다."""
-        config = get_config()
-        selectors = config.extraction.content_selectors
-        
-        self.TITLE_SELECTORS = selectors.get('title', [])
-        self.PRESS_SELECTORS = selectors.get('press', [])
-        self.CONTENT_SELECTORS = selectors.get('content', [])
-        self.REPORTER_SELECTORS = selectors.get('reporter', [])
-        
-        # 날짜 선택자는 특별한 형식이므로 변환
-        date_selectors = selectors.get('date', [])
-        self.DATE_SELECTORS = []
-        for item in date_selectors:
-            if isinstance(item, dict):
-                self.DATE_SELECTORS.append((item.get('selector'), item.get('attribute')))
-            else:
-                self.DATE_SELECTORS.append((item, None))
+        plan = get_extraction_plan()
+        
+        self.TITLE_SELECTORS = [selector for selector, _ in plan.title]
+        self.PRESS_SELECTORS = [selector for selector, _ in plan.press]
+        self.CONTENT_SELECTORS = [selector for selector, _ in plan.content]
+        self.REPORTER_SELECTORS = [selector for selector, _ in plan.reporter]
+        self.DATE_SELECTORS = [(selector, attr) for selector, _, attr in plan.date]
     
-    def extract_news_content(self, url: str) -> NewsArticle:
-        """단일 뉴스 URL에서 콘텐츠 추출"""
+    @metrics.timed('article_extract_seconds')
+    def extract_news_content(self, url: str,
+                             interval: Optional[Tuple[float, float]] = None) -> NewsArticle:
+        """단일 뉴스 URL에서 콘텐츠 추출 (interval: 기사 요청 간격, get_page_content 참고)"""
         logger.debug(f"콘텐츠 추출 시도: {url}")
-        article = NewsArticle(url=url)
         
-        html_content = self.get_page_content(url)
+        html_content = self.get_page_content(url, interval=interval)
         if not html_content:
-            return article
-            
+            return NewsArticle(url=url)
+        
+        # 파싱 프로세스 풀 사용 시 파싱은 별도 프로세스에서 수행
+        parse_pool = get_parse_pool()
+        if parse_pool is not None:
+            article = parse_pool.parse_article(url, html_content)
+            if article is not None:
+                return article
+        
+        return self.parse_news_content(url, html_content)
+    
+    async def extract_news_content_async(self, url: str,
+                                         interval: Optional[Tuple[float, float]] = None) -> NewsArticle:
+        """단일 뉴스 URL에서 콘텐츠 추출 (비동기 요청 사용)"""
+        logger.debug(f"콘텐츠 추출 시도: {url}")
+        
+        html_content = await self.fetch(url, interval)
+        if not html_content:
+            return NewsArticle(url=url)
+        
+        return self.parse_news_content(url, html_content)
+    
+    @metrics.timed('article_parse_seconds')
+    def parse_news_content(self, url: str, html_content: str) -> NewsArticle:
+        """기사 HTML에서 콘텐츠 추출"""
+        # 설정이 바뀐 경우에만 다시 컴파일되는 추출 계획
+        plan = get_extraction_plan()
+        
+        # lxml 엔진 사용 설정 시 BeautifulSoup 트리를 만들지 않고 직접 추출
+        if plan.engine == 'lxml':
+            engine = plan.lxml_engine
+            if engine is not None:
+                return engine.parse(url, html_content, plan.selector_stats)
+        
+        article = NewsArticle(url=url)
+        
         try:
             soup = BeautifulSoup(html_content, 'lxml')
         except:
             # lxml 파서가 없을 경우 기본 파서 사용
             soup = BeautifulSoup(html_content, 'html.parser')
         
+        # 언론사별 선택자 통계 (적응형 순서 사용 시)
+        stats = plan.selector_stats
+        oid = oid_from_article_id(article.article_id) if stats else None
+        
+        def probe_title(candidate):
+            elem = candidate[1].select_one(soup)
+            return elem.get_text(separator=' ', strip=True) if elem else None
+        
+        def probe_press(candidate):
+            elem = candidate[1].select_one(soup)
+            return elem['alt'].strip() if elem and elem.get('alt') else None
+        
+        def probe_date(candidate):
+            selector, compiled, attr = candidate
+            elem = compiled.select_one(soup)
+            if not elem:
+                return None
+            if attr and elem.has_attr(attr):
+                return elem[attr].strip()
+            return elem.get_text(strip=True)
+        
+        def probe_content(candidate):
+            selector, compiled = candidate
+            elem = compiled.select_one(soup)
+            if not elem:
+                return None
+            content_text = self.extract_text_from_element(elem, plan)
+            # 본문 길이 검증
+            content_length = len(content_text)
+            if content_length < plan.min_content_length:
+                logger.debug(f"본문이 너무 짧음 ({content_length}자): {selector}")
+                return None
+            if content_length > plan.max_content_length:
+                # 최대 길이 초과 시 잘라내기
+                logger.warning(f"본문이 너무 길어 잘라냈습니다: {url}")
+                return content_text[:plan.max_content_length]
+            return content_text
+        
+        def probe_reporter(candidate):
+            elem = candidate[1].select_one(soup)
+            return elem.get_text(strip=True) if elem else None
+        
         try:
-            # 설정 다시 로드 (런타임 중 변경될 수 있음)
-            self._load_selectors()
-            config = get_config()
-            
-            # 제목 추출
-            for selector in self.TITLE_SELECTORS:
-                elem = soup.select_one(selector)
-                if elem:
-                    article.title = elem.get_text(separator=' ', strip=True)
-                    break
-            
-            # 언론사 추출
-            for selector in self.PRESS_SELECTORS:
-                elem = soup.select_one(selector)
-                if elem and elem.get('alt'):
-                    article.press = elem['alt'].strip()
-                    break
-            
-            # 날짜 추출
-            for selector, attr in self.DATE_SELECTORS:
-                elem = soup.select_one(selector)
-                if elem:
-                    if attr and elem.has_attr(attr):
-                        article.date = elem[attr].strip()
-                    else:
-                        article.date = elem.get_text(strip=True)
-                    break
-            
-            # 본문 추출
-            for selector in self.CONTENT_SELECTORS:
-                elem = soup.select_one(selector)
-                if elem:
-                    content_text = self.extract_text_from_element(elem)
-                    # 본문 길이 검증
-                    content_length = len(content_text)
-                    if content_length >= config.extraction.min_content_length:
-                        if content_length <= config.extraction.max_content_length:
-                            article.content = content_text
-                        else:
-                            # 최대 길이 초과 시 잘라내기
-                            article.content = content_text[:config.extraction.max_content_length]
-                            logger.warning(f"본문이 너무 길어 잘라냈습니다: {url}")
-                        break
-                    else:
-                        logger.debug(f"본문이 너무 짧음 ({content_length}자): {selector}")
-            
-            # 기자 추출
-            for selector in self.REPORTER_SELECTORS:
-                elem = soup.select_one(selector)
-                if elem:
-                    article.reporter = elem.get_text(strip=True)
-                    break
+            # 제목, 언론사, 날짜, 본문, 기자 순으로 추출
+            article.title = first_match(plan.title, probe_title, stats, 'title', oid) or ''
+            article.press = first_match(plan.press, probe_press, stats, 'press', oid) or ''
+            article.date = first_match(plan.date, probe_date, stats, 'date', oid) or ''
+            article.content = first_match(plan.content, probe_content, stats, 'content', oid) or ''
+            article.reporter = first_match(plan.reporter, probe_reporter, stats, 'reporter', oid) or ''
             
             # 본문에서 기자 정보 추출 시도
             if not article.reporter and article.content:
                 try:
-                    reporter_pattern = r'([가-힣]{2,5}\s*(기자|특파원))'
-                    match = re.search(reporter_pattern, article.content)
+                    match = plan.reporter_pattern.search(article.content)
                     if match:
                         article.reporter = match.group(1).strip()
                 except (AttributeError, TypeError) as e:
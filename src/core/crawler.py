@@ -5,15 +5,25 @@
 """
 
 import logging
-import random
+import queue
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from .extractors import NaverNewsURLExtractor
 from .content_extractor import NaverNewsContentExtractor
 from ..models.news import CrawlResult, NewsURL, NewsArticle
 from ..models.search_options import NaverNewsSearchOption
+from ..utils import metrics
 from ..utils.config import get_config
+from ..utils.adaptive_pacer import apply_global_rate, save_pacer_state
+from ..utils.rate_limiter import request_interval
+from ..utils.session_pool import save_session_pool_state
+from ..utils.http_archive import close_http_archive
+from ..utils.seen_store import get_seen_store
+from ..utils.response_cache import log_cache_stats
+from ..utils.selector_stats import save_selector_stats
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +49,9 @@ class NewsCrawler:
              content_limit: int = 0,
              extraction_mode: str = "sequential",
              request_delay: float = 1.0,
-             content_delay: float = 1.5) -> CrawlResult:
+             content_delay: float = 1.5,
+             max_workers: Optional[int] = None,
+             pipeline: Optional[bool] = None) -> CrawlResult:
         """
         뉴스 크롤링 실행
         
@@ -58,6 +70,8 @@ class NewsCrawler:
             extraction_mode: 추출 모드
             request_delay: URL 요청 지연
             content_delay: 본문 추출 지연
+            max_workers: 본문 동시 추출 작업자 수 (None이면 설정값 사용)
+            pipeline: URL 수집과 본문 추출 동시 진행 여부 (None이면 설정값 사용)
             
         Returns:
             CrawlResult: 크롤링 결과
@@ -65,6 +79,9 @@ class NewsCrawler:
         # 결과 객체 생성
         result = CrawlResult(query=query, period=period)
         
+        # 모든 요청이 공유하는 속도 제한기의 전체 초당 요청 수 (적응형 조절 시 학습한 속도)
+        apply_global_rate(self.config.crawling.max_requests_per_second)
+        
         try:
             # 검색 옵션 설정
             search_option = self._build_search_option(
@@ -74,6 +91,31 @@ class NewsCrawler:
             logger.info(f"검색 URL: {search_url}")
             logger.info("검색 URL 생성 완료")
             
+            if pipeline is None:
+                pipeline = self.config.crawling.pipeline_extraction
+            
+            # balanced 모드는 전체 URL 목록이 있어야 선택할 수 있으므로 파이프라인 미사용
+            if (pipeline and extract_content
+                    and not (extraction_mode == "balanced" and content_limit > 0)):
+                collected_urls, extracted_articles = self._crawl_pipelined(
+                    search_url,
+                    max_pages=max_pages,
+                    max_urls=max_urls,
+                    url_type_filter=url_type_filter,
+                    search_date=start_date,
+                    request_delay=request_delay,
+                    content_limit=content_limit,
+                    content_delay=content_delay,
+                    max_workers=max_workers
+                )
+                
+                for url in collected_urls:
+                    result.add_url(url)
+                for article in extracted_articles:
+                    result.add_article(article)
+                
+                return result
+            
             # URL 수집
             logger.info("URL 수집 시작...")
             logger.info("URL 수집 중...")
@@ -104,7 +146,8 @@ class NewsCrawler:
                     collected_urls,
                     content_limit,
                     extraction_mode,
-                    content_delay
+                    content_delay,
+                    max_workers
                 )
                 
                 for article in extracted_articles:
@@ -117,6 +160,15 @@ class NewsCrawler:
             result.add_error("crawl_error", str(e))
         
         finally:
+            seen_store = get_seen_store()
+            if seen_store:
+                seen_store.flush()
+            save_selector_stats()
+            save_pacer_state()
+            save_session_pool_state()
+            close_http_archive()
+            log_cache_stats()
+            metrics.export_metrics()
             result.complete()
         
         return result
@@ -171,9 +223,11 @@ class NewsCrawler:
     def _extract_contents(self, urls: List[NewsURL],
                          content_limit: int,
                          extraction_mode: str,
-                         delay_sec: float) -> List[NewsArticle]:
+                         delay_sec: float,
+                         max_workers: Optional[int] = None) -> List[NewsArticle]:
         """본문 추출 처리"""
-        articles = []
+        # 같은 기사가 여러 URL 형태로 들어온 경우 한 번만 추출
+        urls = self._unique_urls(urls)
         
         # 추출할 URL 선택
         if extraction_mode == "balanced" and content_limit > 0:
@@ -181,24 +235,229 @@ class NewsCrawler:
         else:
             urls_to_extract = urls[:content_limit] if content_limit > 0 else urls
         
-        # 본문 추출
+        if max_workers is None:
+            max_workers = self.config.crawling.max_workers
+        
+        if max_workers > 1 and len(urls_to_extract) > 1:
+            return self._extract_contents_concurrent(urls_to_extract, max_workers)
+        
+        interval = self._content_interval(delay_sec, max_workers)
+        articles = []
+        
+        # 본문 추출 (요청 간격은 공용 속도 제한기가 적용)
         for i, url_obj in enumerate(urls_to_extract):
-            if i > 0:
-                time.sleep(delay_sec + random.uniform(0, 0.5))
-            
             logger.info(f"본문 추출 중 ({i+1}/{len(urls_to_extract)}): {url_obj.url}")
             logger.info(
                 f"  본문 추출 중 ({i+1}/{len(urls_to_extract)})"
             )
-            article = self.content_extractor.extract_news_content(url_obj.url)
+            article = self.content_extractor.extract_news_content(url_obj.url, interval=interval)
             
-            if article.is_valid():
+            if self._accept_article(article, url_obj):
                 articles.append(article)
-            else:
-                logger.warning(f"유효하지 않은 콘텐츠: {url_obj.url}")
         
         return articles
     
+    @staticmethod
+    def _content_interval(delay_sec: float, max_workers: int) -> Tuple[float, float]:
+        """
+        본문 요청마다 공용 속도 제한기에 넘길 요청 간격
+        
+        작업자가 하나이면 기사 요청 사이에 delay_sec + 0~0.5초 간격을 두고,
+        여러 작업자가 동시에 추출할 때는 전체 초당 요청 수 제한(max_requests_per_second)만 적용합니다.
+        검색 페이지 간격은 iter_search_pages가 요청마다 따로 넘깁니다.
+        """
+        return request_interval(0 if max_workers > 1 else delay_sec, 0.5)
+    
+    def _extract_contents_concurrent(self, urls_to_extract: List[NewsURL],
+                                     max_workers: int) -> List[NewsArticle]:
+        """
+        여러 작업자로 본문을 동시에 추출
+        
+        개별 요청 간 지연 대신 전체 초당 요청 수 제한(max_requests_per_second)을
+        모든 작업자가 공유하며, 결과는 입력 순서대로 반환합니다.
+        """
+        total = len(urls_to_extract)
+        interval = self._content_interval(0, max_workers)
+        logger.info(
+            f"동시 본문 추출 시작 (작업자 {max_workers}개, "
+            f"초당 최대 {self.config.crawling.max_requests_per_second}건)"
+        )
+        
+        def extract(index: int, url_obj: NewsURL) -> NewsArticle:
+            logger.info(f"본문 추출 중 ({index+1}/{total}): {url_obj.url}")
+            return self.content_extractor.extract_news_content(url_obj.url, interval=interval)
+        
+        articles = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(extract, i, url_obj)
+                for i, url_obj in enumerate(urls_to_extract)
+            ]
+            # 제출 순서대로 결과 수집 (입력 순서 유지)
+            for url_obj, future in zip(urls_to_extract, futures):
+                try:
+                    article = future.result()
+                except Exception as e:
+                    logger.error(f"본문 추출 중 오류 ({url_obj.url}): {e}")
+                    continue
+                
+                if self._accept_article(article, url_obj):
+                    articles.append(article)
+        
+        return articles
+    
+    def _crawl_pipelined(self, search_url: str,
+                         max_pages: int,
+                         max_urls: int,
+                         url_type_filter: Optional[str],
+                         search_date: Optional[str],
+                         request_delay: float,
+                         content_limit: int,
+                         content_delay: float,
+                         max_workers: Optional[int] = None) -> Tuple[List[NewsURL], List[NewsArticle]]:
+        """
+        URL 수집과 본문 추출을 동시에 진행 (생산자/소비자 파이프라인)
+        
+        검색 페이지에서 발견한 URL은 즉시 크기가 제한된 큐에 들어가고,
+        추출 작업자들은 다음 페이지를 가져오는 동안 큐에서 URL을 꺼내 본문을 추출합니다.
+        큐가 가득 차면 URL 수집이 일시 정지되어 추출 속도에 맞춰집니다.
+        
+        Returns:
+            (수집된 URL 목록, 입력 순서대로 정렬된 유효 기사 목록)
+        """
+        if max_workers is None:
+            max_workers = self.config.crawling.max_workers
+        max_workers = max(1, max_workers)
+        interval = self._content_interval(content_delay, max_workers)
+        
+        url_queue: "queue.Queue" = queue.Queue(maxsize=max(1, self.config.crawling.pipeline_queue_size))
+        stop_marker = object()
+        # 추출 작업자가 모두 끝나면 설정되어 URL 수집도 멈춤 (큐 대기 중 교착 방지)
+        consumers_done = threading.Event()
+        live_consumers = [max_workers]
+        collected_urls: List[NewsURL] = []
+        extracted: Dict[int, NewsArticle] = {}
+        extracted_lock = threading.Lock()
+        start_time = time.time()
+        first_article_time: List[float] = []
+        
+        logger.info(f"파이프라인 수집 시작 (추출 작업자 {max_workers}개)")
+        
+        def enqueue(item) -> bool:
+            """큐에 항목 추가 (가득 차면 대기, 추출 작업자가 모두 끝났으면 False)"""
+            while not consumers_done.is_set():
+                try:
+                    url_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            queued = 0
+            try:
+                for page_urls in self.url_extractor.iter_search_pages(
+                    search_url,
+                    max_pages=max_pages,
+                    delay_sec=request_delay,
+                    max_urls=max_urls,
+                    url_type_filter=url_type_filter,
+                    search_date=search_date
+                ):
+                    collected_urls.extend(page_urls)
+                    for url_obj in page_urls:
+                        if content_limit > 0 and queued >= content_limit:
+                            break
+                        # 큐가 가득 차면 여기서 대기 (백프레셔)
+                        if not enqueue((queued, url_obj)):
+                            logger.error("추출 작업자가 모두 종료되어 URL 수집을 중단합니다.")
+                            return
+                        queued += 1
+            except Exception as e:
+                logger.error(f"파이프라인 URL 수집 중 오류: {e}", exc_info=True)
+            finally:
+                for _ in range(max_workers):
+                    if not enqueue(stop_marker):
+                        break
+        
+        def consume():
+            try:
+                while True:
+                    item = url_queue.get()
+                    if item is stop_marker:
+                        return
+                    
+                    index, url_obj = item
+                    logger.info(f"본문 추출 중 ({index+1}): {url_obj.url}")
+                    # 본문 추출과 수집 기록 저장 중 오류가 나도 작업자는 다음 URL을 계속 처리
+                    try:
+                        article = self.content_extractor.extract_news_content(url_obj.url, interval=interval)
+                        if not self._accept_article(article, url_obj):
+                            continue
+                    except Exception as e:
+                        logger.error(f"본문 추출 중 오류 ({url_obj.url}): {e}")
+                        continue
+                    
+                    with extracted_lock:
+                        extracted[index] = article
+                        if not first_article_time:
+                            first_article_time.append(time.time() - start_time)
+                            logger.info(f"첫 본문 추출 완료 ({first_article_time[0]:.1f}초)")
+            finally:
+                with extracted_lock:
+                    live_consumers[0] -= 1
+                    if live_consumers[0] == 0:
+                        consumers_done.set()
+        
+        producer = threading.Thread(target=produce, name="url-producer", daemon=True)
+        producer.start()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            workers = [executor.submit(consume) for _ in range(max_workers)]
+            for worker in workers:
+                worker.result()
+        producer.join()
+        
+        articles = [extracted[index] for index in sorted(extracted)]
+        elapsed = time.time() - start_time
+        logger.info(
+            f"파이프라인 완료: URL {len(collected_urls)}개, 본문 {len(articles)}개 "
+            f"(소요시간: {elapsed:.1f}초)"
+        )
+        
+        return collected_urls, articles
+    
+    def _accept_article(self, article: NewsArticle, url_obj: NewsURL) -> bool:
+        """
+        추출된 기사를 결과에 포함할지 판단하고 수집 기록 저장소에 기록
+        
+        유효하지 않은 기사와, 본문 해시 비교가 켜진 경우 이전에 수집한 기사와
+        본문이 같은 기사는 제외합니다.
+        """
+        if not article.is_valid():
+            logger.warning(f"유효하지 않은 콘텐츠: {url_obj.url}")
+            return False
+        
+        seen_store = get_seen_store()
+        if seen_store:
+            use_content_hash = self.config.advanced.duplicate_management.get('enable_content_hash', False)
+            if not seen_store.record_article(article, use_content_hash):
+                logger.info(f"동일 본문 기사 스킵: {url_obj.url}")
+                return False
+        
+        return True
+    
+    @staticmethod
+    def _unique_urls(urls: List[NewsURL]) -> List[NewsURL]:
+        """정규화된 기사 키 기준으로 중복 URL 제거 (순서 유지)"""
+        seen_keys = set()
+        unique = []
+        for url_obj in urls:
+            if url_obj.key not in seen_keys:
+                seen_keys.add(url_obj.key)
+                unique.append(url_obj)
+        return unique
+    
     def _select_balanced_urls(self, urls: List[NewsURL], limit: int) -> List[NewsURL]:
         """균등 분포로 URL 선택"""
         if len(urls) <= limit:
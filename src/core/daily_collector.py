@@ -2,15 +2,17 @@
 네이버 뉴스 날짜별 수집 모듈
 
 날짜 범위별로 뉴스를 수집하는 기능을 제공합니다.
+crawling.parallel_days가 2 이상이면 여러 날짜를 동시에 수집하되, 모든 요청은 공용 속도 제한기를
+함께 사용하므로 전체 요청 속도는 설정값을 넘지 않습니다. 검색 페이지와 기사 요청 모두 동시 수집에서도
+순차 수집과 같은 delay_between_requests 간격을 호스트별로 지킵니다.
 """
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import time
-import random
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
 # tqdm 프로그레스 바 지원
 try:
@@ -20,8 +22,17 @@ except ImportError:
     TQDM_AVAILABLE = False
 
 from ..models.search_options import NaverNewsSearchOption
-from ..models.news import NewsArticle
+from ..models.news import NewsArticle, NewsURL, canonical_article_key
+from ..utils import metrics
 from ..utils.config import get_config
+from ..utils.near_duplicate import NearDuplicateIndex
+from ..utils.adaptive_pacer import apply_global_rate, save_pacer_state
+from ..utils.rate_limiter import request_interval
+from ..utils.session_pool import save_session_pool_state
+from ..utils.http_archive import close_http_archive
+from ..utils.response_cache import log_cache_stats
+from ..utils.seen_store import get_seen_store
+from ..utils.selector_stats import save_selector_stats
 from .extractors import NaverNewsURLExtractor
 from .content_extractor import NaverNewsContentExtractor
 
@@ -53,11 +64,17 @@ class NaverNewsDailyCollector:
         content_limit: int = 0,
         extraction_mode: str = 'sequential',
         daily_limit: int = 0,
-        save_intermediate: bool = True
+        save_intermediate: bool = True,
+        seen_keys: Optional[Set[str]] = None,
+        parallel_days: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         날짜 범위에 대해 일별로 뉴스를 수집
         
+        parallel_days가 2 이상이면 날짜별 URL 수집과 본문 추출을 그 수만큼 동시에 진행합니다.
+        날짜 간 중복은 URL 수집이 끝난 뒤 날짜 순서대로 걸러내므로 순차 수집과 마찬가지로
+        앞 날짜의 기사가 남고, 결과와 중간 파일도 날짜 순서대로 정해집니다.
+        
         Args:
             query: 검색어
             start_date: 시작 날짜
@@ -69,10 +86,22 @@ class NaverNewsDailyCollector:
             extraction_mode: 추출 방식
             daily_limit: 일별 추출 개수 제한
             save_intermediate: 중간 결과 저장 여부
+            seen_keys: 이미 수집한 기사 키 집합 (이전 실행 결과로 미리 채워 전달 가능)
+            parallel_days: 동시에 수집할 날짜 수 (None이면 crawling.parallel_days)
             
         Returns:
             수집 결과 통계
         """
+        if parallel_days is None:
+            parallel_days = self.config.crawling.parallel_days
+        # 날짜 간 중복 기사를 건너뛰기 위한 공유 키 집합
+        if seen_keys is None:
+            seen_keys = set()
+        # 날짜 간 유사 제목 기사를 건너뛰기 위한 공유 색인
+        title_index = None
+        if self.config.crawling.skip_similar_titles:
+            title_index = self.url_extractor.create_title_index()
+        
         # 날짜 리스트 생성
         date_list = self._generate_date_list(start_date, end_date)
         total_days = len(date_list)
@@ -102,37 +131,59 @@ class NaverNewsDailyCollector:
         
         # 프로그레스 바 설정
         progress_bar = tqdm(date_list, desc="날짜별 수집") if TQDM_AVAILABLE else None        
-        # 날짜별로 수집
-        for date in (progress_bar if progress_bar else date_list):
-            try:
-                if progress_bar:
-                    progress_bar.set_description(f"날짜별 수집 - {date.strftime('%Y-%m-%d')}")
-                
-                daily_result = self.collect_single_day(
-                    query=query,
-                    date=date,
-                    sort=sort,
-                    news_type=news_type,
-                    extract_content=extract_content,
-                    daily_limit=daily_limit,
-                    save_intermediate=save_intermediate
-                )
-                
+        
+        # 날짜 사이 별도 대기 없이 공용 속도 제한기의 호스트별 간격과 전체 요청 수 제한만 적용
+        apply_global_rate(self.config.crawling.max_requests_per_second)
+        
+        if parallel_days > 1 and total_days > 1:
+            logger.info(f"  동시 수집 날짜 수: {min(parallel_days, total_days)}")
+            daily_results = self._collect_days_parallel(
+                query=query,
+                date_list=date_list,
+                sort=sort,
+                news_type=news_type,
+                extract_content=extract_content,
+                daily_limit=daily_limit,
+                save_intermediate=save_intermediate,
+                seen_keys=seen_keys,
+                title_index=title_index,
+                workers=parallel_days,
+                progress_bar=progress_bar
+            )
+            for daily_result in daily_results:
                 stats['daily_results'].append(daily_result)
                 stats['total_urls'] += daily_result.get('urls_collected', 0)
                 stats['total_contents'] += daily_result.get('contents_extracted', 0)
-                
-                # 지연 시간 적용
-                delay = self.config.crawling.delay_between_requests + random.uniform(0, 0.5)
-                time.sleep(delay)
-                
-            except Exception as e:
-                logger.error(f"날짜 {date.strftime('%Y-%m-%d')} 수집 실패: {e}")
-                stats['daily_results'].append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'status': 'failed',
-                    'error': str(e)
-                })
+        else:
+            # 날짜별로 수집
+            for date in (progress_bar if progress_bar else date_list):
+                try:
+                    if progress_bar:
+                        progress_bar.set_description(f"날짜별 수집 - {date.strftime('%Y-%m-%d')}")
+                    
+                    daily_result = self.collect_single_day(
+                        query=query,
+                        date=date,
+                        sort=sort,
+                        news_type=news_type,
+                        extract_content=extract_content,
+                        daily_limit=daily_limit,
+                        save_intermediate=save_intermediate,
+                        seen_keys=seen_keys,
+                        title_index=title_index
+                    )
+                    
+                    stats['daily_results'].append(daily_result)
+                    stats['total_urls'] += daily_result.get('urls_collected', 0)
+                    stats['total_contents'] += daily_result.get('contents_extracted', 0)
+                    
+                except Exception as e:
+                    logger.error(f"날짜 {date.strftime('%Y-%m-%d')} 수집 실패: {e}")
+                    stats['daily_results'].append({
+                        'date': date.strftime('%Y-%m-%d'),
+                        'status': 'failed',
+                        'error': str(e)
+                    })
         
         if progress_bar:
             progress_bar.close()
@@ -149,6 +200,17 @@ class NaverNewsDailyCollector:
         logger.info(f"  총 본문: {stats['total_contents']}개")
         logger.info(f"  소요 시간: {stats['elapsed_time']:.1f}초")
         
+        # 수집 기록 저장소와 선택자 통계 반영
+        seen_store = get_seen_store()
+        if seen_store:
+            seen_store.flush()
+        save_selector_stats()
+        save_pacer_state()
+        save_session_pool_state()
+        close_http_archive()
+        log_cache_stats()
+        metrics.export_metrics()
+        
         # 통계 저장
         self._save_statistics(stats)
         
@@ -165,7 +227,9 @@ class NaverNewsDailyCollector:
         news_type: str = 'all',
         extract_content: bool = True,
         daily_limit: int = 0,
-        save_intermediate: bool = True
+        save_intermediate: bool = True,
+        seen_keys: Optional[Set[str]] = None,
+        title_index: Optional[NearDuplicateIndex] = None
     ) -> Dict[str, Any]:
         """
         특정 날짜의 뉴스를 수집
@@ -178,10 +242,27 @@ class NaverNewsDailyCollector:
             extract_content: 본문 추출 여부
             daily_limit: 일별 추출 개수 제한
             save_intermediate: 중간 결과 저장 여부
+            seen_keys: 이미 수집한 기사 키 집합 (해당 기사는 건너뜀)
+            title_index: 유사 제목 색인 (유사 제목 기사는 건너뜀)
             
         Returns:
             수집 결과
         """
+        urls = self._collect_day_urls(query, date, sort, news_type, daily_limit,
+                                      seen_keys=seen_keys, title_index=title_index)
+        return self._finish_day(query, date, urls, extract_content, save_intermediate)
+    
+    def _collect_day_urls(
+        self,
+        query: str,
+        date: datetime,
+        sort: str,
+        news_type: str,
+        daily_limit: int,
+        seen_keys: Optional[Set[str]] = None,
+        title_index: Optional[NearDuplicateIndex] = None
+    ) -> List[NewsURL]:
+        """특정 날짜의 검색 결과에서 기사 URL 수집"""
         date_str = date.strftime('%Y%m%d')
         logger.info(f"날짜 {date.strftime('%Y-%m-%d')} 수집 시작")
         logger.info(f"[{date.strftime('%Y-%m-%d')}] 수집 중...")
@@ -209,20 +290,38 @@ class NaverNewsDailyCollector:
         }
         search_option.set_news_type(type_map.get(news_type, NaverNewsSearchOption.TYPE_ALL))
         
-        # URL 수집 - daily_limit을 URL 수집에도 적용
-        url_file = None
-        if save_intermediate:
-            url_file = os.path.join(self.temp_dir, f"urls_{query}_{date_str}.json")
-        
         # daily_limit이 있으면 URL 수집도 해당 개수로 제한
         max_urls_to_collect = daily_limit if daily_limit > 0 else 0
         
-        urls = self.url_extractor.collect_from_search(
+        return self.url_extractor.collect_from_search(
             search_url=search_option.build_url(),
             max_pages=0,  # 무제한
             max_urls=max_urls_to_collect,
-            delay_sec=self.config.crawling.delay_between_requests
+            delay_sec=self.config.crawling.delay_between_requests,
+            seen_keys=seen_keys,
+            title_index=title_index
         )
+    
+    def _finish_day(
+        self,
+        query: str,
+        date: datetime,
+        urls: List[NewsURL],
+        extract_content: bool,
+        save_intermediate: bool
+    ) -> Dict[str, Any]:
+        """
+        수집한 URL의 중간 결과 저장과 본문 추출
+        
+        기사 요청 사이 간격(crawling.delay_between_requests)은 공용 속도 제한기에서 호스트별로 적용되므로,
+        여러 날짜를 동시에 추출해도 같은 기사 호스트로 가는 요청은 이 간격을 함께 지킵니다.
+        """
+        date_str = date.strftime('%Y%m%d')
+        
+        # URL 중간 결과 파일
+        url_file = None
+        if save_intermediate:
+            url_file = os.path.join(self.temp_dir, f"urls_{query}_{date_str}.json")
         
         result = {
             'date': date.strftime('%Y-%m-%d'),
@@ -234,7 +333,8 @@ class NaverNewsDailyCollector:
         # URL 중간 결과 저장
         if save_intermediate and urls:
             with open(url_file, 'w', encoding='utf-8') as f:
-                url_data = [{'url': url.url, 'type': url.type, 'title': getattr(url, 'title', None)} for url in urls]
+                url_data = [{'url': url.url, 'type': url.type, 'title': getattr(url, 'title', None),
+                             'article_id': url.article_id} for url in urls]
                 json.dump(url_data, f, ensure_ascii=False, indent=2)
         
         # 본문 추출
@@ -245,13 +345,20 @@ class NaverNewsDailyCollector:
             
             # URL이 이미 daily_limit으로 제한되어 있으므로 모든 URL에서 본문 추출
             contents = []
+            seen_store = get_seen_store()
+            use_content_hash = self.config.advanced.duplicate_management.get('enable_content_hash', False)
             
-            for i, url in enumerate(urls):
-                if i > 0:
-                    time.sleep(self.config.crawling.delay_between_requests)
-                    
-                article = self.content_extractor.extract_news_content(url.url)
+            # 기사 요청 간격은 요청마다 공용 속도 제한기에 넘김
+            interval = request_interval(self.config.crawling.delay_between_requests)
+            
+            for url in urls:
+                article = self.content_extractor.extract_news_content(url.url, interval=interval)
                 if article:
+                    # 다음 실행에서 다시 가져오지 않도록 추출한 기사 기록
+                    if seen_store and article.is_valid():
+                        if not seen_store.record_article(article, use_content_hash):
+                            logger.info(f"동일 본문 기사 스킵: {url.url}")
+                            continue
                     contents.append(article)
             
             # 중간 결과 저장
@@ -273,6 +380,116 @@ class NaverNewsDailyCollector:
         
         return result
     
+    def _collect_days_parallel(
+        self,
+        query: str,
+        date_list: List[datetime],
+        sort: str,
+        news_type: str,
+        extract_content: bool,
+        daily_limit: int,
+        save_intermediate: bool,
+        seen_keys: Set[str],
+        title_index: Optional[NearDuplicateIndex],
+        workers: int,
+        progress_bar=None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 날짜를 동시에 수집 (결과는 날짜 순서)
+        
+        1. 날짜별 URL 수집을 동시에 진행 (각 날짜는 이전 실행 키만 보고 중복 판단)
+        2. 날짜 순서대로 날짜 간 중복과 유사 제목 제거 (앞 날짜 우선). 제거한 만큼 daily_limit에
+           못 미친 날짜는 앞 날짜까지의 키를 넘겨 검색 결과를 이어서 수집 (이 단계는 순차 진행)
+        3. 날짜별 본문 추출과 중간 파일 저장을 동시에 진행 (진행 표시는 날짜가 끝날 때마다 갱신)
+        
+        모든 요청은 공용 속도 제한기에서 순서를 받으므로 전체 초당 요청 수는 max_requests_per_second를
+        넘지 않습니다. 검색 페이지와 기사 요청은 순차 수집과 같은 delay_between_requests 간격을 넘기므로
+        같은 호스트로 가는 요청은 날짜들이 그 간격을 나눠 쓰고, 동시 수집은 응답 대기와 파싱 시간을 겹쳐 줄입니다.
+        """
+        workers = min(workers, len(date_list))
+        day_urls: List[Optional[List[NewsURL]]] = []
+        failures: Dict[int, str] = {}
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='daily') as executor:
+            futures = [
+                executor.submit(self._collect_day_urls, query, date, sort, news_type, daily_limit,
+                                seen_keys=set(seen_keys))
+                for date in date_list
+            ]
+            for index, (date, future) in enumerate(zip(date_list, futures)):
+                try:
+                    day_urls.append(future.result())
+                except Exception as e:
+                    logger.error(f"날짜 {date.strftime('%Y-%m-%d')} 수집 실패: {e}")
+                    failures[index] = str(e)
+                    day_urls.append(None)
+        
+        # 날짜 간 중복 제거는 날짜 순서대로 처리해 실행마다 같은 결과가 나오도록 함
+        for index, (date, urls) in enumerate(zip(date_list, day_urls)):
+            if urls is None:
+                continue
+            kept = self._drop_cross_day_duplicates(urls, seen_keys, title_index)
+            # 앞 날짜와 겹친 만큼 daily_limit에 못 미치면 이어지는 검색 결과로 채움 (순차 수집과 같은 결과)
+            if 0 < daily_limit <= len(urls) and len(kept) < daily_limit:
+                logger.info(f"날짜 {date.strftime('%Y-%m-%d')}: 앞 날짜와 겹친 {daily_limit - len(kept)}개를 다시 수집")
+                try:
+                    kept += self._collect_day_urls(query, date, sort, news_type, daily_limit - len(kept),
+                                                   seen_keys=seen_keys, title_index=title_index)
+                except Exception as e:
+                    logger.warning(f"날짜 {date.strftime('%Y-%m-%d')} 추가 수집 실패: {e}")
+            day_urls[index] = kept
+        
+        results: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='daily') as executor:
+            futures = [
+                executor.submit(self._finish_day, query, date, urls, extract_content, save_intermediate)
+                if urls is not None else None
+                for date, urls in zip(date_list, day_urls)
+            ]
+            # 진행 표시는 날짜 순서와 관계없이 끝난 날짜부터 갱신
+            if progress_bar:
+                progress_bar.update(sum(1 for future in futures if future is None))
+                finished_dates = {future: date for date, future in zip(date_list, futures) if future is not None}
+                for future in as_completed(finished_dates):
+                    progress_bar.set_description(f"날짜별 수집 - {finished_dates[future].strftime('%Y-%m-%d')}")
+                    progress_bar.update(1)
+            for index, (date, future) in enumerate(zip(date_list, futures)):
+                error = failures.get(index)
+                if future is not None:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        logger.error(f"날짜 {date.strftime('%Y-%m-%d')} 수집 실패: {e}")
+                        error = str(e)
+                if error is not None:
+                    results.append({
+                        'date': date.strftime('%Y-%m-%d'),
+                        'status': 'failed',
+                        'error': error
+                    })
+        
+        return results
+    
+    def _drop_cross_day_duplicates(
+        self,
+        urls: List[NewsURL],
+        seen_keys: Set[str],
+        title_index: Optional[NearDuplicateIndex]
+    ) -> List[NewsURL]:
+        """앞 날짜에서 이미 나온 기사와 유사 제목 기사 제거 (seen_keys, title_index 갱신)"""
+        kept = []
+        for url in urls:
+            key = self.url_extractor.dedup_key(url)
+            if key in seen_keys:
+                logger.debug(f"날짜 간 중복 URL 스킵: {url.url[:50]}...")
+                continue
+            seen_keys.add(key)
+            if title_index is not None and url.title and not title_index.add(url.title, key):
+                logger.debug(f"유사 제목 기사 스킵: {url.title[:30]}...")
+                continue
+            kept.append(url)
+        return kept
+    
     def _generate_date_list(self, start_date: datetime, end_date: datetime) -> List[datetime]:
         """날짜 리스트 생성"""
         date_list = []
@@ -319,6 +536,8 @@ class NaverNewsDailyCollector:
         # 모든 일별 컨텐츠 파일 수집
         all_contents = []
         content_files = []
+        seen_keys = set()
+        duplicate_count = 0
         
         for daily_result in stats['daily_results']:
             if daily_result.get('status') == 'success' and daily_result.get('content_file'):
@@ -330,8 +549,14 @@ class NaverNewsDailyCollector:
                         with open(content_file, 'r', encoding='utf-8') as f:
                             daily_contents = json.load(f)
                             
-                        # 각 컨텐츠에 날짜 정보 추가
+                        # 각 컨텐츠에 날짜 정보 추가 (날짜 간 중복 기사 제외)
                         for content in daily_contents:
+                            key = self._content_key(content)
+                            if key:
+                                if key in seen_keys:
+                                    duplicate_count += 1
+                                    continue
+                                seen_keys.add(key)
                             content['collection_date'] = date
                             all_contents.append(content)
                         
@@ -346,6 +571,8 @@ class NaverNewsDailyCollector:
             return
         
         logger.info(f"총 {len(all_contents)}개 컨텐츠 수집됨")
+        if duplicate_count:
+            logger.info(f"중복 컨텐츠 {duplicate_count}개 제외")
         
         # 병합 방식에 따른 컨텐츠 선택
         selected_contents = self._select_contents_by_mode(all_contents, content_limit, extraction_mode)
@@ -369,6 +596,15 @@ class NaverNewsDailyCollector:
         if hasattr(self.config, 'cleanup_temp_files') and self.config.cleanup_temp_files:
             self._cleanup_temp_files(content_files)
     
+    @staticmethod
+    def _content_key(content: Dict[str, Any]) -> Optional[str]:
+        """병합 시 중복 판별에 사용하는 기사 키 (판별 불가 시 None)"""
+        if content.get('article_id'):
+            return content['article_id']
+        if content.get('url'):
+            return canonical_article_key(content['url'])
+        return content.get('title') or None
+    
     def _select_contents_by_mode(self, all_contents: List[Dict], content_limit: int, extraction_mode: str) -> List[Dict]:
         """
         병합 방식에 따라 컨텐츠 선택
@@ -0,0 +1,122 @@
+"""
+추출 계획 모듈
+
+ExtractionConfig의 선택자와 정규식을 한 번만 컴파일해 두고,
+기사마다 설정을 다시 읽거나 선택자를 다시 해석하지 않도록 합니다.
+설정이 실제로 바뀐 경우(ExtractionConfig.version 변경)에만 다시 생성합니다.
+"""
+
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+import soupsieve
+
+from .lxml_engine import LxmlExtractionEngine, REPORTER_PATTERN
+from ..utils.config import ExtractionConfig, get_config
+from ..utils.selector_stats import get_selector_stats
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionPlan:
+    """컴파일된 선택자, 제거 대상, 정규식을 담은 추출 계획"""
+
+    def __init__(self, extraction: ExtractionConfig):
+        """
+        Args:
+            extraction: 추출 설정
+
+        Raises:
+            soupsieve.SelectorSyntaxError: 잘못된 CSS 선택자가 있는 경우
+        """
+        self.version = extraction.version
+        self.engine = extraction.engine
+        self.min_content_length = extraction.min_content_length
+        self.max_content_length = extraction.max_content_length
+        self.reporter_pattern = REPORTER_PATTERN
+        # 적응형 선택자 순서 사용 시 언론사별 적중 통계
+        self.selector_stats = get_selector_stats() if extraction.adaptive_selectors else None
+
+        selectors = extraction.content_selectors
+        self.title = self._compile_list(selectors.get('title', []))
+        self.press = self._compile_list(selectors.get('press', []))
+        self.content = self._compile_list(selectors.get('content', []))
+        self.reporter = self._compile_list(selectors.get('reporter', []))
+
+        # 날짜 선택자는 특별한 형식이므로 변환
+        self.date: List[Tuple[str, soupsieve.SoupSieve, Optional[str]]] = []
+        for item in selectors.get('date', []):
+            if isinstance(item, dict):
+                selector, attr = item.get('selector'), item.get('attribute')
+            else:
+                selector, attr = item, None
+            self.date.append((selector, soupsieve.compile(selector), attr))
+
+        # 제거할 요소는 하나의 선택자로 합쳐 한 번의 탐색으로 처리
+        remove_elements = [s for s in extraction.remove_elements if s]
+        self.remove = soupsieve.compile(', '.join(remove_elements)) if remove_elements else None
+
+        # lxml 엔진은 처음 사용할 때 생성
+        self._extraction = extraction
+        self._lxml_engine = None
+        self._lxml_engine_ready = False
+
+    @staticmethod
+    def _compile_list(selectors: List[str]) -> List[Tuple[str, soupsieve.SoupSieve]]:
+        return [(selector, soupsieve.compile(selector)) for selector in selectors]
+
+    @property
+    def lxml_engine(self) -> Optional[LxmlExtractionEngine]:
+        """
+        같은 설정으로 만든 lxml 추출 엔진
+
+        XPath로 변환할 수 없는 선택자가 있으면 None을 반환합니다.
+        """
+        if not self._lxml_engine_ready:
+            extraction = self._extraction
+            try:
+                self._lxml_engine = LxmlExtractionEngine(
+                    extraction.content_selectors,
+                    extraction.remove_elements,
+                    self.min_content_length,
+                    self.max_content_length
+                )
+            except (ValueError, SyntaxError) as e:
+                logger.warning(f"lxml 엔진 초기화 실패, BeautifulSoup 엔진 사용: {e}")
+                self._lxml_engine = None
+            self._lxml_engine_ready = True
+        return self._lxml_engine
+
+    def remove_unwanted(self, element):
+        """불필요한 요소 제거"""
+        if self.remove is None:
+            return
+        for tag in self.remove.select(element):
+            # 앞서 제거된 요소의 자손은 이미 정리되어 있음
+            if not tag.decomposed:
+                tag.decompose()
+
+
+# 글로벌 추출 계획 인스턴스
+_plan = None
+_lock = threading.Lock()
+
+
+def get_extraction_plan() -> ExtractionPlan:
+    """
+    현재 설정에 맞는 추출 계획 반환
+
+    설정 버전이 바뀐 경우에만 다시 생성합니다.
+    """
+    global _plan
+
+    extraction = get_config().extraction
+    plan = _plan
+    if plan is None or plan.version != extraction.version:
+        with _lock:
+            if _plan is None or _plan.version != extraction.version:
+                _plan = ExtractionPlan(extraction)
+                logger.debug(f"추출 계획 생성 (설정 버전 {extraction.version})")
+            plan = _plan
+    return plan
@@ -4,19 +4,31 @@ URL 추출 모듈
 네이버 뉴스 검색 결과에서 URL을 추출하는 기능을 제공합니다.
 """
 
+import asyncio
 import logging
-import random
 import re
 import time
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from difflib import SequenceMatcher
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
 
+from .lxml_engine import parse_document
+from .parse_pool import get_parse_pool
+from ..utils.async_bridge import run_sync
 from ..utils.config import get_config
+from ..utils import metrics
+from ..utils.http_archive import get_http_archive, get_replay_server
+from ..utils.near_duplicate import NearDuplicateIndex
+from ..utils.adaptive_pacer import get_adaptive_pacer
+from ..utils.rate_limiter import get_rate_limiter, request_interval
+from ..utils.response_cache import get_response_cache
+from ..utils.seen_store import get_seen_store
+from ..utils.proxy_pool import proxy_of
 from ..utils.session_pool import get_session_pool
-from ..models.news import NewsURL
+from ..models.news import NewsURL, canonical_article_key
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +44,10 @@ class URLExtractor:
         if hasattr(self.config, 'advanced') and self.config.advanced.session_management:
             self._use_session_pool = self.config.advanced.session_management.get('enable_cookie_persistence', True)
         
+        # 재생 모드에서는 네이버 접속(세션 예열)이 필요 없음
+        if self.config.network.http_mode == 'replay':
+            self._use_session_pool = False
+        
         if self._use_session_pool:
             try:
                 self._session_pool = get_session_pool()
@@ -40,9 +56,26 @@ class URLExtractor:
                 logger.warning(f"세션 풀 초기화 실패, 단일 세션 모드로 전환: {e}")
                 self._use_session_pool = False
     
+    @classmethod
+    def parser_only(cls):
+        """네트워크 세션 없이 HTML 파싱에만 사용하는 인스턴스 생성"""
+        instance = cls.__new__(cls)
+        instance.config = get_config()
+        instance._session = None
+        instance._use_session_pool = False
+        return instance
+    
     @property
     def session(self) -> requests.Session:
         """요청 세션 반환"""
+        # 재생 모드에서는 로컬 서버만 사용하므로 세션 풀, 프록시, 예열 방문 생략
+        if self.config.network.http_mode == 'replay':
+            if self._session is None:
+                self._session = requests.Session()
+                self._session.trust_env = False
+                self._session.headers.update(self.config.get_headers())
+            return self._session
+        
         if self._use_session_pool:
             return self._session_pool.get_session()
         
@@ -65,80 +98,286 @@ class URLExtractor:
                 self._session.proxies = proxies
                 logger.info(f"프록시 설정됨: {proxies}")
             
-            # 네이버 메인 페이지 먼저 방문하여 쿠키 획득
+            # 네이버 메인 페이지 먼저 방문하여 쿠키 획득 (요청 간격은 공용 속도 제한기가 조절)
             try:
                 logger.info("네이버 메인 페이지 방문 중...")
+                get_rate_limiter().acquire('https://www.naver.com')
                 main_response = self._session.get('https://www.naver.com', timeout=10)
                 main_response.raise_for_status()
                 
                 # 검색 페이지도 방문
+                get_rate_limiter().acquire('https://search.naver.com')
                 search_response = self._session.get('https://search.naver.com', timeout=10)
                 search_response.raise_for_status()
                 
                 logger.info("세션 초기화 완료")
-                time.sleep(1)  # 잠시 대기
             except Exception as e:
                 logger.warning(f"세션 초기화 중 경고: {e}")
                 
         return self._session
     
-    def get_page_content(self, url: str) -> Optional[str]:
-        """URL에서 HTML 가져오기"""
+    @metrics.timed('fetch_seconds')
+    def get_page_content(self, url: str,
+                         interval: Optional[Tuple[float, float]] = None) -> Optional[str]:
+        """
+        URL에서 HTML 가져오기
+        
+        Args:
+            url: 요청 URL
+            interval: 같은 호스트 다음 요청까지의 (최소, 최대) 간격 (None이면 공용 속도 제한기 설정)
+        """
+        # 비동기 백엔드 사용 시 코루틴을 백그라운드 루프에서 실행 (동기 어댑터)
+        if self.config.network.fetch_backend == 'async':
+            return run_sync(self.fetch(url, interval))
+        
+        # 응답 캐시에 있으면 네트워크 요청 없이 반환
+        cache = self._response_cache()
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None:
+                metrics.get_metrics().counter('http_cache_hits_total', '응답 캐시 적중 수').inc()
+                return cached
+        
+        switched_session = False
         for attempt in range(self.config.network.retries):
             try:
-                if attempt > 0:
-                    sleep_time = self.config.network.backoff_factor ** attempt
-                    time.sleep(sleep_time)
+                # 403 이후 다른 세션으로 바로 재시도하는 경우에는 백오프 없이 진행
+                if attempt > 0 and not switched_session:
+                    metrics.sleep(self._retry_delay(attempt), 'retry_backoff')
+                switched_session = False
                 
                 # 세션 풀 사용 시 매 요청마다 새로운 세션 가져오기
                 current_session = self.session
                 
-                response = current_session.get(
-                    url, 
-                    timeout=self.config.network.timeout
-                )
-                response.raise_for_status()
-                return response.text
+                # 모든 요청은 공용 속도 제한기에서 순서를 받은 뒤 전송 (프록시별로 간격 적용)
+                get_rate_limiter().acquire(url, identity=proxy_of(current_session), interval=interval)
+                
+                html = self._request(current_session, url)
+                if cache is not None:
+                    cache.put(url, html)
+                return html
                 
             except requests.HTTPError as e:
                 if e.response.status_code == 403:
-                    logger.error(f"403 Forbidden 오류 - 네이버가 요청을 차단했습니다.")
-                    logger.error(f"URL: {url}")
+                    wait_time = self._handle_forbidden(url, attempt, current_session)
+                    if wait_time is None:
+                        # 최종 시도에서도 실패하면 None 반환
+                        return None
                     
-                    # 세션 풀 사용 시 에러 마킹
-                    if self._use_session_pool:
-                        self._session_pool.mark_error(current_session, 403)
+                    if wait_time == 0:
+                        logger.info("차단된 세션은 냉각시키고 다른 세션으로 바로 재시도...")
+                        switched_session = True
+                        continue
                     
-                    # 403 오류 시 특별 처리
-                    if attempt < self.config.network.retries - 1:
-                        # 점진적으로 증가하는 대기 시간
-                        if hasattr(self.config, 'advanced') and self.config.advanced.anti_403.get('enable_progressive_backoff'):
-                            max_backoff = self.config.advanced.anti_403.get('max_backoff_seconds', 120)
-                            wait_time = min(30 + (attempt * 20), max_backoff)
-                        else:
-                            wait_time = min(30 + (attempt * 20), 120)  # 최대 2분
-                            
-                        logger.info(f"{wait_time}초 대기 후 재시도...")
-                        time.sleep(wait_time)
-                        
-                        # 세션 재생성 시도
-                        if attempt >= 1 and not self._use_session_pool:
-                            logger.info("세션을 재생성합니다...")
-                            self._session = None  # 기존 세션 제거
+                    logger.info(f"{wait_time}초 대기 후 재시도...")
+                    metrics.sleep(wait_time, 'forbidden_backoff')
+                    
+                    # 세션 재생성 시도
+                    if self._should_recreate_session(attempt):
+                        logger.info("세션을 재생성합니다...")
+                        self._session = None  # 기존 세션 제거
+                        try:
                             _ = self.session  # 새 세션 생성
-                            time.sleep(5)  # 추가 대기
-                    else:
-                        # 최종 시도에서도 실패하면 None 반환
+                        except requests.RequestException as e:
+                            # 세션을 만들지 못하면 다음 시도에서 다시 가져옴
+                            logger.warning(f"세션 재생성 실패: {e}")
+                        metrics.sleep(5, 'session_recreate')  # 추가 대기
+                else:
+                    self._log_http_error(e, attempt)
+                    
+            except requests.RequestException as e:
+                logger.warning(f"요청 오류 {e} (시도 {attempt + 1}/{self.config.network.retries})")
+                
+        logger.error(f"재시도 실패: {url}")
+        metrics.get_metrics().counter('fetch_failures_total', '재시도 후에도 실패한 요청 수').inc()
+        return None
+    
+    async def fetch(self, url: str,
+                    interval: Optional[Tuple[float, float]] = None) -> Optional[str]:
+        """
+        URL에서 HTML 가져오기 (비동기)
+        
+        get_page_content와 동일한 재시도, 백오프, 403 처리 규칙을 따르며
+        대기는 모두 asyncio.sleep으로 처리되어 스레드를 점유하지 않습니다.
+        실제 HTTP 요청은 이벤트 루프의 기본 실행기에서 수행됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        
+        # 응답 캐시에 있으면 네트워크 요청 없이 반환
+        cache = self._response_cache()
+        if cache is not None:
+            cached = await loop.run_in_executor(None, cache.get, url)
+            if cached is not None:
+                metrics.get_metrics().counter('http_cache_hits_total', '응답 캐시 적중 수').inc()
+                return cached
+        
+        switched_session = False
+        for attempt in range(self.config.network.retries):
+            try:
+                if attempt > 0 and not switched_session:
+                    await metrics.async_sleep(self._retry_delay(attempt), 'retry_backoff')
+                switched_session = False
+                
+                current_session = await loop.run_in_executor(None, lambda: self.session)
+                
+                await get_rate_limiter().acquire_async(url, identity=proxy_of(current_session),
+                                                       interval=interval)
+                
+                html = await loop.run_in_executor(None, self._request, current_session, url)
+                if cache is not None:
+                    await loop.run_in_executor(None, cache.put, url, html)
+                return html
+                
+            except requests.HTTPError as e:
+                if e.response.status_code == 403:
+                    wait_time = self._handle_forbidden(url, attempt, current_session)
+                    if wait_time is None:
                         return None
+                    
+                    if wait_time == 0:
+                        logger.info("차단된 세션은 냉각시키고 다른 세션으로 바로 재시도...")
+                        switched_session = True
+                        continue
+                    
+                    logger.info(f"{wait_time}초 대기 후 재시도...")
+                    await metrics.async_sleep(wait_time, 'forbidden_backoff')
+                    
+                    if self._should_recreate_session(attempt):
+                        logger.info("세션을 재생성합니다...")
+                        self._session = None
+                        try:
+                            await loop.run_in_executor(None, lambda: self.session)
+                        except requests.RequestException as e:
+                            logger.warning(f"세션 재생성 실패: {e}")
+                        await metrics.async_sleep(5, 'session_recreate')
                 else:
-                    logger.warning(f"HTTP 오류 {e.response.status_code}: {e} (시도 {attempt + 1}/{self.config.network.retries})")
+                    self._log_http_error(e, attempt)
                     
             except requests.RequestException as e:
                 logger.warning(f"요청 오류 {e} (시도 {attempt + 1}/{self.config.network.retries})")
                 
         logger.error(f"재시도 실패: {url}")
+        metrics.get_metrics().counter('fetch_failures_total', '재시도 후에도 실패한 요청 수').inc()
         return None
+    
+    async def fetch_many(self, urls: List[str], concurrency: int = 10) -> List[Optional[str]]:
+        """여러 URL을 동시에 가져오기 (입력 순서대로 결과 반환)"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def bounded_fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fetch(url)
+        
+        return await asyncio.gather(*(bounded_fetch(url) for url in urls))
+    
+    def _response_cache(self):
+        """응답 캐시 (기록 모드에서는 모든 응답이 아카이브에 남도록 캐시를 건너뜀)"""
+        if self.config.network.http_mode == 'record':
+            return None
+        return get_response_cache()
+    
+    def _request(self, session: requests.Session, url: str) -> str:
+        """단일 HTTP 요청 수행 (HTTP 오류 시 requests.HTTPError 발생)"""
+        http_mode = self.config.network.http_mode
+        
+        # 재생 모드: 기록된 응답을 제공하는 로컬 서버로 요청
+        request_url = get_replay_server().url_for(url) if http_mode == 'replay' else url
+        
+        registry = metrics.get_metrics()
+        # 적응형 속도 조절 사용 시 응답 상태와 지연 시간을 조절기에 전달
+        pacer = get_adaptive_pacer()
+        start = time.perf_counter()
+        try:
+            response = session.get(
+                request_url, 
+                timeout=self.config.network.timeout
+            )
+        except requests.RequestException:
+            registry.counter('http_requests_total', 'HTTP 요청 수', status='error').inc()
+            latency = time.perf_counter() - start
+            if pacer is not None:
+                pacer.record(None, latency)
+            if self._use_session_pool:
+                self._session_pool.record_result(session, None, latency)
+            raise
+        latency = time.perf_counter() - start
+        registry.histogram('http_request_seconds').observe(latency)
+        registry.counter('http_requests_total', 'HTTP 요청 수', status=response.status_code).inc()
+        if pacer is not None:
+            pacer.record(response.status_code, latency)
+        # 세션 풀 사용 시 세션별 성공률과 응답 시간을 선택 점수에 반영
+        if self._use_session_pool:
+            self._session_pool.record_result(session, response.status_code, latency)
+        
+        # 기록 모드: 오류 응답을 포함한 모든 응답 저장
+        if http_mode == 'record':
+            get_http_archive().record(url, response.status_code,
+                                      response.headers.get('Content-Type', ''), response.text)
+        
+        response.raise_for_status()
+        return response.text
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """재시도 전 대기 시간 (지수 백오프)"""
+        return self.config.network.backoff_factor ** attempt
+    
+    def _handle_forbidden(self, url: str, attempt: int,
+                          session: requests.Session) -> Optional[float]:
+        """
+        403 응답 처리
+        
+        세션 풀 사용 시 차단된 세션만 냉각시키고, 냉각 중이 아닌 세션이 남아 있으면
+        기다리지 않고(0초) 그 세션으로 재시도합니다. 모든 세션이 냉각 중일 때만
+        가장 먼저 풀리는 세션을 기다립니다(상한 max_backoff_seconds).
+        
+        Returns:
+            재시도 전 대기 시간(초), 더 이상 재시도하지 않으면 None
+        """
+        logger.error(f"403 Forbidden 오류 - 네이버가 요청을 차단했습니다.")
+        logger.error(f"URL: {url}")
+        
+        # 세션 풀 사용 시 에러 마킹
+        if self._use_session_pool:
+            self._session_pool.mark_error(session, 403)
+        
+        # 403 오류 시 특별 처리
+        if attempt >= self.config.network.retries - 1:
+            return None
+        
+        if self._use_session_pool:
+            cooldown = self._session_pool.cooldown_remaining()
+            if cooldown == 0:
+                metrics.get_metrics().counter('forbidden_session_switches_total',
+                                              '403 이후 다른 세션으로 바로 재시도한 횟수').inc()
+                return 0.0
+            return min(cooldown, self.config.advanced.anti_403.get('max_backoff_seconds', 120))
+        
+        # 적응형 속도 조절 사용 시 전체 속도는 이미 줄었으므로 짧은 대기부터 연속 차단마다 두 배
+        pacer = get_adaptive_pacer()
+        if pacer is not None:
+            return pacer.forbidden_wait()
+        
+        # 점진적으로 증가하는 대기 시간
+        if hasattr(self.config, 'advanced') and self.config.advanced.anti_403.get('enable_progressive_backoff'):
+            max_backoff = self.config.advanced.anti_403.get('max_backoff_seconds', 120)
+            return min(30 + (attempt * 20), max_backoff)
+        return min(30 + (attempt * 20), 120)  # 최대 2분
+    
+    def _should_recreate_session(self, attempt: int) -> bool:
+        """403 이후 단일 세션을 재생성해야 하는지 여부"""
+        return attempt >= 1 and not self._use_session_pool
+    
+    def _log_http_error(self, error: requests.HTTPError, attempt: int):
+        """403 이외의 HTTP 오류 로깅"""
+        logger.warning(
+            f"HTTP 오류 {error.response.status_code}: {error} "
+            f"(시도 {attempt + 1}/{self.config.network.retries})"
+        )
 
+    def create_title_index(self) -> NearDuplicateIndex:
+        """설정의 similarity_threshold를 사용하는 유사 제목 색인 생성"""
+        return NearDuplicateIndex(threshold=self.config.crawling.similarity_threshold)
+    
     def is_similar_title(self, title1: str, title2: str, 
                         threshold: Optional[float] = None) -> bool:
         """두 제목의 유사도 검사"""
@@ -161,13 +400,66 @@ class NaverNewsURLExtractor(URLExtractor):
     
     NAVER_PATTERN = re.compile(r"https?://n\.news\.naver\.com/.+/article/")
     
-    def extract_news_urls(self, html: str) -> List[NewsURL]:
-        """검색 결과 HTML에서 기사 URL 목록 추출"""
+    # 제목을 찾기 위해 링크에서 거슬러 올라가는 최대 단계 수
+    TITLE_SEARCH_DEPTH = 5
+    
+    @staticmethod
+    def _make_soup(html: str) -> BeautifulSoup:
         try:
-            soup = BeautifulSoup(html, "lxml")
+            return BeautifulSoup(html, "lxml")
         except:
             # lxml 파서가 없을 경우 기본 파서 사용
-            soup = BeautifulSoup(html, "html.parser")
+            return BeautifulSoup(html, "html.parser")
+    
+    def _search_result_region(self, html: str) -> Optional[str]:
+        """
+        검색 결과 카드가 모인 영역의 HTML 반환 (부분 파싱용)
+        
+        lxml 트리에서 모든 네이버 뉴스 링크를 포함하면서 각 링크의 제목 탐색 범위
+        (TITLE_SEARCH_DEPTH 단계 위 조상)까지 담는 가장 작은 하위 트리를 찾습니다.
+        해당 영역만 BeautifulSoup으로 파싱해도 전체 파싱과 같은 결과를 얻습니다.
+        
+        Returns:
+            영역 HTML, 링크가 없거나 영역을 줄일 수 없으면 None
+        """
+        try:
+            root = parse_document(html)
+        except (etree.ParserError, ValueError):
+            return None
+        
+        links = [a for a in root.iter('a') if self.NAVER_PATTERN.search(a.get('href', ''))]
+        if not links:
+            return None
+        
+        # 첫 링크의 조상 경로 (루트부터)
+        chain = list(links[0].iterancestors())[::-1]
+        depth_of = {node: depth for depth, node in enumerate(chain)}
+        common_depth = len(chain) - 1
+        min_link_depth = len(chain)
+        
+        for link in links[1:]:
+            ancestors = list(link.iterancestors())
+            min_link_depth = min(min_link_depth, len(ancestors))
+            for ancestor in ancestors:
+                depth = depth_of.get(ancestor)
+                if depth is not None:
+                    common_depth = min(common_depth, depth)
+                    break
+        
+        region_depth = min(common_depth, min_link_depth - self.TITLE_SEARCH_DEPTH)
+        if region_depth < 1:
+            return None
+        
+        return etree.tostring(chain[region_depth], encoding='unicode', method='html', with_tail=False)
+    
+    @metrics.timed('search_parse_seconds')
+    def extract_news_urls(self, html: str) -> List[NewsURL]:
+        """검색 결과 HTML에서 기사 URL 목록 추출"""
+        # 부분 파싱: 검색 결과 영역만 트리로 구성
+        region = None
+        if self.config.crawling.partial_search_parse:
+            region = self._search_result_region(html)
+        soup = self._make_soup(region if region is not None else html)
             
         results: List[NewsURL] = []
         seen_urls = set()
@@ -177,41 +469,28 @@ class NaverNewsURLExtractor(URLExtractor):
         naver_links = soup.find_all("a", href=self.NAVER_PATTERN)
         logger.debug(f"네이버 뉴스 링크 {len(naver_links)}개 발견")
         
+        # 요소별 첫 번째 제목 후보 텍스트를 한 번의 순회로 계산
+        first_texts = self._index_first_texts(soup) if naver_links else {}
+        
         for link in naver_links:
             href = link.get("href", "")
-            if href in seen_urls:
+            # 같은 기사의 다른 URL 형태는 하나로 취급
+            key = canonical_article_key(href)
+            if key in seen_urls:
                 continue
                 
             # 제목 찾기 - 부모 요소들을 탐색
-            title = None
-            current = link
-            
-            # 5단계 위까지 탐색하여 제목 찾기
-            for _ in range(5):
-                parent = current.parent
-                if parent and parent.name in ['div', 'li', 'article']:
-                    # 해당 컨테이너 내의 모든 텍스트 추출
-                    texts = []
-                    for elem in parent.find_all(string=True, recursive=True):
-                        text = elem.strip()
-                        if text and len(text) > 20 and not text.startswith('http') and '네이버뉴스' not in text:
-                            texts.append(text)
-                    
-                    # 첫 번째 긴 텍스트를 제목으로 사용
-                    if texts:
-                        title = texts[0]
-                        break
-                current = parent
+            title = self._find_card_title(link, first_texts)
             
             # URL과 제목을 수집
             if title and title not in seen_titles:
                 results.append(NewsURL(url=href, type="naver", title=title))
-                seen_urls.add(href)
+                seen_urls.add(key)
                 seen_titles.add(title)
                 logger.debug(f"URL 추가 (제목 있음): {title[:30]}...")
             elif not title:  # 제목을 찾지 못한 경우도 URL은 저장
                 results.append(NewsURL(url=href, type="naver"))
-                seen_urls.add(href)
+                seen_urls.add(key)
                 logger.debug(f"URL 추가 (제목 없음): {href}")
         
         logger.info(f"extract_news_urls: {len(results)}개 URL 추출")
@@ -219,6 +498,9 @@ class NaverNewsURLExtractor(URLExtractor):
         # 기존 구조도 함께 처리 (호환성) - 결과가 없을 때만
         if not results:
             logger.debug("새 구조에서 URL을 찾지 못함, 기존 구조 시도")
+            if region is not None:
+                # 기존 구조 선택자는 전체 문서가 필요
+                soup = self._make_soup(html)
             # 원본 기사 URL 추출 (기존 방식)
             selectors = [
                 "div.news_area a.news_tit[href]",
@@ -230,24 +512,126 @@ class NaverNewsURLExtractor(URLExtractor):
                 for a in soup.select(selector):
                     href = a.get("href", "")
                     title = a.text.strip()
-                    if href not in seen_urls:
+                    key = canonical_article_key(href)
+                    if key not in seen_urls:
                         results.append(NewsURL(
                             url=href, 
                             type="original" if not self.NAVER_PATTERN.search(href) else "naver",
                             title=title if title else None
                         ))
-                        seen_urls.add(href)
+                        seen_urls.add(key)
         
         return results
     
+    @staticmethod
+    def _is_title_text(text: str) -> bool:
+        """제목 후보 텍스트인지 확인"""
+        return len(text) > 20 and not text.startswith('http') and '네이버뉴스' not in text
+    
+    @classmethod
+    def _index_first_texts(cls, soup) -> Dict[int, str]:
+        """
+        각 요소 안에서 문서 순서상 첫 번째 제목 후보 텍스트를 계산
+        
+        텍스트 노드를 한 번만 순회하며, 후보 텍스트마다 아직 값이 정해지지 않은
+        조상에만 값을 기록합니다. 이미 값이 있는 조상을 만나면 그 위의 조상도
+        모두 값이 있으므로 멈추어, 전체 작업량은 문서 크기에 비례합니다.
+        
+        Returns:
+            id(요소) -> 해당 요소의 첫 번째 제목 후보 텍스트
+        """
+        first_texts: Dict[int, str] = {}
+        for string in soup.find_all(string=True):
+            text = string.strip()
+            if not text or not cls._is_title_text(text):
+                continue
+            for parent in string.parents:
+                key = id(parent)
+                if key in first_texts:
+                    break
+                first_texts[key] = text
+        return first_texts
+    
+    @staticmethod
+    def _find_card_title(link, first_texts: Dict[int, str]) -> Optional[str]:
+        """링크를 감싼 결과 카드(div/li/article)에서 제목 찾기 (5단계 위까지 탐색)"""
+        current = link
+        for _ in range(NaverNewsURLExtractor.TITLE_SEARCH_DEPTH):
+            parent = current.parent
+            if parent is None:
+                break
+            if parent.name in ['div', 'li', 'article']:
+                # 해당 컨테이너 내의 첫 번째 긴 텍스트를 제목으로 사용
+                title = first_texts.get(id(parent))
+                if title:
+                    return title
+            current = parent
+        return None
+    
+    @staticmethod
+    def dedup_key(url: NewsURL) -> str:
+        """중복 판별에 사용하는 기사 키 (정규화된 oid/aid)"""
+        return url.key
+    
     def collect_from_search(self, search_url: str, 
                            max_pages: int = 0,
                            delay_sec: float = 1.0,
                            max_urls: int = 0,
                            url_type_filter: Optional[str] = None,
-                           search_date: Optional[str] = None) -> List[NewsURL]:
-        """네이버 검색 결과에서 URL 수집"""
+                           search_date: Optional[str] = None,
+                           seen_keys: Optional[Set[str]] = None,
+                           title_index: Optional[NearDuplicateIndex] = None) -> List[NewsURL]:
+        """
+        네이버 검색 결과에서 URL 수집
+        
+        seen_keys를 전달하면 이미 본 기사 키 집합으로 사용되어 해당 기사는 건너뛰며,
+        새로 수집한 기사의 키가 같은 집합에 추가됩니다. 여러 날짜나 실행에 걸쳐
+        같은 집합을 넘기면 중복 수집을 상수 시간에 걸러낼 수 있습니다.
+        
+        title_index를 전달하거나 crawling.skip_similar_titles가 켜져 있으면
+        제목이 유사한(similarity_threshold 이상) 기사도 본문 추출 전에 건너뜁니다.
+        """
+        collected_urls: List[NewsURL] = []
+        for page_urls in self.iter_search_pages(
+            search_url,
+            max_pages=max_pages,
+            delay_sec=delay_sec,
+            max_urls=max_urls,
+            url_type_filter=url_type_filter,
+            search_date=search_date,
+            seen_keys=seen_keys,
+            title_index=title_index
+        ):
+            collected_urls.extend(page_urls)
+        
+        return collected_urls
+    
+    def iter_search_pages(self, search_url: str, 
+                          max_pages: int = 0,
+                          delay_sec: float = 1.0,
+                          max_urls: int = 0,
+                          url_type_filter: Optional[str] = None,
+                          search_date: Optional[str] = None,
+                          seen_keys: Optional[Set[str]] = None,
+                          title_index: Optional[NearDuplicateIndex] = None) -> Iterator[List[NewsURL]]:
+        """
+        네이버 검색 결과를 페이지 단위로 순회하며 신규 URL 목록을 반환
+        
+        페이지를 가져올 때마다 해당 페이지에서 새로 발견한 URL을 바로 내보내므로,
+        호출 측은 다음 페이지 요청과 동시에 본문 추출을 시작할 수 있습니다.
+        중복 판별은 seen_keys 해시 집합으로 처리합니다 (collect_from_search 참고).
+        
+        페이지 사이 간격(delay_sec + 0~1초)은 페이지 요청마다 공용 속도 제한기에 넘기므로,
+        같은 호스트로 가는 다른 요청과도 함께 조절되고 다른 호출 측의 간격 설정을 바꾸지 않습니다.
+        """
+        page_interval = request_interval(delay_sec, 1.0)
         collected_urls: List[NewsURL] = []
+        if seen_keys is None:
+            seen_keys = set()
+        # 이전 실행에서 추출한 기사 기록 (영구 저장 비활성화 시 None)
+        seen_store = get_seen_store()
+        if title_index is None and self.config.crawling.skip_similar_titles:
+            title_index = self.create_title_index()
         page = 1
         consecutive_empty_pages = 0
         max_consecutive_empty = 3
@@ -259,7 +643,7 @@ class NaverNewsURLExtractor(URLExtractor):
             logger.info(f"  페이지 {page} 스캔 중...")
             
             # HTML 가져오기
-            html_content = self.get_page_content(current_url)
+            html_content = self.get_page_content(current_url, interval=page_interval)
             if not html_content:
                 consecutive_empty_pages += 1
                 if consecutive_empty_pages >= max_consecutive_empty:
@@ -267,11 +651,13 @@ class NaverNewsURLExtractor(URLExtractor):
                 page += 1
                 if max_pages > 0 and page > max_pages:
                     break
-                time.sleep(delay_sec + random.uniform(0, 0.5))
                 continue
             
-            # URL 추출
-            extracted_urls = self.extract_news_urls(html_content)
+            # URL 추출 (파싱 프로세스 풀 사용 시 별도 프로세스에서 파싱)
+            parse_pool = get_parse_pool()
+            extracted_urls = parse_pool.parse_search(html_content) if parse_pool is not None else None
+            if extracted_urls is None:
+                extracted_urls = self.extract_news_urls(html_content)
             logger.debug(f"페이지 {page}에서 추출된 URL: {len(extracted_urls)}개")
             
             # 유형 필터링
@@ -282,31 +668,53 @@ class NaverNewsURLExtractor(URLExtractor):
                 logger.debug(f"유형 필터링 ({url_type_filter}): {before_filter}개 → {len(extracted_urls)}개")
             
             # 새 URL 추가
-            new_urls_count = 0
+            page_urls: List[NewsURL] = []
+            stored_count = 0
+            limit_reached = False
             for url in extracted_urls:
                 if search_date:
                     url.search_date = search_date
                     
-                # 중복 체크
-                is_duplicate = any(u.url == url.url for u in collected_urls)
-                if not is_duplicate:
+                # 중복 체크 (해시 집합으로 상수 시간 조회)
+                key = self.dedup_key(url)
+                if key not in seen_keys and seen_store and seen_store.contains(key):
+                    seen_keys.add(key)
+                    stored_count += 1
+                    logger.debug(f"이전 실행에서 추출된 기사 스킵: {url.url[:50]}...")
+                elif key not in seen_keys:
+                    seen_keys.add(key)
+                    # 유사 제목 기사 체크 (재전송/재작성 기사)
+                    if title_index is not None and url.title and not title_index.add(url.title, key):
+                        logger.debug(f"유사 제목 기사 스킵: {url.title[:30]}...")
+                        continue
                     collected_urls.append(url)
-                    new_urls_count += 1
+                    page_urls.append(url)
                     logger.debug(f"새 URL 추가: {url.title[:30] if url.title else url.url[:50]}...")
                     
                     # max_urls 제한 체크를 새 URL 추가 직후로 이동
                     if max_urls > 0 and len(collected_urls) >= max_urls:
                         logger.info(f"URL 수집 제한({max_urls}개) 도달")
-                        return collected_urls
+                        limit_reached = True
+                        break
                 else:
                     logger.debug(f"중복 URL 스킵: {url.url[:50]}...")
             
+            if page_urls:
+                yield page_urls
+            if limit_reached:
+                return
+            
             # 종료 조건 확인
+            new_urls_count = len(page_urls)
             if new_urls_count > 0:
                 logger.info(
                     f"페이지 {page}: {new_urls_count}개 신규 URL (총 {len(collected_urls)}개)"
                 )
                 consecutive_empty_pages = 0
+            elif stored_count > 0:
+                # 이전 실행에서 수집한 기사만 있는 페이지는 빈 페이지로 보지 않음
+                logger.info(f"페이지 {page}: 이전 실행에서 추출된 기사 {stored_count}개 스킵")
+                consecutive_empty_pages = 0
             else:
                 consecutive_empty_pages += 1
             
@@ -318,6 +726,3 @@ class NaverNewsURLExtractor(URLExtractor):
                 break
             
             page += 1
-            time.sleep(delay_sec + random.uniform(0, 1))
-        
-        return collected_urls
@@ -0,0 +1,299 @@
+"""
+lxml 기반 콘텐츠 추출 엔진
+
+BeautifulSoup 트리를 만들지 않고 lxml.html 트리에서 직접 기사 정보를 추출합니다.
+설정의 CSS 선택자는 생성 시 한 번만 XPath로 컴파일하며,
+추출 결과는 BeautifulSoup 경로(NaverNewsContentExtractor)와 동일하게 맞춥니다.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+
+from ..models.news import NewsArticle
+from ..utils.selector_stats import SelectorStats, first_match, oid_from_article_id
+
+# cssselect 지원 (없으면 내장 변환기 사용)
+try:
+    from cssselect import HTMLTranslator
+    CSSSELECT_AVAILABLE = True
+except ImportError:
+    CSSSELECT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 본문에서 기자명을 찾는 패턴
+REPORTER_PATTERN = re.compile(r'([가-힣]{2,5}\s*(기자|특파원))')
+
+# BeautifulSoup의 get_text()가 텍스트를 제외하는 요소 (Script, Stylesheet, TemplateString 등)
+_SKIP_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# 제거된 요소를 대신하는 빈 요소의 태그 (앞뒤 텍스트 노드를 합치지 않기 위해 사용)
+_REMOVED_TAG = '_removed'
+
+# 내장 CSS 변환기용 패턴
+_COMPOUND_PATTERN = re.compile(
+    r"\s*(>)?\s*"
+    r"([a-zA-Z][\w-]*|\*)?"
+    r"((?:#[\w-]+|\.[\w-]+|\[\s*[\w-]+\s*(?:=\s*(?:\"[^\"]*\"|'[^']*'|[\w-]+)\s*)?\])*)"
+)
+_SIMPLE_PATTERN = re.compile(
+    r"#([\w-]+)|\.([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*(?:\"([^\"]*)\"|'([^']*)'|([\w-]+))\s*)?\]"
+)
+
+
+def _xpath_literal(value: str) -> str:
+    """XPath 문자열 리터럴 생성"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _translate_simple(selector: str, prefix: str) -> str:
+    """
+    단순 CSS 선택자를 XPath로 변환 (cssselect가 없을 때 사용)
+
+    태그, #id, .class, [attr], [attr=value]와 자손(공백)/자식(>) 결합자만 지원합니다.
+    """
+    steps: List[str] = []
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        match = _COMPOUND_PATTERN.match(selector, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"지원하지 않는 CSS 선택자: {selector}")
+        combinator, tag, simple = match.groups()
+        if not tag and not simple:
+            raise ValueError(f"지원하지 않는 CSS 선택자: {selector}")
+
+        predicates = []
+        for sm in _SIMPLE_PATTERN.finditer(simple or ''):
+            id_value, class_value, attr, dq, sq, bare = sm.groups()
+            if id_value is not None:
+                predicates.append(f"@id = {_xpath_literal(id_value)}")
+            elif class_value is not None:
+                predicates.append(
+                    "@class and contains(concat(' ', normalize-space(@class), ' '), "
+                    f"{_xpath_literal(' ' + class_value + ' ')})"
+                )
+            else:
+                value = dq if dq is not None else sq if sq is not None else bare
+                if value is None:
+                    predicates.append(f"@{attr}")
+                else:
+                    predicates.append(f"@{attr} = {_xpath_literal(value)}")
+
+        if not steps:
+            axis = prefix
+        elif combinator:
+            axis = "/"
+        else:
+            axis = "/descendant::"
+        steps.append(axis + (tag.lower() if tag else '*') + ''.join(f"[{p}]" for p in predicates))
+        pos = match.end()
+    return ''.join(steps)
+
+
+def css_to_xpath(selector: str, relative: bool = False) -> str:
+    """
+    CSS 선택자를 XPath 식으로 변환
+
+    Args:
+        selector: CSS 선택자 (쉼표로 구분된 그룹 가능)
+        relative: True이면 자손만 검색 (element.select와 동일),
+                  False이면 자기 자신 포함 (soup.select_one과 동일)
+    """
+    prefix = "descendant::" if relative else "descendant-or-self::"
+    if CSSSELECT_AVAILABLE:
+        return HTMLTranslator().css_to_xpath(selector, prefix=prefix)
+    return ' | '.join(_translate_simple(part, prefix) for part in selector.split(','))
+
+
+def _iter_strings(element) -> Iterator[str]:
+    """BeautifulSoup get_text()와 같은 규칙으로 텍스트 노드 순회"""
+    if element.tag in _SKIP_TEXT_TAGS:
+        # 해당 요소 자체에 대해 호출하면 BeautifulSoup도 자신의 텍스트를 반환
+        if element.text:
+            yield element.text
+        return
+
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT_TAGS and child.tag != _REMOVED_TAG:
+            yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(element, separator: str = '') -> str:
+    """BeautifulSoup의 get_text(separator, strip=True)와 같은 결과 반환"""
+    return separator.join(text for text in (s.strip() for s in _iter_strings(element)) if text)
+
+
+def parse_document(html_content: str):
+    """HTML 문서 파싱 (인코딩 선언이 있는 문자열은 바이트로 변환 후 파싱)"""
+    try:
+        return lxml.html.document_fromstring(html_content)
+    except ValueError:
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        return lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+
+
+class LxmlExtractionEngine:
+    """lxml 기반 뉴스 콘텐츠 추출 엔진"""
+
+    def __init__(self, content_selectors: Dict[str, List[Any]],
+                 remove_elements: List[str],
+                 min_content_length: int,
+                 max_content_length: int):
+        """
+        Args:
+            content_selectors: extraction.content_selectors 설정
+            remove_elements: 본문에서 제거할 요소 선택자 목록
+            min_content_length: 최소 본문 길이
+            max_content_length: 최대 본문 길이
+
+        Raises:
+            ValueError: XPath로 변환할 수 없는 선택자가 있는 경우
+        """
+        self.min_content_length = min_content_length
+        self.max_content_length = max_content_length
+
+        self.title = self._compile_list(content_selectors.get('title', []))
+        self.press = self._compile_list(content_selectors.get('press', []))
+        self.content = self._compile_list(content_selectors.get('content', []))
+        self.reporter = self._compile_list(content_selectors.get('reporter', []))
+
+        self.date: List[Tuple[str, etree.XPath, Optional[str]]] = []
+        for item in content_selectors.get('date', []):
+            if isinstance(item, dict):
+                selector, attr = item.get('selector'), item.get('attribute')
+            else:
+                selector, attr = item, None
+            self.date.append((selector, self._compile(selector), attr))
+
+        self.remove = [self._compile(selector, relative=True) for selector in remove_elements]
+
+    @staticmethod
+    def _compile(selector: str, relative: bool = False) -> etree.XPath:
+        return etree.XPath(css_to_xpath(selector, relative=relative))
+
+    def _compile_list(self, selectors: List[str]) -> List[Tuple[str, etree.XPath]]:
+        return [(selector, self._compile(selector)) for selector in selectors]
+
+    @staticmethod
+    def _first(xpath: etree.XPath, root):
+        """soup.select_one과 같이 문서 순서상 첫 번째 요소 반환"""
+        for node in xpath(root):
+            if isinstance(node.tag, str):
+                return node
+        return None
+
+    def extract_text_from_element(self, element) -> str:
+        """ContentExtractor.extract_text_from_element와 같은 규칙으로 텍스트 추출"""
+        # 불필요한 요소 제거 (decompose와 같이 앞뒤 텍스트는 별도 문자열로 유지)
+        for xpath in self.remove:
+            for node in xpath(element):
+                if node.tag != _REMOVED_TAG:
+                    node.clear(keep_tail=True)
+                    node.tag = _REMOVED_TAG
+
+        # 단락별 텍스트 추출
+        paragraphs = []
+        for child in element:
+            if child.tag in ('p', 'div'):
+                text = get_text(child)
+                if text:
+                    paragraphs.append(text)
+
+        return "\n".join(paragraphs) if paragraphs else get_text(element)
+
+    def parse(self, url: str, html_content: str,
+              selector_stats: Optional[SelectorStats] = None) -> NewsArticle:
+        """
+        기사 HTML에서 콘텐츠 추출
+
+        Args:
+            url: 기사 URL
+            html_content: 기사 HTML
+            selector_stats: 언론사별 선택자 통계 (있으면 선택자 순서 조정)
+        """
+        article = NewsArticle(url=url)
+
+        try:
+            root = parse_document(html_content)
+        except (etree.ParserError, ValueError) as e:
+            logger.warning(f"lxml 파싱 실패 ({url}): {e}")
+            return article
+
+        stats = selector_stats
+        oid = oid_from_article_id(article.article_id) if stats else None
+
+        def probe_title(candidate):
+            elem = self._first(candidate[1], root)
+            return get_text(elem, separator=' ') if elem is not None else None
+
+        def probe_press(candidate):
+            elem = self._first(candidate[1], root)
+            return elem.get('alt').strip() if elem is not None and elem.get('alt') else None
+
+        def probe_date(candidate):
+            selector, xpath, attr = candidate
+            elem = self._first(xpath, root)
+            if elem is None:
+                return None
+            if attr and elem.get(attr) is not None:
+                return elem.get(attr).strip()
+            return get_text(elem)
+
+        def probe_content(candidate):
+            selector, xpath = candidate
+            elem = self._first(xpath, root)
+            if elem is None:
+                return None
+            content_text = self.extract_text_from_element(elem)
+            # 본문 길이 검증
+            content_length = len(content_text)
+            if content_length < self.min_content_length:
+                logger.debug(f"본문이 너무 짧음 ({content_length}자): {selector}")
+                return None
+            if content_length > self.max_content_length:
+                # 최대 길이 초과 시 잘라내기
+                logger.warning(f"본문이 너무 길어 잘라냈습니다: {url}")
+                return content_text[:self.max_content_length]
+            return content_text
+
+        def probe_reporter(candidate):
+            elem = self._first(candidate[1], root)
+            return get_text(elem) if elem is not None else None
+
+        try:
+            # 제목, 언론사, 날짜, 본문, 기자 순으로 추출
+            article.title = first_match(self.title, probe_title, stats, 'title', oid) or ''
+            article.press = first_match(self.press, probe_press, stats, 'press', oid) or ''
+            article.date = first_match(self.date, probe_date, stats, 'date', oid) or ''
+            article.content = first_match(self.content, probe_content, stats, 'content', oid) or ''
+            article.reporter = first_match(self.reporter, probe_reporter, stats, 'reporter', oid) or ''
+
+            # 본문에서 기자 정보 추출 시도
+            if not article.reporter and article.content:
+                match = REPORTER_PATTERN.search(article.content)
+                if match:
+                    article.reporter = match.group(1).strip()
+
+            if article.title:
+                logger.debug(f"콘텐츠 추출 성공: {article.title[:30]}...")
+            else:
+                logger.warning(f"콘텐츠 추출 실패: {url}")
+
+        except Exception as e:
+            logger.error(f"콘텐츠 파싱 중 예외 발생 ({url}): {e}", exc_info=True)
+
+        return article
@@ -0,0 +1,164 @@
+"""
+프로세스 풀 파싱 모듈
+
+HTML 파싱은 CPU를 많이 쓰고 GIL에 묶이므로, 네트워크 요청을 처리하는 스레드와 분리해
+별도 프로세스들에서 수행합니다. 요청 스레드는 받은 HTML 바이트를 파서 프로세스로 보내고
+작은 튜플 형태의 결과만 돌려받아 NewsArticle/NewsURL로 복원합니다.
+파서 프로세스는 부모 프로세스의 설정 전체로 시작하며, 선택자 적중 기록은 파싱 결과와 함께
+돌려받아 부모 프로세스의 선택자 통계에 반영합니다.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.news import NewsArticle, NewsURL
+from ..utils.config import get_config
+from ..utils.selector_stats import SelectorHit, get_selector_stats, install_worker_stats
+
+logger = logging.getLogger(__name__)
+
+# 파서 프로세스별 추출기 (프로세스 안에서 한 번만 생성)
+_content_parser = None
+_url_parser = None
+
+
+def _init_worker(config_data: Dict[str, Dict[str, Any]],
+                 selector_counts: Optional[Dict[str, Dict[str, Dict[str, int]]]]):
+    """파서 프로세스 초기화: 부모 프로세스의 설정과 선택자 통계를 그대로 적용"""
+    config = get_config()
+    config.update_from_dict(config_data)
+    if selector_counts is not None:
+        install_worker_stats(selector_counts)
+
+
+def _parse_article(url: str, html: bytes) -> Tuple[str, str, str, str, str, List[SelectorHit]]:
+    """기사 HTML 파싱 (파서 프로세스에서 실행, 선택자 적중 기록 포함)"""
+    global _content_parser
+    if _content_parser is None:
+        from .content_extractor import NaverNewsContentExtractor
+        _content_parser = NaverNewsContentExtractor.parser_only()
+
+    article = _content_parser.parse_news_content(url, html.decode('utf-8'))
+    stats = get_selector_stats()
+    hits = stats.drain_journal() if stats is not None else []
+    return article.title, article.press, article.date, article.content, article.reporter, hits
+
+
+def _parse_search(html: bytes) -> List[Tuple[str, str, Optional[str]]]:
+    """검색 결과 HTML 파싱 (파서 프로세스에서 실행)"""
+    global _url_parser
+    if _url_parser is None:
+        from .extractors import NaverNewsURLExtractor
+        _url_parser = NaverNewsURLExtractor.parser_only()
+
+    return [(u.url, u.type, u.title) for u in _url_parser.extract_news_urls(html.decode('utf-8'))]
+
+
+class ParsePool:
+    """HTML 파싱 전용 프로세스 풀"""
+
+    def __init__(self, workers: int):
+        """
+        Args:
+            workers: 파서 프로세스 수
+        """
+        config = get_config()
+        self.workers = workers
+        self.key = (workers, config.extraction.version, config.crawling.partial_search_parse)
+        stats = get_selector_stats()
+
+        # 요청 스레드가 있는 상태에서 fork하지 않도록 spawn 방식 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(config.to_dict(), stats.snapshot() if stats is not None else None)
+        )
+        logger.info(f"파싱 프로세스 풀 시작: {workers}개 프로세스")
+
+    def parse_article(self, url: str, html: str) -> Optional[NewsArticle]:
+        """
+        기사 HTML을 파서 프로세스에서 파싱
+
+        Returns:
+            추출된 기사, 파서 프로세스 오류 시 None (호출한 쪽에서 직접 파싱)
+        """
+        try:
+            title, press, date, content, reporter, hits = self._executor.submit(
+                _parse_article, url, html.encode('utf-8')
+            ).result()
+        except Exception as e:
+            logger.warning(f"파싱 프로세스 오류 ({url}): {e}")
+            return None
+        # 파서 프로세스의 선택자 적중을 부모 통계에 반영 (저장은 부모가 담당)
+        stats = get_selector_stats()
+        if stats is not None:
+            for field, oid, selector, evaluations in hits:
+                stats.record(field, oid, selector, evaluations)
+        return NewsArticle(url=url, title=title, press=press, date=date,
+                           content=content, reporter=reporter)
+
+    def parse_search(self, html: str) -> Optional[List[NewsURL]]:
+        """
+        검색 결과 HTML을 파서 프로세스에서 파싱
+
+        Returns:
+            추출된 URL 목록, 파서 프로세스 오류 시 None
+        """
+        try:
+            records = self._executor.submit(_parse_search, html.encode('utf-8')).result()
+        except Exception as e:
+            logger.warning(f"파싱 프로세스 오류 (검색 결과): {e}")
+            return None
+        return [NewsURL(url=url, type=url_type, title=title) for url, url_type, title in records]
+
+    def shutdown(self):
+        """파서 프로세스 종료"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 글로벌 파싱 풀 인스턴스
+_parse_pool = None
+_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """
+    설정(crawling.parse_workers)에 따른 파싱 풀 반환 (싱글톤)
+
+    parse_workers가 0이면 None을 반환하며, 이 경우 요청 스레드에서 직접 파싱합니다.
+    추출 설정이 바뀌면 새 설정으로 풀을 다시 시작합니다.
+    """
+    global _parse_pool
+
+    config = get_config()
+    workers = config.crawling.parse_workers
+    if workers <= 0:
+        return None
+
+    key = (workers, config.extraction.version, config.crawling.partial_search_parse)
+    pool = _parse_pool
+    if pool is None or pool.key != key:
+        with _lock:
+            if _parse_pool is None or _parse_pool.key != key:
+                if _parse_pool is not None:
+                    _parse_pool.shutdown()
+                _parse_pool = ParsePool(workers)
+            pool = _parse_pool
+    return pool
+
+
+def shutdown_parse_pool():
+    """사용 중인 파싱 풀 종료"""
+    global _parse_pool
+    with _lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
+
+
+atexit.register(shutdown_parse_pool)
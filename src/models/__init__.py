@@ -2,7 +2,13 @@
 데이터 모델 패키지
 """
 
-from .news import NewsURL, NewsArticle, CrawlResult
+from .news import (
+    NewsURL, NewsArticle, CrawlResult,
+    canonical_article_id, canonical_article_key, canonical_article_url
+)
 from .search_options import NaverNewsSearchOption
 
-__all__ = ['NewsURL', 'NewsArticle', 'CrawlResult', 'NaverNewsSearchOption']
+__all__ = [
+    'NewsURL', 'NewsArticle', 'CrawlResult', 'NaverNewsSearchOption',
+    'canonical_article_id', 'canonical_article_key', 'canonical_article_url'
+]
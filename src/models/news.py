@@ -4,10 +4,54 @@
 뉴스 관련 데이터 구조를 정의합니다.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+# 네이버 기사 URL 패턴 (경로형: .../article/{oid}/{aid}, 쿼리형: ...?oid={oid}&aid={aid})
+_NAVER_HOST_PATTERN = re.compile(r"^https?://(?:[\w-]+\.)*naver\.com(?:[/?#]|$)", re.IGNORECASE)
+_ARTICLE_PATH_PATTERN = re.compile(r"/article/(\d{3})/(\d{6,})")
+_OID_PATTERN = re.compile(r"[?&]oid=(\d{3})(?:&|$|#)")
+_AID_PATTERN = re.compile(r"[?&]aid=(\d{6,})(?:&|$|#)")
+
+
+def canonical_article_id(url: Optional[str]) -> Optional[str]:
+    """
+    네이버 기사 URL에서 정규화된 기사 ID("{oid}/{aid}") 추출
+    
+    n.news.naver.com/mnews/article/, /article/, 모바일 호스트, 쿼리 문자열 등
+    서로 다른 형태의 URL도 같은 기사라면 같은 ID를 반환합니다.
+    네이버 기사 URL이 아니면 None을 반환합니다.
+    """
+    if not url or not _NAVER_HOST_PATTERN.match(url):
+        return None
+    
+    match = _ARTICLE_PATH_PATTERN.search(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+    
+    oid = _OID_PATTERN.search(url)
+    aid = _AID_PATTERN.search(url)
+    if oid and aid:
+        return f"{oid.group(1)}/{aid.group(1)}"
+    
+    return None
+
+
+def canonical_article_key(url: str) -> str:
+    """중복 판별/캐시용 기사 키 (기사 ID가 없으면 프래그먼트를 뗀 URL)"""
+    article_id = canonical_article_id(url)
+    if article_id:
+        return article_id
+    return url.split('#', 1)[0]
+
+
+def canonical_article_url(article_id: str) -> str:
+    """기사 ID에 대응하는 표준 기사 URL"""
+    return f"https://n.news.naver.com/mnews/article/{article_id}"
+
+
 @dataclass
 class NewsURL:
     """뉴스 URL 데이터 모델"""
@@ -16,6 +60,16 @@ class NewsURL:
     title: Optional[str] = None
     search_date: Optional[str] = None
     collected_at: Optional[datetime] = field(default_factory=datetime.now)
+    article_id: Optional[str] = None  # 정규화된 기사 ID ("{oid}/{aid}")
+    
+    def __post_init__(self):
+        if self.article_id is None:
+            self.article_id = canonical_article_id(self.url)
+    
+    @property
+    def key(self) -> str:
+        """중복 판별용 기사 키"""
+        return self.article_id or canonical_article_key(self.url)
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -24,7 +78,8 @@ class NewsURL:
             'type': self.type,
             'title': self.title,
             'search_date': self.search_date,
-            'collected_at': self.collected_at.isoformat() if self.collected_at else None
+            'collected_at': self.collected_at.isoformat() if self.collected_at else None,
+            'article_id': self.article_id
         }
 
 @dataclass
@@ -37,6 +92,16 @@ class NewsArticle:
     content: str = ''
     reporter: str = ''
     extracted_at: Optional[datetime] = field(default_factory=datetime.now)
+    article_id: Optional[str] = None  # 정규화된 기사 ID ("{oid}/{aid}")
+    
+    def __post_init__(self):
+        if self.article_id is None:
+            self.article_id = canonical_article_id(self.url)
+    
+    @property
+    def key(self) -> str:
+        """중복 판별용 기사 키"""
+        return self.article_id or canonical_article_key(self.url)
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -47,7 +112,8 @@ class NewsArticle:
             'date': self.date,
             'content': self.content,
             'reporter': self.reporter,
-            'extracted_at': self.extracted_at.isoformat() if self.extracted_at else None
+            'extracted_at': self.extracted_at.isoformat() if self.extracted_at else None,
+            'article_id': self.article_id
         }
     
     def is_valid(self) -> bool:
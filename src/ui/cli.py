@@ -20,17 +20,34 @@ class CLI:
     """명령줄 인터페이스"""
     
     def __init__(self):
-        # --help 옵션이 있으면 초기화를 최소화
-        if '--help' in sys.argv or '-h' in sys.argv:
-            self.crawler = None
-            self.daily_collector = None
-            self.file_saver = None
-            self.config = None
-        else:
-            self.crawler = NewsCrawler()
-            self.daily_collector = NaverNewsDailyCollector()
-            self.file_saver = FileSaver()
-            self.config = get_config()
+        # 크롤러, 날짜별 수집기, 파일 저장기는 실제로 사용할 때 생성
+        # (--help나 한쪽 모드만 쓰는 실행에서 불필요한 초기화를 하지 않고,
+        #  명령줄 옵션이 설정에 반영된 뒤에 만들어지도록 함)
+        self._crawler = None
+        self._daily_collector = None
+        self._file_saver = None
+        self.config = None if '--help' in sys.argv or '-h' in sys.argv else get_config()
+    
+    @property
+    def crawler(self) -> NewsCrawler:
+        """뉴스 크롤러 (첫 사용 시 생성)"""
+        if self._crawler is None:
+            self._crawler = NewsCrawler()
+        return self._crawler
+    
+    @property
+    def daily_collector(self) -> NaverNewsDailyCollector:
+        """날짜별 수집기 (첫 사용 시 생성)"""
+        if self._daily_collector is None:
+            self._daily_collector = NaverNewsDailyCollector()
+        return self._daily_collector
+    
+    @property
+    def file_saver(self) -> FileSaver:
+        """파일 저장기 (첫 사용 시 생성)"""
+        if self._file_saver is None:
+            self._file_saver = FileSaver()
+        return self._file_saver
     
     def parse_arguments(self) -> argparse.Namespace:
         """명령행 인자 파싱"""
@@ -88,6 +105,22 @@ class CLI:
         parser.add_argument('--content-delay', type=float, default=1.5,
                           help='본문 추출 시 요청 간 지연 시간(초) (기본값: 1.5)')
         
+        # 동시 처리 옵션
+        parser.add_argument('--workers', type=int, default=None,
+                          help='본문 동시 추출 작업자 수 (기본값: 설정 파일의 crawling.max_workers)')
+        parser.add_argument('--pipeline', action='store_true', default=None,
+                          help='URL 수집과 본문 추출을 동시에 진행')
+        parser.add_argument('--parse-workers', type=int, default=None,
+                          help='HTML 파싱 프로세스 수 (기본값: 설정 파일의 crawling.parse_workers, 0이면 사용 안 함)')
+        parser.add_argument('--parallel-days', type=int, default=None,
+                          help='날짜별 수집에서 동시에 수집할 날짜 수 (기본값: 설정 파일의 crawling.parallel_days, 1이면 순차)')
+        parser.add_argument('--http-mode', choices=['live', 'record', 'replay'], default=None,
+                          help='HTTP 모드: live(실제 요청), record(응답 기록), replay(기록된 응답 재생)')
+        parser.add_argument('--adaptive-pacing', action='store_true', default=None,
+                          help='응답 상태와 지연 시간에 따라 요청 속도를 자동 조절 (고정 지연 대신 학습한 속도 사용)')
+        parser.add_argument('--metrics-file', default=None,
+                          help='실행 지표를 Prometheus 텍스트 형식으로 저장할 파일 경로')
+        
         # 출력 옵션
         parser.add_argument('--output', default='data/news_data',
                           help='뉴스 데이터 저장 디렉토리')
@@ -179,6 +212,18 @@ class CLI:
         print(f"\n크롤링을 시작합니다...")
         logger.info(f"네이버 뉴스 크롤링 시작: '{args.query}'")
         
+        # 파싱 프로세스 수 지정 시 설정에 반영 (네트워크 작업자 수와 별도로 조정)
+        if getattr(args, 'parse_workers', None) is not None:
+            self.config.crawling.parse_workers = args.parse_workers
+        if getattr(args, 'parallel_days', None) is not None:
+            self.config.crawling.parallel_days = args.parallel_days
+        if getattr(args, 'http_mode', None) is not None:
+            self.config.network.http_mode = args.http_mode
+        if getattr(args, 'adaptive_pacing', None):
+            self.config.advanced.adaptive_pacing['enabled'] = True
+        if getattr(args, 'metrics_file', None):
+            self.config.advanced.metrics['prometheus_file'] = args.metrics_file
+        
         try:
             # 날짜별 수집이 필요한지 확인
             use_daily_collector = self._should_use_daily_collector(args)
@@ -202,7 +247,9 @@ class CLI:
                     content_limit=args.content_limit,
                     extraction_mode=args.extraction_mode,
                     request_delay=args.delay,
-                    content_delay=args.content_delay
+                    content_delay=args.content_delay,
+                    max_workers=getattr(args, 'workers', None),
+                    pipeline=getattr(args, 'pipeline', None)
                 )
             
             # 결과 저장 및 출력
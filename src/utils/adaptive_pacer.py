@@ -0,0 +1,213 @@
+"""
+적응형 요청 속도 조절 모듈
+
+응답 상태와 지연 시간을 보고 전체 요청 속도를 AIMD(가산 증가, 승산 감소) 방식으로 조절합니다.
+응답이 빠르고 정상이면 속도를 조금씩 올리고, 403/429 차단이나 5xx, 시간 초과, 지연 급증이
+관측되면 속도를 크게 줄입니다. 조절한 속도는 공용 속도 제한기와 세션 풀에 반영되고,
+실행이 끝나면 파일에 저장해 다음 실행을 학습한 속도에서 시작합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from . import metrics
+from .config import get_config
+from .rate_limiter import get_rate_limiter
+from .session_pool import peek_session_pool
+
+logger = logging.getLogger(__name__)
+
+# 차단으로 보는 상태 코드
+THROTTLE_STATUSES = (403, 429)
+
+# 최저 속도의 하한 (0이면 전체 요청 수 제한이 풀리고 요청 간격 계산에서 0으로 나누게 됨)
+MIN_RATE_FLOOR = 0.01
+
+
+class AdaptivePacer:
+    """AIMD 요청 속도 조절기 (스레드 안전)"""
+
+    def __init__(self, initial_rate: float = 0.5,
+                 min_rate: float = 0.1,
+                 max_rate: float = 5.0,
+                 increase_step: float = 0.1,
+                 decrease_factor: float = 0.5,
+                 latency_threshold: float = 3.0,
+                 forbidden_cooldown: float = 5.0,
+                 max_cooldown: float = 120.0,
+                 state_file: Optional[str] = None):
+        """
+        Args:
+            initial_rate: 저장된 상태가 없을 때 시작 속도 (초당 요청 수)
+            min_rate: 최저 속도 (MIN_RATE_FLOOR보다 작으면 MIN_RATE_FLOOR)
+            max_rate: 최고 속도
+            increase_step: 정상 응답이 1초 분량 쌓일 때마다 올리는 속도
+            decrease_factor: 차단/지연 시 곱하는 비율 (0~1)
+            latency_threshold: 이보다 느린 응답은 지연 급증으로 판단 (초)
+            forbidden_cooldown: 첫 403 이후 재시도 전 대기 시간 (연속 차단마다 두 배)
+            max_cooldown: 403 대기 시간 상한
+            state_file: 학습한 속도 저장 파일 (None이면 저장하지 않음)
+        """
+        self.min_rate = max(min_rate, MIN_RATE_FLOOR)
+        self.max_rate = max(self.min_rate, max_rate)
+        self.increase_step = increase_step
+        self.decrease_factor = min(max(decrease_factor, 0.05), 0.95)
+        self.latency_threshold = latency_threshold
+        self.forbidden_cooldown = forbidden_cooldown
+        self.max_cooldown = max_cooldown
+        self.state_file = state_file
+
+        self.rate = self._clamp(initial_rate)
+        self._consecutive_throttles = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+        if state_file:
+            self.load()
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate, max(self.min_rate, rate))
+
+    def load(self):
+        """저장된 학습 속도 불러오기"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.rate = self._clamp(float(data['rate']))
+            logger.info(f"학습한 요청 속도 로드: 초당 {self.rate:.2f}건 ({self.state_file})")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"요청 속도 상태 로드 실패: {e}")
+
+    def save(self):
+        """현재 속도를 파일에 저장"""
+        if not self.state_file:
+            return
+        with self._lock:
+            data = {'rate': self.rate, 'updated_at': datetime.now().isoformat()}
+        try:
+            directory = os.path.dirname(self.state_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.state_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.state_file)
+            logger.debug(f"요청 속도 상태 저장: {self.state_file}")
+        except OSError as e:
+            logger.warning(f"요청 속도 상태 저장 실패: {e}")
+
+    def record(self, status: Optional[int], latency: float) -> float:
+        """
+        응답 한 건을 반영해 속도 조절
+
+        Args:
+            status: HTTP 상태 코드 (연결 오류/시간 초과는 None)
+            latency: 응답 시간(초)
+
+        Returns:
+            조절 후 속도 (초당 요청 수)
+        """
+        with self._lock:
+            previous = self.rate
+            if status in THROTTLE_STATUSES:
+                self._consecutive_throttles += 1
+                self._decrease('throttle')
+            elif status is None or status >= 500 or latency > self.latency_threshold:
+                self._decrease('congestion')
+            else:
+                self._consecutive_throttles = 0
+                # 초당 요청 수만큼 정상 응답이 쌓이면 increase_step만큼 증가 (대략 1초마다 한 번)
+                self.rate = self._clamp(self.rate + self.increase_step / max(self.rate, 1.0))
+            rate = self.rate
+
+        if rate != previous:
+            self.apply()
+        return rate
+
+    def _decrease(self, reason: str):
+        """승산 감소 (이미 보낸 요청들의 응답으로 여러 번 줄이지 않도록 한 요청 간격에 한 번만)"""
+        now = time.monotonic()
+        if now - self._last_decrease < 1.0 / self.rate:
+            return
+        self._last_decrease = now
+        old_rate = self.rate
+        self.rate = self._clamp(self.rate * self.decrease_factor)
+        metrics.get_metrics().counter('pacing_decreases_total', '적응형 속도 감소 횟수', reason=reason).inc()
+        logger.info(f"요청 속도 감소 ({reason}): 초당 {old_rate:.2f}건 → {self.rate:.2f}건")
+
+    def forbidden_wait(self) -> float:
+        """403 이후 재시도 전 대기 시간 (연속 차단마다 두 배, 상한 적용)"""
+        with self._lock:
+            exponent = max(0, self._consecutive_throttles - 1)
+        return min(self.max_cooldown, self.forbidden_cooldown * (2 ** exponent))
+
+    def apply(self):
+        """현재 속도를 공용 속도 제한기와 세션 풀에 반영"""
+        rate = self.rate
+        get_rate_limiter().set_global_rate(rate)
+        # 세션 풀은 이미 만들어진 경우에만 반영 (여기서 새로 만들지 않음)
+        pool = peek_session_pool()
+        if pool is not None:
+            pool.set_target_rate(rate)
+
+
+# 글로벌 조절기 인스턴스
+_pacer = None
+_pacer_initialized = False
+_lock = threading.Lock()
+
+
+def get_adaptive_pacer() -> Optional[AdaptivePacer]:
+    """
+    설정(advanced.adaptive_pacing)에 따른 조절기 반환 (싱글톤)
+
+    적응형 속도 조절이 비활성화되어 있으면 None을 반환합니다.
+    """
+    global _pacer, _pacer_initialized
+
+    if not _pacer_initialized:
+        with _lock:
+            if not _pacer_initialized:
+                options = get_config().advanced.adaptive_pacing
+                if options.get('enabled', False):
+                    anti_403 = get_config().advanced.anti_403
+                    _pacer = AdaptivePacer(
+                        initial_rate=options.get('initial_rate', 0.5),
+                        min_rate=options.get('min_rate', 0.1),
+                        max_rate=options.get('max_rate', 5.0),
+                        increase_step=options.get('increase_step', 0.1),
+                        decrease_factor=options.get('decrease_factor', 0.5),
+                        latency_threshold=options.get('latency_threshold_seconds', 3.0),
+                        forbidden_cooldown=options.get('forbidden_cooldown_seconds', 5.0),
+                        max_cooldown=anti_403.get('max_backoff_seconds', 120),
+                        state_file=options.get('state_file', 'data/pacing_state.json')
+                    )
+                _pacer_initialized = True
+
+    return _pacer
+
+
+def apply_global_rate(default_rate: float):
+    """
+    실행 시작 시 전체 요청 속도 설정
+
+    적응형 조절 사용 시 학습한 속도를, 아니면 default_rate(초당 요청 수)를 적용합니다.
+    """
+    pacer = get_adaptive_pacer()
+    if pacer is not None:
+        pacer.apply()
+    else:
+        get_rate_limiter().set_global_rate(default_rate)
+
+
+def save_pacer_state():
+    """사용 중인 조절기가 있으면 학습한 속도 저장"""
+    if _pacer is not None:
+        _pacer.save()
@@ -0,0 +1,55 @@
+"""
+asyncio 연동 유틸리티
+
+동기 코드에서 코루틴을 실행할 수 있도록 백그라운드 이벤트 루프를 관리합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+# 글로벌 백그라운드 이벤트 루프
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 스레드에서 실행 중인 이벤트 루프 반환 (싱글톤)"""
+    global _loop
+
+    if _loop is None:
+        with _lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="async-fetch-loop",
+                    daemon=True
+                )
+                thread.start()
+                _loop = loop
+                logger.debug("백그라운드 이벤트 루프 시작")
+
+    return _loop
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다림
+
+    이미 이벤트 루프가 실행 중인 스레드에서는 교착 상태를 막기 위해
+    사용할 수 없습니다. 그 경우 코루틴을 직접 await 해야 합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("실행 중인 이벤트 루프 안에서는 run_sync를 사용할 수 없습니다. await를 사용하세요.")
+
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    return future.result()
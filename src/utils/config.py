@@ -22,6 +22,8 @@ class NetworkConfig:
     request_delay_max: float = 3.0
     content_delay_min: float = 1.5
     content_delay_max: float = 3.5
+    fetch_backend: str = "sync"  # "sync" 또는 "async"
+    http_mode: str = "live"  # "live", "record" 또는 "replay"
     user_agents: List[str] = None
     
     def __post_init__(self):
@@ -63,8 +65,16 @@ class CrawlingConfig:
     skip_duplicates: bool = True
     delay_between_requests: float = 2.0
     similarity_threshold: float = 0.8
+    skip_similar_titles: bool = False
     enable_progress_bar: bool = True
     log_level: str = "INFO"
+    max_workers: int = 1
+    max_requests_per_second: float = 2.0
+    pipeline_extraction: bool = False
+    pipeline_queue_size: int = 50
+    partial_search_parse: bool = True  # 검색 결과 영역만 파싱
+    parse_workers: int = 0  # HTML 파싱 프로세스 수 (0이면 요청 스레드에서 파싱)
+    parallel_days: int = 1  # 날짜별 수집에서 동시에 수집할 날짜 수 (1이면 순차)
 
 @dataclass
 class ExtractionConfig:
@@ -74,6 +84,9 @@ class ExtractionConfig:
     min_content_length: int = 100
     max_content_length: int = 50000
     remove_elements: List[str] = field(default_factory=list)
+    engine: str = "beautifulsoup"  # "beautifulsoup" 또는 "lxml"
+    adaptive_selectors: bool = False  # 언론사별 적중 통계로 선택자 순서 조정
+    selector_stats_file: str = "data/selector_stats.json"
     
     def __post_init__(self):
         if not self.content_selectors:
@@ -86,6 +99,22 @@ class ExtractionConfig:
             }
         if not self.remove_elements:
             self.remove_elements = [".ad_wrap", ".link_news_relation", "script", "style"]
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # 값이 다시 설정될 때마다 버전 증가 (추출 계획 재생성 판단용)
+        if name != '_version':
+            super().__setattr__('_version', getattr(self, '_version', 0) + 1)
+    
+    @property
+    def version(self) -> int:
+        """
+        설정 변경 버전
+        
+        속성을 다시 설정할 때마다 증가합니다. 선택자 목록을 제자리에서 수정한 경우에는
+        해당 속성을 다시 대입해야 변경이 반영됩니다.
+        """
+        return self._version
     
 @dataclass
 class UIConfig:
@@ -104,26 +133,74 @@ class AdvancedConfig:
     session_management: Dict[str, Any] = field(default_factory=dict)
     anti_403: Dict[str, Any] = field(default_factory=dict)
     duplicate_management: Dict[str, Any] = field(default_factory=dict)
+    http_cache: Dict[str, Any] = field(default_factory=dict)
+    http_archive: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    adaptive_pacing: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
         if not self.session_management:
             self.session_management = {
                 "enable_cookie_persistence": True,
                 "session_refresh_interval": 300,
-                "max_sessions_pool": 3
+                "max_sessions_pool": 3,
+                "snapshot_file": "data/session_pool.json",
+                "snapshot_max_age_hours": 24
             }
         if not self.anti_403:
             self.anti_403 = {
                 "enable_progressive_backoff": True,
                 "max_backoff_seconds": 120,
                 "enable_proxy_rotation": False,
-                "proxy_list": []
+                "proxy_list": [],
+                "proxy_quarantine_seconds": 30,
+                "max_proxy_quarantine_seconds": 1800,
+                "proxy_failure_threshold": 3,
+                "allow_direct_fallback": False,
+                "session_cooldown_seconds": 300,
+                "max_session_cooldown_seconds": 1800
             }
         if not self.duplicate_management:
             self.duplicate_management = {
                 "enable_persistent_storage": False,
                 "storage_type": "sqlite",
-                "enable_content_hash": False
+                "enable_content_hash": False,
+                "db_path": "data/seen_articles.db",
+                "batch_size": 100
+            }
+        if not self.http_cache:
+            self.http_cache = {
+                "enabled": False,
+                "cache_dir": "data/http_cache",
+                "search_ttl_seconds": 600,
+                "article_ttl_seconds": 604800,
+                "max_size_mb": 512,
+                "compression": "zstd"
+            }
+        if not self.http_archive:
+            self.http_archive = {
+                "archive_path": "data/http_archive.jsonl.gz",
+                "replay_latency_ms": 0,
+                "replay_403_rate": 0.0,
+                "replay_5xx_rate": 0.0,
+                "replay_seed": 0
+            }
+        if not self.metrics:
+            self.metrics = {
+                "log_summary": True,
+                "prometheus_file": ""
+            }
+        if not self.adaptive_pacing:
+            self.adaptive_pacing = {
+                "enabled": False,
+                "initial_rate": 0.5,
+                "min_rate": 0.1,
+                "max_rate": 5.0,
+                "increase_step": 0.1,
+                "decrease_factor": 0.5,
+                "latency_threshold_seconds": 3.0,
+                "forbidden_cooldown_seconds": 5.0,
+                "state_file": "data/pacing_state.json"
             }
 
 class Config:
@@ -167,18 +244,7 @@ class Config:
                 data = json.load(f)
             
             # 각 설정 섹션 업데이트
-            if 'network' in data:
-                self._update_dataclass(self.network, data['network'])
-            if 'storage' in data:
-                self._update_dataclass(self.storage, data['storage'])
-            if 'crawling' in data:
-                self._update_dataclass(self.crawling, data['crawling'])
-            if 'extraction' in data:
-                self._update_dataclass(self.extraction, data['extraction'])
-            if 'ui' in data:
-                self._update_dataclass(self.ui, data['ui'])
-            if 'advanced' in data:
-                self._update_dataclass(self.advanced, data['advanced'])
+            self.update_from_dict(data)
             
             logger.info(f"설정 파일 로드 완료: {config_path}")
             
@@ -197,23 +263,31 @@ class Config:
         config_path = config_file or self._config_file
         
         try:
-            config_data = {
-                'network': asdict(self.network),
-                'storage': asdict(self.storage),
-                'crawling': asdict(self.crawling),
-                'extraction': asdict(self.extraction),
-                'ui': asdict(self.ui),
-                'advanced': asdict(self.advanced)
-            }
-            
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
             
             logger.info(f"설정 파일 저장 완료: {config_path}")
             
         except Exception as e:
             logger.error(f"설정 파일 저장 중 오류: {e}")
     
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """현재 설정을 섹션별 딕셔너리로 반환합니다."""
+        return {
+            'network': asdict(self.network),
+            'storage': asdict(self.storage),
+            'crawling': asdict(self.crawling),
+            'extraction': asdict(self.extraction),
+            'ui': asdict(self.ui),
+            'advanced': asdict(self.advanced)
+        }
+    
+    def update_from_dict(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """섹션별 딕셔너리(to_dict 형식)의 값으로 설정을 업데이트합니다."""
+        for section in ('network', 'storage', 'crawling', 'extraction', 'ui', 'advanced'):
+            if section in data:
+                self._update_dataclass(getattr(self, section), data[section])
+    
     def _update_dataclass(self, obj, data: Dict[str, Any]) -> None:
         """데이터클래스 객체를 딕셔너리 데이터로 업데이트합니다."""
         for key, value in data.items():
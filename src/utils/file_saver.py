@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from ..models.news import NewsURL, NewsArticle, CrawlResult
+from ..utils import metrics
 from ..utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,16 @@ class FileSaver:
     def __init__(self):
         self.config = get_config()
     
+    @staticmethod
+    def _write_json(filepath: str, data: Any, kind: str):
+        """JSON 파일 쓰기 (소요 시간과 크기를 지표로 기록)"""
+        registry = metrics.get_metrics()
+        with registry.timer('file_write_seconds', kind=kind):
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        registry.counter('file_bytes_written_total', '저장한 파일 크기(바이트)', kind=kind).inc(
+            os.path.getsize(filepath))
+    
     def save_urls(self, urls: List[NewsURL], 
                   query: str,
                   period: str,
@@ -52,8 +63,7 @@ class FileSaver:
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_json(filepath, data, 'urls')
             logger.info(f"URL {len(urls)}개 저장 완료: {filepath}")
             return filepath
         except IOError as e:
@@ -102,8 +112,7 @@ class FileSaver:
             }
             
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._write_json(filepath, data, 'articles')
                 saved_files.append(filepath)
                 logger.info(f"배치 {batch_num} 저장 완료: {filepath}")
             except IOError as e:
@@ -159,8 +168,7 @@ class FileSaver:
         filepath = os.path.join(output_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+            self._write_json(filepath, result.to_dict(), 'stats')
             logger.info(f"통계 저장 완료: {filepath}")
             return filepath
         except IOError as e:
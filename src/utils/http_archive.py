@@ -0,0 +1,261 @@
+"""
+HTTP 기록/재생 모듈
+
+기록 모드(network.http_mode = "record")에서는 get_page_content가 보낸 요청과 받은 응답을
+아카이브 파일에 저장합니다. 재생 모드("replay")에서는 아카이브를 로컬 HTTP 서버로 제공하고
+요청 URL을 이 서버로 바꿔 보내므로, 네이버에 접속하지 않고도 전체 크롤링을 같은 조건으로
+반복 실행하고 시간을 잴 수 있습니다. 재생 서버는 응답 지연과 403/5xx 오류를 주입할 수 있습니다.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from .config import get_config
+from ..models.news import canonical_article_key
+
+logger = logging.getLogger(__name__)
+
+# 아카이브 항목: (상태 코드, Content-Type, 본문)
+ArchiveEntry = Tuple[int, str, str]
+
+
+class HttpArchive:
+    """
+    요청/응답 아카이브 (gzip 압축 JSON Lines, 스레드 안전)
+
+    기록할 때는 파일을 한 번만 열어 두고 계속 이어 쓰며, close()에서 압축 스트림을 마무리합니다.
+    close() 전에는 마지막 기록들이 압축 버퍼에 남아 있으므로 다른 인스턴스로 읽기 전에 닫아야 합니다.
+    기록한 응답은 파일에만 쓰고 메모리에 두지 않으므로, lookup은 load()로 읽은 응답만 찾습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 아카이브 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ArchiveEntry] = {}
+        self._keys: Dict[str, str] = {}
+        self._writer = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> 'HttpArchive':
+        """아카이브 파일 읽기 (같은 URL은 마지막 기록 사용)"""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    self._add(record['url'], (record['status'], record.get('content_type', ''), record['body']))
+        logger.info(f"HTTP 아카이브 로드: {self.path} ({len(self._entries)}개 응답)")
+        return self
+
+    def _add(self, url: str, entry: ArchiveEntry):
+        self._entries[url] = entry
+        self._keys[canonical_article_key(url)] = url
+
+    def record(self, url: str, status: int, content_type: str, body: str):
+        """응답 한 건을 아카이브 파일에 추가 (긴 기록에서도 본문을 메모리에 쌓지 않음)"""
+        line = json.dumps({
+            'url': url,
+            'status': status,
+            'content_type': content_type,
+            'body': body,
+            'recorded_at': time.time()
+        }, ensure_ascii=False)
+
+        with self._lock:
+            if self._writer is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._writer = gzip.open(self.path, 'at', encoding='utf-8')
+            self._writer.write(line + '\n')
+
+    def close(self):
+        """열려 있는 기록 파일을 마무리하고 닫기 (다음 기록 시 다시 열어 이어 씀)"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def lookup(self, url: str) -> Optional[ArchiveEntry]:
+        """URL에 해당하는 응답 (같은 기사의 다른 URL 형태도 찾음)"""
+        entry = self._entries.get(url)
+        if entry is None:
+            original = self._keys.get(canonical_article_key(url))
+            if original is not None:
+                entry = self._entries[original]
+        return entry
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """아카이브 응답을 돌려주는 요청 핸들러"""
+
+    server: 'ReplayServer'
+
+    def do_GET(self):
+        query = urllib.parse.urlparse(self.path).query
+        original_url = urllib.parse.parse_qs(query).get('url', [''])[0]
+        status, content_type, body = self.server.respond(original_url)
+
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type or 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """아카이브를 제공하는 로컬 대역 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, archive: HttpArchive,
+                 latency_ms: float = 0,
+                 error_403_rate: float = 0.0,
+                 error_5xx_rate: float = 0.0,
+                 seed: int = 0):
+        """
+        Args:
+            archive: 재생할 아카이브
+            latency_ms: 응답마다 추가할 지연 시간(밀리초)
+            error_403_rate: 403 응답을 주입할 비율 (0~1)
+            error_5xx_rate: 503 응답을 주입할 비율 (0~1)
+            seed: 오류 주입용 난수 시드
+        """
+        super().__init__(('127.0.0.1', 0), _ReplayHandler)
+        self.archive = archive
+        self.latency = latency_ms / 1000.0
+        self.error_403_rate = error_403_rate
+        self.error_5xx_rate = error_5xx_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'requests': 0, 'not_found': 0, 'injected_403': 0, 'injected_5xx': 0}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def url_for(self, url: str) -> str:
+        """원래 URL을 재생 서버 URL로 변환"""
+        return f"{self.base_url}/replay?url={urllib.parse.quote(url, safe='')}"
+
+    def respond(self, url: str) -> ArchiveEntry:
+        """요청에 대한 응답 결정 (지연 및 오류 주입 포함)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            roll = self._random.random()
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if roll < self.error_403_rate:
+            with self._lock:
+                self.stats['injected_403'] += 1
+            return 403, 'text/html; charset=utf-8', 'Forbidden'
+        if roll < self.error_403_rate + self.error_5xx_rate:
+            with self._lock:
+                self.stats['injected_5xx'] += 1
+            return 503, 'text/html; charset=utf-8', 'Service Unavailable'
+
+        entry = self.archive.lookup(url)
+        if entry is None:
+            with self._lock:
+                self.stats['not_found'] += 1
+            logger.debug(f"아카이브에 없는 URL: {url}")
+            return 404, 'text/html; charset=utf-8', 'Not Found'
+        return entry
+
+    def start(self) -> 'ReplayServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True, name="replay-server")
+        self._thread.start()
+        logger.info(f"재생 서버 시작: {self.base_url} ({len(self.archive)}개 응답)")
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+
+
+# 글로벌 인스턴스
+_archive = None
+_replay_server = None
+_lock = threading.Lock()
+
+
+def get_http_archive() -> HttpArchive:
+    """기록 모드에서 사용할 아카이브 반환 (싱글톤)"""
+    global _archive
+
+    if _archive is None:
+        with _lock:
+            if _archive is None:
+                options = get_config().advanced.http_archive
+                _archive = HttpArchive(options.get('archive_path', 'data/http_archive.jsonl.gz'))
+    return _archive
+
+
+def get_replay_server() -> ReplayServer:
+    """
+    재생 모드에서 사용할 로컬 서버 반환 (싱글톤, 처음 호출 시 시작)
+
+    Raises:
+        FileNotFoundError: 아카이브 파일이 없는 경우
+    """
+    global _replay_server
+
+    if _replay_server is None:
+        with _lock:
+            if _replay_server is None:
+                # 같은 프로세스에서 기록한 응답도 읽을 수 있도록 기록 파일을 먼저 닫음
+                if _archive is not None:
+                    _archive.close()
+                options = get_config().advanced.http_archive
+                archive = HttpArchive(options.get('archive_path', 'data/http_archive.jsonl.gz')).load()
+                _replay_server = ReplayServer(
+                    archive,
+                    latency_ms=options.get('replay_latency_ms', 0),
+                    error_403_rate=options.get('replay_403_rate', 0.0),
+                    error_5xx_rate=options.get('replay_5xx_rate', 0.0),
+                    seed=options.get('replay_seed', 0)
+                ).start()
+    return _replay_server
+
+
+def close_http_archive():
+    """기록 중인 아카이브가 있으면 파일을 마무리하고 닫기"""
+    if _archive is not None:
+        _archive.close()
+
+
+def stop_replay_server():
+    """실행 중인 재생 서버 종료"""
+    global _replay_server
+    with _lock:
+        if _replay_server is not None:
+            _replay_server.stop()
+            _replay_server = None
+
+
+atexit.register(stop_replay_server)
+atexit.register(close_http_archive)
@@ -0,0 +1,291 @@
+"""
+실행 지표 모듈
+
+요청, 파싱, 대기, 세션, 파일 저장 등 단계별 소요 시간과 횟수를 수집하는
+가벼운 지표 저장소(카운터, 히스토그램, 타이머)를 제공합니다.
+실행이 끝나면 요약을 로그로 출력하고 Prometheus 텍스트 형식 파일로 내보낼 수 있습니다.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = 'naver_crawler_'
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 지표 식별자: (이름, 정렬된 라벨 목록)
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Counter:
+    """단조 증가 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """관측값 분포 (구간별 개수, 합계, 최댓값, 스레드 안전)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.bucket_counts[i] += 1
+                    break
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """구간 경계로 근사한 분위수"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = q * self.count
+            cumulative = 0
+            for bound, count in zip(self.buckets, self.bucket_counts):
+                cumulative += count
+                if cumulative >= target:
+                    return min(bound, self.max)
+            return self.max
+
+
+def _key(name: str, labels: Dict[str, str]) -> MetricKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ''
+    escaped = ['{}="{}"'.format(k, v.replace('\\', '\\\\').replace('"', '\\"')) for k, v in items]
+    return '{' + ','.join(escaped) + '}'
+
+
+class MetricsRegistry:
+    """이름과 라벨로 구분되는 지표 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._counters: Dict[MetricKey, Counter] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = '', **labels) -> Counter:
+        """카운터 반환 (없으면 생성)"""
+        key = _key(name, labels)
+        metric = self._counters.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(key, Counter())
+                if description:
+                    self._help.setdefault(name, description)
+        return metric
+
+    def histogram(self, name: str, description: str = '',
+                  buckets: Sequence[float] = DEFAULT_BUCKETS, **labels) -> Histogram:
+        """히스토그램 반환 (없으면 생성)"""
+        key = _key(name, labels)
+        metric = self._histograms.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(key, Histogram(buckets))
+                if description:
+                    self._help.setdefault(name, description)
+        return metric
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """블록 실행 시간(초)을 히스토그램에 기록"""
+        histogram = self.histogram(name, **labels)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    def reset(self):
+        """모든 지표 삭제"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _sorted_items(self, metrics: Dict[MetricKey, object]) -> List[Tuple[MetricKey, object]]:
+        with self._lock:
+            return sorted(metrics.items())
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        현재 값 요약
+
+        Returns:
+            "이름{라벨}" -> 카운터는 {'value'}, 히스토그램은 {'count', 'sum', 'mean', 'p50', 'p95', 'max'}
+        """
+        result = {}
+        for (name, labels), counter in self._sorted_items(self._counters):
+            result[name + _format_labels(labels)] = {'value': counter.value}
+        for (name, labels), histogram in self._sorted_items(self._histograms):
+            result[name + _format_labels(labels)] = {
+                'count': histogram.count,
+                'sum': histogram.sum,
+                'mean': histogram.mean,
+                'p50': histogram.quantile(0.5),
+                'p95': histogram.quantile(0.95),
+                'max': histogram.max,
+            }
+        return result
+
+    def summary(self) -> str:
+        """사람이 읽기 위한 여러 줄 요약"""
+        lines = []
+        for name, values in self.snapshot().items():
+            if 'value' in values:
+                lines.append(f"  {name}: {values['value']:g}")
+            else:
+                lines.append(
+                    f"  {name}: {values['count']}회, 합계 {values['sum']:.3f}초, "
+                    f"평균 {values['mean'] * 1000:.1f}ms, p95 {values['p95'] * 1000:.1f}ms, "
+                    f"최대 {values['max'] * 1000:.1f}ms"
+                )
+        return '\n'.join(lines)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        lines = []
+        described = set()
+
+        def describe(name: str, metric_type: str):
+            if name in described:
+                return
+            described.add(name)
+            if name in self._help:
+                lines.append(f"# HELP {METRIC_PREFIX}{name} {self._help[name]}")
+            lines.append(f"# TYPE {METRIC_PREFIX}{name} {metric_type}")
+
+        for (name, labels), counter in self._sorted_items(self._counters):
+            describe(name, 'counter')
+            lines.append(f"{METRIC_PREFIX}{name}{_format_labels(labels)} {counter.value:g}")
+
+        for (name, labels), histogram in self._sorted_items(self._histograms):
+            describe(name, 'histogram')
+            with histogram._lock:
+                bucket_counts = list(histogram.bucket_counts)
+                count, total = histogram.count, histogram.sum
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{METRIC_PREFIX}{name}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+            lines.append(f"{METRIC_PREFIX}{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {count}")
+            lines.append(f"{METRIC_PREFIX}{name}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{METRIC_PREFIX}{name}_count{_format_labels(labels)} {count}")
+
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def write_prometheus(self, path: str):
+        """Prometheus 텍스트 형식 파일로 저장 (원자적 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+# 글로벌 지표 저장소
+_registry = None
+_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """지표 저장소 반환 (싱글톤)"""
+    global _registry
+
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
+
+
+def timed(name: str, **labels):
+    """함수 실행 시간을 히스토그램에 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().timer(name, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def sleep(seconds: float, reason: str):
+    """대기 시간을 사유별로 기록하며 time.sleep"""
+    if seconds <= 0:
+        return
+    get_metrics().histogram('sleep_seconds', '사유별 대기 시간', reason=reason).observe(seconds)
+    time.sleep(seconds)
+
+
+async def async_sleep(seconds: float, reason: str):
+    """대기 시간을 사유별로 기록하며 asyncio.sleep"""
+    if seconds <= 0:
+        return
+    get_metrics().histogram('sleep_seconds', '사유별 대기 시간', reason=reason).observe(seconds)
+    await asyncio.sleep(seconds)
+
+
+def export_metrics():
+    """
+    설정(advanced.metrics)에 따라 지표 내보내기
+
+    log_summary가 켜져 있으면 요약을 로그로 출력하고,
+    prometheus_file이 지정되어 있으면 Prometheus 텍스트 형식 파일로 저장합니다.
+    """
+    if _registry is None:
+        return
+    options = get_config().advanced.metrics
+
+    if options.get('log_summary', True):
+        summary = _registry.summary()
+        if summary:
+            logger.info("실행 지표:\n" + summary)
+
+    path = options.get('prometheus_file', '')
+    if path:
+        try:
+            _registry.write_prometheus(path)
+            logger.info(f"지표 파일 저장: {path}")
+        except OSError as e:
+            logger.warning(f"지표 파일 저장 실패: {e}")
@@ -0,0 +1,158 @@
+"""
+유사 제목 탐지 모듈
+
+MinHash 서명과 LSH 밴딩으로 비슷한 기사 제목을 빠르게 찾습니다.
+통신사 기사를 조금씩 고쳐 쓴 재전송 기사처럼 제목이 거의 같은 기사를
+본문을 가져오기 전에 걸러내는 용도로 사용합니다.
+"""
+
+import logging
+import random
+import re
+import threading
+import zlib
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 비교 시 무시할 문자 (공백, 문장부호, 따옴표 등)
+_NORMALIZE_PATTERN = re.compile(r"[\s\W_]+", re.UNICODE)
+
+# MinHash 계산용 메르센 소수
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (공백/기호 제거, 소문자화)"""
+    return _NORMALIZE_PATTERN.sub('', title).lower()
+
+
+def shingle(text: str, size: int = 2) -> Set[str]:
+    """문자 n-gram 집합 생성"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH 기반 유사 제목 색인 (스레드 안전)
+
+    후보 쌍은 LSH 버킷으로 찾고, 최종 판정은 URLExtractor.is_similar_title과 같은
+    규칙(6자 이하 제목은 완전 일치, 그 외는 SequenceMatcher 비율 >= threshold)으로
+    후보에 대해서만 수행하므로 similarity_threshold의 의미가 유지됩니다.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128,
+                 bands: int = 32, ngram: int = 2, seed: int = 1):
+        """
+        Args:
+            threshold: 유사 판정 기준 (similarity_threshold와 동일한 의미)
+            num_perm: MinHash 순열 수
+            bands: LSH 밴드 수 (num_perm의 약수여야 함)
+            ngram: 문자 n-gram 크기
+            seed: 해시 계수 생성용 시드
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = ngram
+
+        rng = random.Random(seed)
+        self._coefficients: List[Tuple[int, int]] = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._titles: List[str] = []
+        self._keys: List[Optional[str]] = []
+        self._short_titles: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _signature(self, normalized: str) -> List[int]:
+        """MinHash 서명 계산"""
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingle(normalized, self.ngram)]
+        if not hashes:
+            return [0] * self.num_perm
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._coefficients
+        ]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        return [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _is_similar(self, title1: str, title2: str) -> bool:
+        """URLExtractor.is_similar_title과 같은 판정 규칙"""
+        if len(title1) <= 6 or len(title2) <= 6:
+            return title1 == title2
+        return SequenceMatcher(None, title1, title2).ratio() >= self.threshold
+
+    def _find_locked(self, title: str, band_keys: Optional[List[Tuple[int, ...]]]) -> Optional[int]:
+        if len(title) <= 6:
+            return self._short_titles.get(title)
+
+        checked: Set[int] = set()
+        for band, band_key in enumerate(band_keys):
+            for index in self._buckets[band].get(band_key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if self._is_similar(title, self._titles[index]):
+                    return index
+        return None
+
+    def find_similar(self, title: str) -> Optional[str]:
+        """
+        색인된 제목 중 유사한 제목의 키 반환
+
+        Returns:
+            유사한 제목의 키 (키 없이 추가된 경우 해당 제목), 없으면 None
+        """
+        if not title:
+            return None
+        band_keys = None if len(title) <= 6 else self._band_keys(self._signature(normalize_title(title)))
+        with self._lock:
+            index = self._find_locked(title, band_keys)
+            if index is None:
+                return None
+            return self._keys[index] or self._titles[index]
+
+    def add(self, title: str, key: Optional[str] = None) -> bool:
+        """
+        유사한 제목이 없으면 색인에 추가
+
+        Returns:
+            새로 추가되었으면 True, 이미 유사한 제목이 있으면 False
+        """
+        if not title:
+            return True
+
+        band_keys = None if len(title) <= 6 else self._band_keys(self._signature(normalize_title(title)))
+        with self._lock:
+            if self._find_locked(title, band_keys) is not None:
+                return False
+
+            index = len(self._titles)
+            self._titles.append(title)
+            self._keys.append(key)
+            if band_keys is None:
+                self._short_titles[title] = index
+            else:
+                for band, band_key in enumerate(band_keys):
+                    self._buckets[band][band_key].append(index)
+            return True
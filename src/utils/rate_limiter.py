@@ -0,0 +1,281 @@
+"""
+요청 속도 제한 모듈
+
+여러 작업자가 동시에 요청하더라도 전체 초당 요청 수를 일정 수준 이하로
+유지하기 위해 요청마다 전송 시각을 예약하는 속도 제한기를 제공합니다.
+모든 요청은 공용 HostRateLimiter에서 순서를 예약하므로, 호출 측마다 따로 대기하지 않아도
+호스트별 요청 간격과 전체 초당 요청 수가 함께 지켜집니다.
+프록시를 거치는 요청은 (프록시, 호스트) 단위로 간격을 지키므로 출구 IP가 늘어나면
+호스트별 처리량도 함께 늘어납니다.
+"""
+
+import bisect
+import logging
+import random
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+from . import metrics
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 예약 시각 비교 시 허용하는 오차(초)
+TIME_EPSILON = 1e-6
+
+
+class RateLimiter:
+    """
+    초당 요청 수 제한기 (스레드 및 asyncio 안전)
+
+    요청마다 전송 시각을 예약하며, burst / rate초 길이의 어느 구간에도 burst건을 넘는 전송이
+    예약되지 않도록 합니다. 나중 시각을 지정해 예약할 수도 있어서, 호스트 간격 때문에 뒤에
+    보낼 요청은 실제로 보낼 시각에 자리를 차지하고 그 사이의 빈 자리는 다른 요청이 사용합니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: burst / rate초 구간마다 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        # 예약된 전송 시각 (오름차순)
+        self._grants: List[float] = []
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float):
+        """초당 허용 요청 수 변경 (이미 예약된 전송 시각은 유지)"""
+        with self._lock:
+            self.rate = rate
+            if rate <= 0:
+                self._grants.clear()
+
+    def schedule(self, earliest: float) -> float:
+        """
+        earliest(time.monotonic 기준) 이후 가장 이른 전송 가능 시각을 예약 (대기하지 않음)
+
+        Returns:
+            예약한 전송 시각
+        """
+        if self.rate <= 0:
+            return earliest
+
+        with self._lock:
+            window = self.burst / self.rate
+            # 지금 이후의 예약에 영향을 주지 않는 지난 예약 정리
+            del self._grants[:bisect.bisect_left(self._grants, time.monotonic() - window)]
+
+            # 연속한 burst건의 예약과 함께 window 안에 들어가는 구간은 사용할 수 없음
+            grants = self._grants
+            blocked = [(grants[i + self.burst - 1] - window, grants[i] + window)
+                       for i in range(len(grants) - self.burst + 1)
+                       if grants[i + self.burst - 1] - grants[i] < window]
+            send_at = earliest
+            moved = True
+            while moved:
+                moved = False
+                for low, high in blocked:
+                    # 부동소수점 오차로 딱 맞는 빈 자리를 놓치지 않도록 경계는 조금 여유를 둠
+                    if low + TIME_EPSILON < send_at < high - TIME_EPSILON:
+                        send_at = high
+                        moved = True
+            bisect.insort(grants, send_at)
+            return send_at
+
+    def reserve(self, at: Optional[float] = None) -> float:
+        """
+        전송 시각 하나를 예약하고 기다려야 할 시간 계산 (대기하지 않음)
+
+        Args:
+            at: 이 시각(time.monotonic 기준) 이후로 예약 (None이면 지금)
+
+        Returns:
+            예약한 전송 시각까지 남은 시간(초)
+        """
+        now = time.monotonic()
+        return max(0.0, self.schedule(max(now, at or now)) - now)
+
+    def acquire(self) -> float:
+        """
+        전송 차례가 올 때까지 대기
+
+        Returns:
+            실제 대기한 시간(초)
+        """
+        wait_time = self.reserve()
+        metrics.sleep(wait_time, 'rate_limit')
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """전송 차례가 올 때까지 대기 (이벤트 루프를 막지 않음)"""
+        wait_time = self.reserve()
+        await metrics.async_sleep(wait_time, 'rate_limit')
+        return wait_time
+
+
+def host_of(url: str) -> str:
+    """URL의 호스트 이름 (소문자)"""
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+def jittered_interval(delay: float, jitter: float) -> Tuple[float, float]:
+    """기존 "delay + random.uniform(0, jitter)" 대기를 요청 간격 범위로 변환"""
+    return (delay, delay + jitter) if delay > 0 else (0.0, 0.0)
+
+
+class HostRateLimiter:
+    """
+    호스트별 요청 간격과 전체 초당 요청 수를 함께 적용하는 속도 제한기 (스레드 및 asyncio 안전)
+
+    같은 호스트에 대한 요청은 [최소, 최대] 간격 안의 임의 시간만큼 떨어지도록 다음 요청 시각을
+    예약하고, 모든 호스트의 요청은 전체 요청 수 제한기를 함께 사용합니다. 전체 제한은 호스트
+    순서가 돌아오는 시각 기준으로 예약하므로 어느 순간에도 허용된 속도를 넘지 않으며, 여러 작업자가
+    동시에 요청해도 각자 정해진 순서의 시각까지만 기다리므로 허용된 속도보다 더 쉬지 않습니다.
+    요청 간격은 호출마다 interval로 지정할 수 있고, 지정하지 않으면 호스트별 설정이나 기본값을 씁니다.
+    """
+
+    def __init__(self, min_interval: float = 0.0,
+                 max_interval: Optional[float] = None,
+                 global_rate: float = 0.0,
+                 burst: int = 1,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            min_interval: 같은 호스트 요청 사이의 최소 간격(초)
+            max_interval: 같은 호스트 요청 사이의 최대 간격(초, None이면 min_interval)
+            global_rate: 전체 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 전체 요청 수 제한의 몰아서 보내기 허용 수
+            seed: 간격 난수 시드
+        """
+        self._default = self._interval(min_interval, max_interval)
+        self._intervals: Dict[str, Tuple[float, float]] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._global = RateLimiter(global_rate, burst)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _interval(min_interval: float, max_interval: Optional[float]) -> Tuple[float, float]:
+        low = max(0.0, min_interval)
+        high = low if max_interval is None else max(low, max_interval)
+        return low, high
+
+    @property
+    def global_rate(self) -> float:
+        return self._global.rate
+
+    def set_global_rate(self, rate: float):
+        """전체 초당 허용 요청 수 변경"""
+        self._global.set_rate(rate)
+
+    def set_interval(self, min_interval: float, max_interval: Optional[float] = None,
+                     host: Optional[str] = None):
+        """
+        요청 간격 변경
+
+        Args:
+            min_interval: 최소 간격(초)
+            max_interval: 최대 간격(초, None이면 min_interval)
+            host: 적용할 호스트 (None이면 별도 설정이 없는 모든 호스트의 기본값)
+        """
+        interval = self._interval(min_interval, max_interval)
+        with self._lock:
+            if host is None:
+                self._default = interval
+            else:
+                self._intervals[host.lower()] = interval
+
+    def interval_for(self, host: str) -> Tuple[float, float]:
+        """호스트에 적용되는 (최소, 최대) 요청 간격"""
+        with self._lock:
+            return self._intervals.get(host.lower(), self._default)
+
+    def reserve(self, url: str, identity: Optional[str] = None,
+                interval: Optional[Tuple[float, float]] = None) -> float:
+        """
+        요청 순서를 예약하고 기다려야 할 시간 계산 (대기하지 않음)
+
+        Args:
+            url: 요청 URL
+            identity: 요청을 내보내는 출구 식별자 (프록시 URL 등, None이면 직접 연결)
+            interval: 이 요청 뒤 같은 호스트 요청까지의 (최소, 최대) 간격 (None이면 호스트 설정)
+
+        Returns:
+            예약한 요청 시각까지 남은 시간(초)
+        """
+        host = host_of(url)
+        key = host if identity is None else f"{identity}|{host}"
+        with self._lock:
+            now = time.monotonic()
+            low, high = interval if interval is not None else self._intervals.get(host, self._default)
+            slot = max(now, self._next_slot.get(key, now))
+            # 전체 요청 수 제한은 실제로 보낼 시각(호스트 순서) 기준으로 예약
+            send_at = self._global.schedule(slot)
+            gap = self._random.uniform(low, high) if high > low else low
+            self._next_slot[key] = send_at + gap
+        return send_at - now
+
+    def acquire(self, url: str, identity: Optional[str] = None,
+                interval: Optional[Tuple[float, float]] = None) -> float:
+        """
+        url로 요청을 보내도 될 때까지 대기
+
+        Returns:
+            실제 대기한 시간(초)
+        """
+        wait_time = self.reserve(url, identity, interval)
+        metrics.sleep(wait_time, 'rate_limit')
+        return wait_time
+
+    async def acquire_async(self, url: str, identity: Optional[str] = None,
+                            interval: Optional[Tuple[float, float]] = None) -> float:
+        """url로 요청을 보내도 될 때까지 대기 (이벤트 루프를 막지 않음)"""
+        wait_time = self.reserve(url, identity, interval)
+        await metrics.async_sleep(wait_time, 'rate_limit')
+        return wait_time
+
+
+def request_interval(delay: float, jitter: float = 0.0) -> Tuple[float, float]:
+    """
+    호출 측 요청 간격(delay + 0~jitter초)을 요청마다 넘길 (최소, 최대) 간격으로 변환
+
+    적응형 속도 조절(advanced.adaptive_pacing)을 사용하면 고정 간격 대신
+    조절기가 학습한 전체 요청 속도만 적용하도록 간격을 두지 않습니다.
+
+    Args:
+        delay: 요청 사이 최소 간격(초)
+        jitter: 간격에 더할 임의 시간의 최댓값(초)
+    """
+    if get_config().advanced.adaptive_pacing.get('enabled', False):
+        delay = 0
+    return jittered_interval(delay, jitter)
+
+
+# 글로벌 속도 제한기 인스턴스
+_rate_limiter = None
+_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    모든 요청이 공유하는 속도 제한기 반환 (싱글톤)
+
+    호스트별 기본 간격은 network.request_delay_min/max,
+    전체 초당 요청 수는 crawling.max_requests_per_second에서 읽습니다.
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _lock:
+            if _rate_limiter is None:
+                config = get_config()
+                _rate_limiter = HostRateLimiter(
+                    config.network.request_delay_min,
+                    config.network.request_delay_max,
+                    global_rate=config.crawling.max_requests_per_second
+                )
+    return _rate_limiter
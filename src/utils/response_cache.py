@@ -0,0 +1,247 @@
+"""
+HTTP 응답 캐시 모듈
+
+get_page_content가 받은 HTML을 압축해 디스크에 저장하고, 같은 페이지를 다시 요청하면
+네트워크 대신 디스크에서 읽습니다. 한 번 게시된 기사는 거의 바뀌지 않으므로
+기사 페이지는 길게, 검색 결과 페이지는 짧게 보관하며 전체 크기는 LRU 방식으로 제한합니다.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .config import get_config
+from ..models.news import canonical_article_key
+
+# zstd 압축 지원 (없으면 gzip 사용)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 머리말: 저장 시각 (double)
+_HEADER = struct.Struct('<d')
+_EXTENSIONS = {'zstd': '.zst', 'gzip': '.gz'}
+
+
+def cache_key(url: str) -> str:
+    """캐시 키 (기사 URL은 정규화된 기사 ID, 그 외에는 프래그먼트를 뗀 URL)"""
+    return canonical_article_key(url)
+
+
+def is_search_page(url: str) -> bool:
+    """검색 결과 페이지인지 확인"""
+    return 'search.naver.com' in url
+
+
+class ResponseCache:
+    """압축 디스크 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir: str,
+                 search_ttl: float = 600,
+                 article_ttl: float = 7 * 24 * 3600,
+                 max_size_bytes: int = 512 * 1024 * 1024,
+                 compression: str = 'zstd'):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            search_ttl: 검색 결과 페이지 보관 시간(초)
+            article_ttl: 기사 페이지 보관 시간(초)
+            max_size_bytes: 캐시 전체 최대 크기
+            compression: 압축 방식 ("zstd" 또는 "gzip", zstd 미설치 시 gzip)
+        """
+        self.cache_dir = cache_dir
+        self.search_ttl = search_ttl
+        self.article_ttl = article_ttl
+        self.max_size_bytes = max_size_bytes
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            compression = 'gzip'
+        self.compression = compression
+
+        self._lock = threading.Lock()
+        # 파일 이름 -> 크기 (앞쪽일수록 오래 사용하지 않은 항목)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'stores': 0, 'evictions': 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """디렉토리의 기존 캐시 파일을 마지막 사용 시각 순으로 색인"""
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and os.path.splitext(entry.name)[1] in _EXTENSIONS.values():
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_size += size
+        if files:
+            logger.info(f"응답 캐시 로드: {self.cache_dir} ({len(files)}개, {self._total_size / 1024 / 1024:.1f}MB)")
+
+    def _file_name(self, url: str, compression: str) -> str:
+        digest = hashlib.sha1(cache_key(url).encode('utf-8')).hexdigest()
+        return digest + _EXTENSIONS[compression]
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=3).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(name: str, data: bytes) -> Optional[bytes]:
+        if name.endswith(_EXTENSIONS['zstd']):
+            if not ZSTD_AVAILABLE:
+                return None
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def _remove_locked(self, name: str):
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_size -= size
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        캐시된 HTML 반환
+
+        Returns:
+            유효 기간 안의 HTML, 없거나 만료되었으면 None
+        """
+        ttl = self.search_ttl if is_search_page(url) else self.article_ttl
+        with self._lock:
+            for compression in _EXTENSIONS:
+                name = self._file_name(url, compression)
+                if name in self._entries:
+                    break
+            else:
+                self._stats['misses'] += 1
+                return None
+
+        # 파일 읽기와 압축 해제는 잠금 밖에서 수행
+        path = os.path.join(self.cache_dir, name)
+        expired = False
+        body = None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            (stored_at,) = _HEADER.unpack_from(data)
+            if time.time() - stored_at > ttl:
+                expired = True
+            else:
+                body = self._decompress(name, data[_HEADER.size:])
+        except (OSError, struct.error, EOFError, ValueError) as e:
+            logger.debug(f"캐시 파일 읽기 실패 ({name}): {e}")
+
+        with self._lock:
+            if body is None:
+                if expired:
+                    self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                self._remove_locked(name)
+                return None
+
+            # 최근 사용 표시 (다음 실행의 LRU 순서에도 반영)
+            if name in self._entries:
+                self._entries.move_to_end(name)
+            self._stats['hits'] += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return body.decode('utf-8')
+
+    def put(self, url: str, html: str):
+        """HTML 저장 (최대 크기를 넘으면 오래 사용하지 않은 항목부터 삭제)"""
+        data = _HEADER.pack(time.time()) + self._compress(html.encode('utf-8'))
+        name = self._file_name(url, self.compression)
+        path = os.path.join(self.cache_dir, name)
+
+        try:
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"응답 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            old_size = self._entries.pop(name, None)
+            if old_size is not None:
+                self._total_size -= old_size
+            self._entries[name] = len(data)
+            self._total_size += len(data)
+            self._stats['stores'] += 1
+
+            while self._total_size > self.max_size_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self._stats['evictions'] += 1
+
+    def stats(self) -> Dict[str, float]:
+        """적중/실패 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['size_bytes'] = self._total_size
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+# 글로벌 캐시 인스턴스
+_response_cache = None
+_cache_initialized = False
+_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    설정(advanced.http_cache)에 따른 응답 캐시 반환 (싱글톤)
+
+    캐시가 비활성화되어 있으면 None을 반환합니다.
+    """
+    global _response_cache, _cache_initialized
+
+    if not _cache_initialized:
+        with _lock:
+            if not _cache_initialized:
+                options = get_config().advanced.http_cache
+                if options.get('enabled', False):
+                    _response_cache = ResponseCache(
+                        options.get('cache_dir', 'data/http_cache'),
+                        search_ttl=options.get('search_ttl_seconds', 600),
+                        article_ttl=options.get('article_ttl_seconds', 7 * 24 * 3600),
+                        max_size_bytes=int(options.get('max_size_mb', 512) * 1024 * 1024),
+                        compression=options.get('compression', 'zstd')
+                    )
+                _cache_initialized = True
+
+    return _response_cache
+
+
+def log_cache_stats():
+    """사용 중인 캐시가 있으면 적중 통계를 로그로 출력"""
+    if _response_cache is not None:
+        stats = _response_cache.stats()
+        logger.info(
+            f"응답 캐시: 적중 {stats['hits']}회, 실패 {stats['misses']}회 "
+            f"(적중률 {stats['hit_rate']:.1%}, {stats['entries']}개, "
+            f"{stats['size_bytes'] / 1024 / 1024:.1f}MB)"
+        )
@@ -0,0 +1,215 @@
+"""
+수집 기사 영구 저장소 모듈
+
+이전 실행에서 이미 추출한 기사를 다시 가져오지 않도록 기사 ID와 본문 해시를
+SQLite(WAL 모드)에 기록합니다. 대부분의 조회는 "처음 보는 기사"이므로
+메모리 내 블룸 필터로 먼저 걸러 DB 조회를 최소화합니다.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """간단한 블룸 필터 (오탐 가능, 미탐 없음)"""
+
+    def __init__(self, expected_items: int = 100000, false_positive_rate: float = 0.01):
+        expected_items = max(1, expected_items)
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / expected_items * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        """이중 해싱으로 비트 위치 계산"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def content_hash(text: str) -> str:
+    """공백을 정규화한 본문 해시"""
+    normalized = ' '.join(text.split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class SeenArticleStore:
+    """기사 ID/본문 해시 영구 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str, batch_size: int = 100,
+                 expected_items: int = 100000):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            batch_size: 한 번에 모아서 기록할 항목 수
+            expected_items: 블룸 필터 크기 산정용 예상 항목 수
+        """
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Optional[str], str]] = []
+        self._pending_ids = set()
+        self._pending_hashes = set()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_articles ("
+            "article_id TEXT PRIMARY KEY, "
+            "content_hash TEXT, "
+            "first_seen TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_articles_hash ON seen_articles(content_hash)"
+        )
+        self._conn.commit()
+
+        # 기존 기록으로 블룸 필터 채우기
+        count = self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+        self._id_filter = BloomFilter(max(expected_items, count * 2))
+        self._hash_filter = BloomFilter(max(expected_items, count * 2))
+        for article_id, hash_value in self._conn.execute(
+                "SELECT article_id, content_hash FROM seen_articles"):
+            self._id_filter.add(article_id)
+            if hash_value:
+                self._hash_filter.add(hash_value)
+
+        logger.info(f"수집 기록 저장소 로드: {db_path} ({count}개 기사)")
+
+    def contains(self, article_id: str) -> bool:
+        """이전에 기록된 기사인지 확인"""
+        with self._lock:
+            if article_id not in self._id_filter:
+                return False
+            if article_id in self._pending_ids:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_articles WHERE article_id = ?", (article_id,)
+            ).fetchone()
+            return row is not None
+
+    def has_content_hash(self, hash_value: str) -> bool:
+        """같은 본문 해시가 기록되어 있는지 확인"""
+        with self._lock:
+            if hash_value not in self._hash_filter:
+                return False
+            if hash_value in self._pending_hashes:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_articles WHERE content_hash = ? LIMIT 1", (hash_value,)
+            ).fetchone()
+            return row is not None
+
+    def add(self, article_id: str, hash_value: Optional[str] = None):
+        """기사 기록 추가 (batch_size마다 일괄 기록)"""
+        with self._lock:
+            self._id_filter.add(article_id)
+            self._pending_ids.add(article_id)
+            if hash_value:
+                self._hash_filter.add(hash_value)
+                self._pending_hashes.add(hash_value)
+            self._pending.append((article_id, hash_value, datetime.now().isoformat()))
+
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def record_article(self, article, use_content_hash: bool = False) -> bool:
+        """
+        추출한 기사 기록
+
+        Args:
+            article: 추출된 NewsArticle
+            use_content_hash: 본문 해시로 다른 ID의 동일 본문 기사도 걸러낼지 여부
+    
+        Returns:
+            새 기사이면 True, 이미 기록된 본문과 같은 기사이면 False
+        """
+        hash_value = None
+        if use_content_hash and article.content:
+            hash_value = content_hash(article.content)
+            if self.has_content_hash(hash_value):
+                self.add(article.key)
+                return False
+
+        self.add(article.key, hash_value)
+        return True
+
+    def flush(self):
+        """대기 중인 기록을 DB에 저장"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen_articles (article_id, content_hash, first_seen) "
+            "VALUES (?, ?, ?)",
+            self._pending
+        )
+        self._conn.commit()
+        logger.debug(f"수집 기록 {len(self._pending)}개 저장")
+        self._pending = []
+        self._pending_ids = set()
+        self._pending_hashes = set()
+
+    def close(self):
+        """대기 중인 기록을 저장하고 연결 종료"""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+# 글로벌 저장소 인스턴스
+_seen_store = None
+_store_initialized = False
+_lock = threading.Lock()
+
+
+def get_seen_store() -> Optional[SeenArticleStore]:
+    """
+    설정(advanced.duplicate_management)에 따른 저장소 인스턴스 반환 (싱글톤)
+
+    영구 저장이 비활성화되어 있으면 None을 반환합니다.
+    """
+    global _seen_store, _store_initialized
+
+    if not _store_initialized:
+        with _lock:
+            if not _store_initialized:
+                options = get_config().advanced.duplicate_management
+                if options.get('enable_persistent_storage', False):
+                    storage_type = options.get('storage_type', 'sqlite')
+                    if storage_type == 'sqlite':
+                        _seen_store = SeenArticleStore(
+                            options.get('db_path', 'data/seen_articles.db'),
+                            batch_size=options.get('batch_size', 100)
+                        )
+                    else:
+                        logger.warning(f"지원하지 않는 저장소 유형: {storage_type}")
+                _store_initialized = True
+
+    return _seen_store
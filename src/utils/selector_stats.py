@@ -0,0 +1,231 @@
+"""
+선택자 적중 통계 모듈
+
+언론사(oid)별로 어떤 CSS 선택자가 실제로 값을 찾았는지 기록하고,
+자주 적중한 선택자를 먼저 시도하도록 후보 순서를 바꿉니다.
+학습한 통계는 JSON 파일로 저장해 다음 실행에서도 사용합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 선택자 적중 기록 한 건 (항목, 언론사 ID, 선택자, 평가 횟수)
+SelectorHit = Tuple[str, Optional[str], Optional[str], int]
+
+
+class SelectorStats:
+    """언론사별 선택자 적중 통계 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None, min_samples: int = 3,
+                 counts: Optional[Dict[str, Dict[str, Dict[str, int]]]] = None,
+                 journal: bool = False):
+        """
+        Args:
+            path: 통계 저장 파일 경로 (None이면 저장하지 않음)
+            min_samples: 순서를 바꾸기 전에 필요한 최소 적중 수
+            counts: 시작 적중 수 (snapshot 형식, 파일 대신 사용)
+            journal: 적중 기록을 drain_journal로 꺼낼 수 있게 모아 둘지 여부
+        """
+        self.path = path
+        self.min_samples = max(1, min_samples)
+        # oid -> 항목(title, content 등) -> 선택자 -> 적중 수
+        self._counts: Dict[str, Dict[str, Dict[str, int]]] = counts or {}
+        self._lookups = 0
+        self._evaluations = 0
+        self._dirty = False
+        self._journal: Optional[List[SelectorHit]] = [] if journal else None
+        self._lock = threading.Lock()
+
+        if path:
+            self.load()
+
+    def load(self):
+        """저장된 통계 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._counts = data.get('counts', {})
+            logger.info(f"선택자 통계 로드: {self.path} ({len(self._counts)}개 언론사)")
+        except (OSError, ValueError) as e:
+            logger.warning(f"선택자 통계 로드 실패: {e}")
+
+    def save(self):
+        """변경된 통계를 파일에 저장"""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {'counts': self._counts}
+            self._dirty = False
+
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.path)
+                logger.debug(f"선택자 통계 저장: {self.path}")
+            except OSError as e:
+                self._dirty = True
+                logger.warning(f"선택자 통계 저장 실패: {e}")
+
+    def ordered(self, field: str, oid: Optional[str], candidates: Sequence[T]) -> Sequence[T]:
+        """
+        적중 수가 많은 선택자부터 후보 정렬
+
+        Args:
+            field: 추출 항목 이름 (title, content 등)
+            oid: 언론사 ID (없으면 설정 순서 유지)
+            candidates: 첫 요소가 선택자 문자열인 튜플 목록
+
+        Returns:
+            정렬된 후보 (적중 수가 같으면 설정 순서 유지)
+        """
+        if not oid or len(candidates) < 2:
+            return candidates
+        with self._lock:
+            counts = self._counts.get(oid, {}).get(field)
+            if not counts or sum(counts.values()) < self.min_samples:
+                return candidates
+            return sorted(candidates, key=lambda c: -counts.get(c[0], 0))
+
+    def record(self, field: str, oid: Optional[str], selector: Optional[str], evaluations: int):
+        """
+        선택자 적중 기록
+
+        Args:
+            field: 추출 항목 이름
+            oid: 언론사 ID
+            selector: 값을 찾은 선택자 (찾지 못했으면 None)
+            evaluations: 이번 추출에서 평가한 선택자 수
+        """
+        with self._lock:
+            self._lookups += 1
+            self._evaluations += evaluations
+            if self._journal is not None:
+                self._journal.append((field, oid, selector, evaluations))
+            if not oid or not selector:
+                return
+            field_counts = self._counts.setdefault(oid, {}).setdefault(field, {})
+            field_counts[selector] = field_counts.get(selector, 0) + 1
+            self._dirty = True
+
+    def drain_journal(self) -> List[SelectorHit]:
+        """마지막으로 꺼낸 뒤 쌓인 적중 기록을 꺼냄 (journal=True일 때만 기록됨)"""
+        with self._lock:
+            if not self._journal:
+                return []
+            hits, self._journal = self._journal, []
+            return hits
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """전체 적중 수 (복사본)"""
+        with self._lock:
+            return {oid: {field: dict(counts) for field, counts in fields.items()}
+                    for oid, fields in self._counts.items()}
+
+    def average_evaluations(self) -> float:
+        """항목당 평균 선택자 평가 횟수"""
+        with self._lock:
+            return self._evaluations / self._lookups if self._lookups else 0.0
+
+    def hit_counts(self, oid: str) -> Dict[str, Dict[str, int]]:
+        """언론사별 적중 수 (복사본)"""
+        with self._lock:
+            return {field: dict(counts) for field, counts in self._counts.get(oid, {}).items()}
+
+
+# 글로벌 통계 인스턴스
+_selector_stats = None
+_lock = threading.Lock()
+
+
+def get_selector_stats() -> Optional[SelectorStats]:
+    """
+    설정(extraction.adaptive_selectors)에 따른 통계 인스턴스 반환 (싱글톤)
+
+    적응형 선택자 순서가 비활성화되어 있으면 None을 반환합니다.
+    """
+    global _selector_stats
+
+    extraction = get_config().extraction
+    if not extraction.adaptive_selectors:
+        return None
+
+    if _selector_stats is None:
+        with _lock:
+            if _selector_stats is None:
+                _selector_stats = SelectorStats(extraction.selector_stats_file)
+    return _selector_stats
+
+
+def install_worker_stats(counts: Dict[str, Dict[str, Dict[str, int]]]) -> SelectorStats:
+    """
+    파싱 프로세스용 통계 설치
+
+    부모 프로세스의 적중 수로 시작하고 파일에는 저장하지 않으며, 적중 기록은 모아 두었다가
+    결과와 함께 부모 프로세스로 돌려보내 부모의 통계에 반영합니다.
+    """
+    global _selector_stats
+
+    with _lock:
+        _selector_stats = SelectorStats(None, counts=counts, journal=True)
+    return _selector_stats
+
+
+def save_selector_stats():
+    """사용 중인 통계가 있으면 저장"""
+    if _selector_stats is not None:
+        _selector_stats.save()
+
+
+def oid_from_article_id(article_id: Optional[str]) -> Optional[str]:
+    """정규화된 기사 ID("{oid}/{aid}")에서 언론사 ID 추출"""
+    return article_id.split('/', 1)[0] if article_id else None
+
+
+
+def first_match(candidates: Sequence[T], probe: Callable[[T], Any],
+                stats: Optional[SelectorStats] = None,
+                field: Optional[str] = None, oid: Optional[str] = None) -> Any:
+    """
+    후보 선택자를 차례로 시도해 처음 얻은 값 반환
+
+    Args:
+        candidates: 첫 요소가 선택자 문자열인 튜플 목록
+        probe: 후보로 값을 찾아 반환하는 함수 (찾지 못하면 None)
+        stats: 선택자 통계 (있으면 순서 조정 및 적중 기록)
+        field: 추출 항목 이름
+        oid: 언론사 ID
+    """
+    if stats is None:
+        for candidate in candidates:
+            value = probe(candidate)
+            if value is not None:
+                return value
+        return None
+
+    evaluations = 0
+    for candidate in stats.ordered(field, oid, candidates):
+        evaluations += 1
+        value = probe(candidate)
+        if value is not None:
+            stats.record(field, oid, candidate[0], evaluations)
+            return value
+    stats.record(field, oid, None, evaluations)
+    return None
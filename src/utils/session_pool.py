@@ -2,24 +2,55 @@
 세션 풀 관리 모듈
 
 403 오류 대응을 위한 세션 풀 관리 기능을 제공합니다.
+세션은 처음 요청할 때 하나만 바로 만들고, 나머지 세션의 예열(네이버 메인 방문)은
+백그라운드에서 동시에 진행하므로 첫 검색 요청 전에는 한 번의 왕복만 기다립니다.
+세션별 쿠키, User-Agent, 상태는 파일에 저장했다가 다음 실행에서 복원하므로
+쿠키가 만료되었거나 차단된 세션만 다시 예열합니다.
+세션은 최근 성공률, 응답 시간, 쉰 시간으로 매긴 점수가 높은 순서로 선택합니다.
+프록시 로테이션을 사용하면 각 세션을 프록시 풀의 프록시 하나에 연결하고,
+연결된 프록시가 격리되면 다른 프록시로 옮겨 연결합니다.
 """
 
-import time
+import heapq
+import json
+import os
 import random
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import threading
+import time
 
 import requests
 
+from . import metrics
+from .config import get_config
+from .proxy_pool import ProxyPool, bind_proxy, get_proxy_pool
+from .rate_limiter import get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+]
+
+# 세션 성공률/응답 시간 지수 이동 평균의 최근 응답 가중치
+HEALTH_DECAY = 0.2
+
+# 모든 프록시가 격리 중일 때 세션 생성을 다시 시도하기까지 최소 대기 시간(초)
+PROXY_RETRY_SECONDS = 0.1
+
+
+class SessionUnavailableError(requests.RequestException):
+    """준비된 세션이 없고 새 세션도 만들지 못한 경우 (요청 오류와 같이 재시도 대상)"""
+
 
 class SessionInfo:
     """세션 정보 클래스"""
     
-    def __init__(self, session: requests.Session, session_id: int):
+    def __init__(self, session: Optional[requests.Session], session_id: int):
         self.session = session
         self.session_id = session_id
         self.created_at = datetime.now()
@@ -29,14 +60,29 @@ class SessionInfo:
         self.last_error = None
         self.is_blocked = False
         self.blocked_until = None
+        # 최근 응답 기준 성공률과 평균 응답 시간 (지수 이동 평균)
+        self.success_rate = 1.0
+        self.avg_latency = 0.0
+        # 교체 세션을 만드는 중이면 True (중복 교체 방지)
+        self.replacing = False
+        # 연결된 프록시 URL (프록시 로테이션 미사용 시 None)
+        self.proxy: Optional[str] = None
     
     def mark_used(self):
         """세션 사용 표시"""
         self.last_used = datetime.now()
         self.request_count += 1
     
-    def mark_error(self, error_code: int = None):
-        """에러 발생 표시"""
+    def mark_error(self, error_code: int = None,
+                   cooldown_seconds: float = 300, max_cooldown_seconds: float = 1800):
+        """
+        에러 발생 표시
+        
+        Args:
+            error_code: HTTP 상태 코드
+            cooldown_seconds: 403 한 번당 차단(냉각) 시간(초, 에러 횟수만큼 늘어남)
+            max_cooldown_seconds: 차단 시간 상한(초)
+        """
         self.error_count += 1
         self.last_error = error_code
         
@@ -44,12 +90,40 @@ class SessionInfo:
         if error_code == 403:
             self.is_blocked = True
             # 에러 횟수에 따라 차단 시간 증가
-            block_minutes = min(self.error_count * 5, 30)  # 최대 30분
-            self.blocked_until = datetime.now() + timedelta(minutes=block_minutes)
-            logger.warning(f"세션 {self.session_id} 차단됨 ({block_minutes}분)")
+            block_seconds = min(self.error_count * cooldown_seconds, max_cooldown_seconds)
+            self.blocked_until = datetime.now() + timedelta(seconds=block_seconds)
+            logger.warning(f"세션 {self.session_id} 차단됨 ({block_seconds:.0f}초)")
+    
+    def record_result(self, ok: bool, latency: Optional[float] = None):
+        """응답 결과를 성공률과 평균 응답 시간에 반영"""
+        self.success_rate += HEALTH_DECAY * ((1.0 if ok else 0.0) - self.success_rate)
+        if latency is not None:
+            if self.avg_latency == 0:
+                self.avg_latency = latency
+            else:
+                self.avg_latency += HEALTH_DECAY * (latency - self.avg_latency)
+    
+    def health_score(self, idle_seconds: float, idle_reference: float,
+                     latency_reference: float) -> float:
+        """
+        세션 선택 점수 (높을수록 우선)
+        
+        최근 성공률을 기본으로, 응답이 latency_reference초에 가까울수록 최대 0.3점을 빼고
+        idle_reference초 동안 쉬었으면 최대 0.2점을 더합니다.
+        """
+        latency_penalty = 0.3 * min(self.avg_latency / latency_reference, 1.0) if latency_reference > 0 else 0.0
+        idle_bonus = 0.2 * min(idle_seconds / idle_reference, 1.0)
+        return self.success_rate - latency_penalty + idle_bonus
+    
+    @property
+    def is_ready(self) -> bool:
+        """세션 생성(예열) 완료 여부"""
+        return self.session is not None
     
     def is_available(self) -> bool:
         """세션 사용 가능 여부"""
+        if not self.is_ready:
+            return False
         if not self.is_blocked:
             return True
         
@@ -61,95 +135,513 @@ class SessionInfo:
             return True
         
         return False
+    
+    def to_snapshot(self) -> Dict[str, Any]:
+        """파일 저장용 세션 상태 (쿠키, User-Agent, 상태)"""
+        cookies = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expires': cookie.expires,
+                'secure': cookie.secure
+            }
+            for cookie in self.session.cookies
+        ]
+        return {
+            'session_id': self.session_id,
+            'user_agent': self.session.headers.get('User-Agent'),
+            'proxy': self.proxy,
+            'cookies': cookies,
+            'created_at': self.created_at.isoformat(),
+            'request_count': self.request_count,
+            'error_count': self.error_count,
+            'last_error': self.last_error,
+            'success_rate': self.success_rate,
+            'avg_latency': self.avg_latency,
+            'is_blocked': self.is_blocked,
+            'blocked_until': self.blocked_until.isoformat() if self.blocked_until else None
+        }
 
 
 class SessionPool:
     """세션 풀 관리 클래스"""
     
-    def __init__(self, max_sessions: int = 3):
+    def __init__(self, max_sessions: int = 3,
+                 snapshot_file: Optional[str] = None,
+                 snapshot_max_age: timedelta = timedelta(hours=24),
+                 latency_reference: float = 3.0,
+                 proxy_pool: Optional[ProxyPool] = None,
+                 cooldown_seconds: float = 300,
+                 max_cooldown_seconds: float = 1800,
+                 allow_direct_fallback: bool = False):
+        """
+        Args:
+            max_sessions: 세션 수
+            snapshot_file: 세션 상태 저장 파일 (None이면 저장/복원하지 않음)
+            snapshot_max_age: 이보다 오래된 저장 상태는 복원하지 않음
+            latency_reference: 선택 점수에서 최대 감점을 받는 평균 응답 시간(초)
+            proxy_pool: 세션을 연결할 프록시 풀 (None이면 프록시 없이 직접 연결)
+            cooldown_seconds: 403을 받은 세션의 냉각 시간(초, 반복될수록 늘어남)
+            max_cooldown_seconds: 세션 냉각 시간 상한(초)
+            allow_direct_fallback: 모든 프록시가 격리 중일 때 프록시 없이 직접 연결할지 여부
+                (False면 격리가 풀릴 때까지 세션 생성/교체를 미룸)
+        """
         self.max_sessions = max_sessions
-        self.sessions: List[SessionInfo] = []
-        self.current_index = 0
+        self.proxy_pool = proxy_pool
+        self.allow_direct_fallback = allow_direct_fallback
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.snapshot_file = snapshot_file
+        self.snapshot_max_age = snapshot_max_age
+        self.latency_reference = latency_reference
+        # 세션 자리만 먼저 만들고 실제 세션은 첫 사용 시 생성 (네트워크 요청 없음)
+        self.sessions: List[SessionInfo] = [SessionInfo(None, i) for i in range(max_sessions)]
+        # id(requests.Session) → SessionInfo (오류 마킹 시 선형 탐색 대신 사용)
+        self._by_session: Dict[int, SessionInfo] = {}
+        # 세션 하나가 연속 요청 사이에 쉬는 최소 시간 (적응형 속도 조절기가 설정)
+        self.min_session_interval = timedelta(0)
         self.lock = threading.Lock()
-        self._create_initial_sessions()
-    
-    def _create_initial_sessions(self):
-        """초기 세션들 생성"""
-        for i in range(self.max_sessions):
-            session = self._create_session(i)
-            session_info = SessionInfo(session, i)
-            self.sessions.append(session_info)
-            logger.debug(f"세션 {i} 생성됨")
-    
-    def _create_session(self, session_id: int) -> requests.Session:
-        """새 세션 생성"""
-        session = requests.Session()
+        self._started = False
+        self._start_lock = threading.Lock()
+        self._warmup_threads: List[threading.Thread] = []
         
-        # 기본 헤더 설정
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
-        ]
+        if snapshot_file:
+            self.load_snapshot()
+    
+    def load_snapshot(self) -> int:
+        """
+        저장된 세션 상태 복원 (네트워크 요청 없음)
+        
+        저장 시각이 snapshot_max_age보다 오래되었거나, 차단 중이었거나,
+        유효한 쿠키가 남지 않은 세션은 복원하지 않고 첫 사용 시 새로 예열합니다.
+        
+        Returns:
+            복원한 세션 수
+        """
+        if not self.snapshot_file or not os.path.exists(self.snapshot_file):
+            return 0
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            saved_at = datetime.fromisoformat(data['saved_at'])
+            entries = data['sessions']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"세션 상태 로드 실패: {e}")
+            return 0
+        
+        if datetime.now() - saved_at > self.snapshot_max_age:
+            logger.info(f"저장된 세션 상태가 오래되어 새로 예열합니다 ({saved_at:%Y-%m-%d %H:%M})")
+            return 0
+        
+        restored = 0
+        now = time.time()
+        for entry in entries:
+            try:
+                session_id = int(entry['session_id'])
+                if not 0 <= session_id < self.max_sessions or entry.get('is_blocked'):
+                    continue
+                cookies = [c for c in entry.get('cookies', [])
+                           if c.get('expires') is None or c['expires'] > now]
+                if not cookies:
+                    continue
+                
+                session = self._new_session(entry.get('user_agent'))
+                for cookie in cookies:
+                    session.cookies.set(
+                        cookie['name'], cookie['value'],
+                        domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                        expires=cookie.get('expires'), secure=cookie.get('secure', False)
+                    )
+                session_info = SessionInfo(session, session_id)
+                session_info.created_at = datetime.fromisoformat(entry['created_at'])
+                session_info.request_count = int(entry.get('request_count', 0))
+                session_info.error_count = int(entry.get('error_count', 0))
+                session_info.last_error = entry.get('last_error')
+                session_info.success_rate = float(entry.get('success_rate', 1.0))
+                session_info.avg_latency = float(entry.get('avg_latency', 0.0))
+                # 저장 당시 프록시가 아직 쓸 수 있으면 같은 프록시에 다시 연결 (쿠키와 IP 유지)
+                if self.proxy_pool is not None:
+                    proxy = self.proxy_pool.assign(preferred=entry.get('proxy'))
+                    if proxy is None:
+                        continue
+                    bind_proxy(session, proxy)
+                    session_info.proxy = proxy
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"세션 상태 항목 무시: {e}")
+                continue
+            self.sessions[session_id] = session_info
+            self._by_session[id(session)] = session_info
+            restored += 1
+        
+        if restored:
+            metrics.get_metrics().counter('sessions_restored_total', '저장된 상태에서 복원한 세션 수').inc(restored)
+            logger.info(f"저장된 세션 {restored}/{self.max_sessions}개 복원 ({self.snapshot_file})")
+        return restored
+    
+    def save_snapshot(self):
+        """준비된 세션들의 쿠키, User-Agent, 상태를 파일에 저장"""
+        if not self.snapshot_file:
+            return
+        with self.lock:
+            data = {
+                'saved_at': datetime.now().isoformat(),
+                'sessions': [s.to_snapshot() for s in self.sessions if s.is_ready]
+            }
+        try:
+            directory = os.path.dirname(self.snapshot_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.snapshot_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.snapshot_file)
+            logger.debug(f"세션 상태 저장: {self.snapshot_file}")
+        except OSError as e:
+            logger.warning(f"세션 상태 저장 실패: {e}")
+    
+    def _ensure_started(self):
+        """
+        첫 사용 시 준비되지 않은 세션 예열 시작
+        
+        복원된 세션이 하나도 없으면 세션 하나만 바로 만들고,
+        나머지는 백그라운드에서 동시에 예열합니다.
+        """
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            pending = [s.session_id for s in self.sessions if not s.is_ready]
+            if len(pending) == self.max_sessions:
+                self._install_session(pending.pop(0))
+            for i in pending:
+                self._start_background(self._install_session, i, name=f"session-warmup-{i}")
+            self._started = True
+    
+    def _start_background(self, target, *args, name: str):
+        """세션 예열/교체를 백그라운드 스레드에서 시작 (wait_until_ready가 끝날 때까지 기다림)"""
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        with self.lock:
+            self._warmup_threads = [t for t in self._warmup_threads if t.is_alive()]
+            thread.start()
+            self._warmup_threads.append(thread)
+    
+    def _install_session(self, index: int) -> bool:
+        """
+        세션을 생성해 풀의 자리에 채움
+        
+        모든 프록시가 격리 중이면(직접 연결을 허용하지 않는 한) 격리가 풀릴 때까지 기다린 뒤 생성합니다.
+        
+        Returns:
+            자리에 세션이 채워졌는지 여부 (다른 스레드가 먼저 채운 경우 포함)
+        """
+        available, proxy = self._assign_proxy()
+        while not available:
+            with self.lock:
+                if self.sessions[index].session is not None:
+                    return True
+            wait_time = max(self.proxy_pool.next_available_in(), PROXY_RETRY_SECONDS)
+            logger.info(f"사용할 수 있는 프록시가 없어 세션 {index} 생성을 {wait_time:.1f}초 미룹니다")
+            metrics.sleep(wait_time, 'proxy_quarantine')
+            available, proxy = self._assign_proxy()
+        try:
+            session = self._create_session(index, proxy)
+        except Exception as e:
+            logger.warning(f"세션 {index} 생성 실패: {e}")
+            self._release_proxy(proxy)
+            return False
+        if proxy is not None:
+            bind_proxy(session, proxy)
+        with self.lock:
+            session_info = self.sessions[index]
+            if session_info.session is not None:
+                # 예열 스레드와 get_session이 같은 자리를 동시에 채운 경우 먼저 채운 세션 유지
+                filled = True
+            else:
+                filled = False
+                session_info.session = session
+                session_info.proxy = proxy
+                session_info.created_at = datetime.now()
+                self._by_session[id(session)] = session_info
+        if filled:
+            self._release_proxy(proxy)
+            return True
+        logger.debug(f"세션 {index} 생성됨")
+        return True
+    
+    def _assign_proxy(self, previous: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        새로 만들거나 옮길 세션에 연결할 프록시 선택
+        
+        Args:
+            previous: 세션에 연결되어 있던 프록시 (연결 수를 옮김)
+        
+        Returns:
+            (연결할 수 있는지 여부, 연결할 프록시). 프록시 풀이 없으면 (True, None),
+            모든 프록시가 격리 중이면 allow_direct_fallback일 때만 (True, None), 아니면 (False, None)
+        """
+        if self.proxy_pool is None:
+            return True, None
+        proxy = self.proxy_pool.assign(previous=previous)
+        if proxy is not None:
+            return True, proxy
+        if not self.allow_direct_fallback:
+            return False, None
+        self.proxy_pool.release(previous)
+        metrics.get_metrics().counter('session_direct_fallback_total',
+                                      '프록시가 모두 격리되어 직접 연결한 세션 수').inc()
+        return True, None
+    
+    def _release_proxy(self, proxy: Optional[str]):
+        """쓰지 않게 된 프록시 연결 해제"""
+        if self.proxy_pool is not None:
+            self.proxy_pool.release(proxy)
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        백그라운드 예열과 진행 중인 세션 교체가 끝날 때까지 대기
         
+        Returns:
+            모든 세션이 준비되었는지 여부
+        """
+        self._ensure_started()
+        with self.lock:
+            threads = list(self._warmup_threads)
+        for thread in threads:
+            thread.join(timeout)
+        with self.lock:
+            return all(s.is_ready for s in self.sessions)
+    
+    @staticmethod
+    def _new_session(user_agent: Optional[str] = None) -> requests.Session:
+        """기본 헤더만 설정한 세션 (네트워크 요청 없음)"""
+        session = requests.Session()
         session.headers.update({
-            'User-Agent': random.choice(user_agents),
+            'User-Agent': user_agent or random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        return session
+    
+    def _create_session(self, session_id: int, proxy: Optional[str] = None) -> requests.Session:
+        """새 세션 생성 (proxy가 있으면 그 프록시를 거쳐 예열)"""
+        session = self._new_session()
+        if proxy is not None:
+            bind_proxy(session, proxy)
         
-        # 네이버 메인 페이지 방문하여 쿠키 획득
+        # 네이버 메인 페이지 방문하여 쿠키 획득 (세션 사이 간격은 공용 속도 제한기가 조절)
+        registry = metrics.get_metrics()
+        registry.counter('sessions_created_total', '생성한 세션 수').inc()
         try:
-            session.get('https://www.naver.com', timeout=10)
-            time.sleep(random.uniform(1, 3))
+            get_rate_limiter().acquire('https://www.naver.com', identity=proxy)
+            with registry.timer('session_warmup_seconds'):
+                session.get('https://www.naver.com', timeout=10)
         except Exception as e:
             logger.warning(f"세션 {session_id} 초기화 중 경고: {e}")
         
         return session
     
+    def set_target_rate(self, rate: float):
+        """전체 요청 속도(초당 요청 수)를 세션 수로 나눈 만큼만 각 세션이 사용되도록 설정"""
+        with self.lock:
+            seconds = self.max_sessions / rate if rate > 0 else 0
+            self.min_session_interval = timedelta(seconds=seconds)
+    
     def get_session(self) -> requests.Session:
-        """사용 가능한 세션 반환"""
+        """
+        사용 가능한 세션 반환
+        
+        충분히 쉰 세션을 우선하고, 그 안에서는 선택 점수(성공률, 응답 시간, 쉰 시간)가
+        높은 세션을 고릅니다. 차단되었거나 아직 예열 중인 세션은 제외합니다.
+        준비된 세션이 하나도 없으면(예열 중이거나 생성 실패) 빈 자리에 세션을 바로 만들어 사용합니다.
+        이때 모든 프록시가 격리 중이면 격리가 풀릴 때까지 기다립니다.
+        
+        Raises:
+            SessionUnavailableError: 준비된 세션이 없고 새 세션도 만들지 못한 경우
+                (requests.RequestException이므로 요청 재시도 루프에서 백오프 후 다시 시도)
+        """
+        self._ensure_started()
+        session = self._pick_session()
+        if session is not None:
+            return session
+        
         with self.lock:
-            # 사용 가능한 세션 찾기
-            for _ in range(self.max_sessions):
-                session_info = self.sessions[self.current_index]
-                self.current_index = (self.current_index + 1) % self.max_sessions
-                
-                if session_info.is_available():
-                    session_info.mark_used()
-                    return session_info.session
+            empty = [s.session_id for s in self.sessions if not s.is_ready]
+        logger.warning("준비된 세션이 없어 세션을 바로 생성합니다")
+        for index in empty:
+            if self._install_session(index):
+                session = self._pick_session()
+                if session is not None:
+                    return session
+        raise SessionUnavailableError("사용할 수 있는 세션을 만들지 못했습니다")
+    
+    def _pick_session(self) -> Optional[requests.Session]:
+        """선택 점수에 따라 세션 선택 (준비된 세션이 없으면 None)"""
+        with self.lock:
+            now = datetime.now()
+            idle_reference = max(self.min_session_interval.total_seconds(), 1.0)
+            candidates = []
+            for session_info in self.sessions:
+                if not session_info.is_available() or not self._ensure_proxy(session_info):
+                    continue
+                idle = now - session_info.last_used
+                score = session_info.health_score(idle.total_seconds(), idle_reference,
+                                                  self.latency_reference)
+                rested = idle >= self.min_session_interval
+                heapq.heappush(candidates, (not rested, -score, session_info.session_id))
+            
+            if candidates:
+                _, _, session_id = heapq.heappop(candidates)
+                session_info = self.sessions[session_id]
+                session_info.mark_used()
+                return session_info.session
+            
+            ready_sessions = [s for s in self.sessions if s.is_ready]
+            if not ready_sessions:
+                return None
             
             # 모든 세션이 차단된 경우 가장 오래된 세션 사용
             logger.warning("모든 세션이 차단됨, 가장 오래된 세션 사용")
-            oldest_session = min(self.sessions, key=lambda s: s.last_used)
+            metrics.get_metrics().counter('session_all_blocked_total', '모든 세션이 차단된 상태에서 요청한 횟수').inc()
+            oldest_session = min(ready_sessions, key=lambda s: s.last_used)
             oldest_session.mark_used()
             return oldest_session.session
     
+    def _ensure_proxy(self, session_info: SessionInfo) -> bool:
+        """
+        연결된 프록시가 격리되었으면 다른 프록시로 옮겨 연결 (잠금 안에서 호출)
+        
+        직접 연결 중인 세션(allow_direct_fallback)은 격리가 풀린 프록시가 생기면 다시 프록시로 옮깁니다.
+        
+        Returns:
+            세션을 사용할 수 있는 프록시에 연결되어 있는지 여부
+        """
+        if self.proxy_pool is None or self.proxy_pool.is_available(session_info.proxy):
+            return True
+        available, proxy = self._assign_proxy(previous=session_info.proxy)
+        if not available:
+            return False
+        if proxy != session_info.proxy:
+            logger.info(f"세션 {session_info.session_id}의 프록시 변경")
+            bind_proxy(session_info.session, proxy)
+            session_info.proxy = proxy
+        return True
+    
+    def record_result(self, session: requests.Session, status: Optional[int],
+                      latency: Optional[float] = None):
+        """
+        응답 결과를 세션 선택 점수에 반영
+        
+        Args:
+            session: 요청에 사용한 세션
+            status: HTTP 상태 코드 (연결 오류/시간 초과는 None)
+            latency: 응답 시간(초)
+        """
+        with self.lock:
+            session_info = self._by_session.get(id(session))
+            if session_info is None:
+                return
+            session_info.record_result(status is not None and status < 400, latency)
+            proxy = session_info.proxy
+        
+        # 프록시별 상태도 함께 반영 (403/연속 오류 시 프록시 격리)
+        if self.proxy_pool is not None and proxy is not None:
+            self.proxy_pool.record(proxy, status, latency)
+    
+    def cooldown_remaining(self) -> float:
+        """
+        사용 가능한 세션이 생길 때까지 남은 시간(초)
+        
+        냉각 중이 아닌 준비된 세션이 하나라도 있으면 0을 반환합니다.
+        """
+        with self.lock:
+            ready = [s for s in self.sessions if s.is_ready]
+            if not ready or any(s.is_available() and self._ensure_proxy(s) for s in ready):
+                return 0.0
+            now = datetime.now()
+            waits = [(s.blocked_until - now).total_seconds() for s in ready
+                     if s.is_blocked and s.blocked_until]
+            session_wait = max(0.0, min(waits)) if waits else 0.0
+        proxy_wait = self.proxy_pool.next_available_in() if self.proxy_pool is not None else 0.0
+        return max(session_wait, proxy_wait)
+    
     def mark_error(self, session: requests.Session, error_code: int):
-        """세션 에러 마킹"""
+        """
+        세션 에러 마킹
+        
+        403이 반복된 세션은 새 세션으로 교체합니다. 교체 세션의 예열은 백그라운드 스레드에서 수행하고
+        완성된 세션만 잠금 안에서 바꿔 끼우므로, 403을 받은 작업자를 포함해 어떤 작업자도 기다리지 않습니다.
+        """
+        metrics.get_metrics().counter('session_errors_total', '세션별 HTTP 오류 수', status=error_code).inc()
         with self.lock:
-            for session_info in self.sessions:
-                if session_info.session is session:
-                    session_info.mark_error(error_code)
-                    
-                    # 403 에러가 많이 발생하면 새 세션으로 교체
-                    if error_code == 403 and session_info.error_count >= 3:
-                        logger.info(f"세션 {session_info.session_id} 교체")
-                        new_session = self._create_session(session_info.session_id)
-                        session_info.session = new_session
-                        session_info.error_count = 0
-                        session_info.is_blocked = False
-                        session_info.blocked_until = None
-                    break
+            session_info = self._by_session.get(id(session))
+            if session_info is None:
+                return
+            session_info.mark_error(error_code, self.cooldown_seconds, self.max_cooldown_seconds)
+            
+            # 403 에러가 많이 발생하면 새 세션으로 교체 (차단 상태라 교체 중에는 선택되지 않음)
+            replace = (error_code == 403 and session_info.error_count >= 3
+                       and not session_info.replacing)
+            if replace:
+                session_info.replacing = True
+        
+        if replace:
+            self._start_background(self._replace_session, session_info,
+                                   name=f"session-replace-{session_info.session_id}")
+    
+    def _replace_session(self, session_info: SessionInfo):
+        """
+        잠금 밖에서 새 세션을 만든 뒤 기존 세션과 교체 (백그라운드 스레드에서 실행)
+        
+        모든 프록시가 격리 중이면(직접 연결을 허용하지 않는 한) 교체를 미루고 기존 세션을 차단 상태로
+        둡니다. 냉각이 끝나면 _ensure_proxy가 격리가 풀린 프록시로 옮겨 연결합니다.
+        """
+        # 기존 세션의 프록시 연결은 교체가 끝난 뒤에 해제
+        available, proxy = self._assign_proxy()
+        if not available:
+            logger.warning(f"사용할 수 있는 프록시가 없어 세션 {session_info.session_id} 교체를 미룹니다")
+            with self.lock:
+                session_info.replacing = False
+            return
+        logger.info(f"세션 {session_info.session_id} 교체")
+        metrics.get_metrics().counter('session_replacements_total', '차단으로 교체한 세션 수').inc()
+        try:
+            new_session = self._create_session(session_info.session_id, proxy)
+        except Exception as e:
+            logger.warning(f"세션 {session_info.session_id} 교체 실패: {e}")
+            self._release_proxy(proxy)
+            with self.lock:
+                session_info.replacing = False
+            return
+        
+        with self.lock:
+            self._by_session.pop(id(session_info.session), None)
+            self._by_session[id(new_session)] = session_info
+            if proxy is not None:
+                bind_proxy(new_session, proxy)
+            # 직접 연결로 교체한 경우에도 실제로 연결된 프록시(None)를 기록
+            self._release_proxy(session_info.proxy)
+            session_info.proxy = proxy
+            session_info.session = new_session
+            session_info.created_at = datetime.now()
+            session_info.error_count = 0
+            session_info.is_blocked = False
+            session_info.blocked_until = None
+            session_info.success_rate = 1.0
+            session_info.avg_latency = 0.0
+            session_info.replacing = False
     
     def get_stats(self) -> Dict[str, Any]:
         """세션 풀 통계 반환"""
         with self.lock:
             stats = {
                 'total_sessions': len(self.sessions),
+                'ready_sessions': sum(1 for s in self.sessions if s.is_ready),
                 'available_sessions': sum(1 for s in self.sessions if s.is_available()),
                 'blocked_sessions': sum(1 for s in self.sessions if s.is_blocked),
                 'sessions': []
@@ -161,9 +653,14 @@ class SessionPool:
                     'request_count': session_info.request_count,
                     'error_count': session_info.error_count,
                     'is_blocked': session_info.is_blocked,
-                    'last_error': session_info.last_error
+                    'last_error': session_info.last_error,
+                    'success_rate': round(session_info.success_rate, 3),
+                    'avg_latency': round(session_info.avg_latency, 3)
                 })
             
+            if self.proxy_pool is not None:
+                stats['proxies'] = self.proxy_pool.get_stats()
+            
             return stats
 
 
@@ -173,13 +670,43 @@ _lock = threading.Lock()
 
 
 def get_session_pool(max_sessions: int = 3) -> SessionPool:
-    """세션 풀 인스턴스 반환 (싱글톤)"""
+    """
+    세션 풀 인스턴스 반환 (싱글톤)
+    
+    세션 상태 저장 파일은 advanced.session_management의 snapshot_file,
+    복원 허용 기간은 snapshot_max_age_hours에서 읽습니다.
+    프록시 로테이션을 사용하면 프록시마다 세션이 하나 이상 있도록 세션 수를 늘립니다.
+    """
     global _session_pool
     
     if _session_pool is None:
         with _lock:
             if _session_pool is None:
-                _session_pool = SessionPool(max_sessions)
+                options = get_config().advanced.session_management
+                proxy_pool = get_proxy_pool()
+                if proxy_pool is not None:
+                    max_sessions = max(max_sessions, len(proxy_pool))
+                anti_403 = get_config().advanced.anti_403
+                _session_pool = SessionPool(
+                    max_sessions,
+                    snapshot_file=options.get('snapshot_file', 'data/session_pool.json'),
+                    snapshot_max_age=timedelta(hours=options.get('snapshot_max_age_hours', 24)),
+                    proxy_pool=proxy_pool,
+                    cooldown_seconds=anti_403.get('session_cooldown_seconds', 300),
+                    max_cooldown_seconds=anti_403.get('max_session_cooldown_seconds', 1800),
+                    allow_direct_fallback=anti_403.get('allow_direct_fallback', False)
+                )
                 logger.info(f"세션 풀 초기화 완료 (최대 {max_sessions}개)")
     
     return _session_pool
+
+
+def peek_session_pool() -> Optional[SessionPool]:
+    """이미 생성된 세션 풀 반환 (없으면 새로 만들지 않고 None)"""
+    return _session_pool
+
+
+def save_session_pool_state():
+    """사용 중인 세션 풀이 있으면 세션 상태 저장"""
+    if _session_pool is not None:
+        _session_pool.save_snapshot()
@@ -0,0 +1,34 @@
+"""
+테스트 공용 픽스처와 도우미
+
+여러 테스트 파일에서 함께 쓰는 속도 제한기 교체 픽스처와 검색 결과 HTML 생성기를 제공합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import rate_limiter
+
+
+@pytest.fixture
+def fresh_rate_limiter(monkeypatch):
+    """요청 간격과 전체 요청 수 제한이 없는 새 공용 속도 제한기로 교체"""
+    limiter = rate_limiter.HostRateLimiter()
+    monkeypatch.setattr(rate_limiter, '_rate_limiter', limiter)
+    return limiter
+
+
+def make_search_page(article_ids, oid='001'):
+    """기사 번호마다 링크 카드가 하나씩 있는 검색 결과 HTML 생성"""
+    cards = ''.join(
+        f'<li class="bx"><div class="news_area">'
+        f'<a href="https://n.news.naver.com/mnews/article/{oid}/{aid}?sid=101">네이버뉴스</a>'
+        f'<div class="news_tit">기사 {oid}-{aid} 에 대한 충분히 긴 제목 텍스트입니다</div>'
+        f'</div></li>'
+        for aid in article_ids
+    )
+    return f'<html><body><ul class="list_news">{cards}</ul></body></html>'
@@ -0,0 +1,110 @@
+"""
+적응형 요청 속도 조절 테스트
+
+AIMD 증가/감소 규칙, 403 대기 시간, 학습 속도 저장, 속도 제한기와 세션 풀 반영을 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import session_pool
+from src.utils.adaptive_pacer import MIN_RATE_FLOOR, AdaptivePacer
+from src.utils.session_pool import SessionPool
+
+
+class RecordingPool:
+    """set_target_rate 호출을 기록하는 가짜 세션 풀"""
+
+    def __init__(self):
+        self.rates = []
+
+    def set_target_rate(self, rate):
+        self.rates.append(rate)
+
+
+@pytest.fixture
+def limiter(monkeypatch, fresh_rate_limiter):
+    monkeypatch.setattr(session_pool, '_session_pool', None)
+    return fresh_rate_limiter
+
+
+def test_additive_increase_and_multiplicative_decrease(limiter):
+    """정상 응답에는 조금씩 올리고 403에는 절반으로 줄이는지 확인"""
+    pacer = AdaptivePacer(initial_rate=1.0, min_rate=0.1, max_rate=2.0, increase_step=0.5)
+
+    for _ in range(3):
+        pacer.record(200, 0.1)
+    assert pacer.rate == pytest.approx(2.0)  # 1.0 → 1.5 → 1.83 → 2.0 (상한)
+
+    assert pacer.record(403, 0.1) == pytest.approx(1.0)
+    # 같은 요청 간격 안의 다른 응답으로는 다시 줄이지 않음
+    assert pacer.record(429, 0.1) == pytest.approx(1.0)
+    assert pacer.forbidden_wait() == pytest.approx(10.0)  # 연속 차단 2회: 5초 × 2
+
+    pacer.record(200, 0.1)
+    assert pacer.forbidden_wait() == pytest.approx(5.0)
+    assert limiter.global_rate == pacer.rate
+
+
+def test_latency_spikes_and_server_errors_reduce_rate(limiter):
+    """지연 급증, 5xx, 연결 오류도 속도를 줄이는지 확인"""
+    pacer = AdaptivePacer(initial_rate=4.0, min_rate=0.5, latency_threshold=1.0)
+    for status, latency in ((200, 2.5), (503, 0.1), (None, 30.0)):
+        pacer._last_decrease = 0.0
+        pacer.record(status, latency)
+    assert pacer.rate == pytest.approx(0.5)
+
+
+def test_zero_min_rate_keeps_a_positive_floor(limiter):
+    """min_rate가 0이어도 속도가 0까지 내려가지 않고 감소 계산이 실패하지 않는지 확인"""
+    pacer = AdaptivePacer(initial_rate=0.0, min_rate=0.0)
+    assert pacer.rate == pytest.approx(MIN_RATE_FLOOR)
+    pacer._last_decrease = -1e9
+    assert pacer.record(403, 0.1) == pytest.approx(MIN_RATE_FLOOR)
+    # 0(제한 없음)이 아닌 최저 속도가 속도 제한기에 반영됨
+    pacer.apply()
+    assert limiter.global_rate == pytest.approx(MIN_RATE_FLOOR)
+
+
+def test_learned_rate_is_persisted(tmp_path, limiter):
+    """학습한 속도가 다음 실행의 시작 속도가 되는지 확인"""
+    state_file = str(tmp_path / 'pacing.json')
+    pacer = AdaptivePacer(initial_rate=0.5, increase_step=0.5, state_file=state_file)
+    for _ in range(4):
+        pacer.record(200, 0.1)
+    pacer.save()
+
+    restored = AdaptivePacer(initial_rate=0.5, state_file=state_file)
+    assert restored.rate == pytest.approx(pacer.rate)
+    assert restored.rate > 0.5
+
+
+def test_rate_feeds_limiter_and_session_pool(limiter, monkeypatch):
+    """조절한 속도가 공용 속도 제한기와 세션 풀에 반영되는지 확인"""
+    pool = RecordingPool()
+    monkeypatch.setattr(session_pool, '_session_pool', pool)
+    pacer = AdaptivePacer(initial_rate=1.0)
+
+    pacer.record(403, 0.1)
+    assert limiter.global_rate == pytest.approx(0.5)
+    assert pool.rates == [pytest.approx(0.5)]
+
+
+def test_session_pool_prefers_rested_sessions(monkeypatch):
+    """세션별 목표 간격보다 최근에 사용한 세션은 건너뛰는지 확인"""
+    monkeypatch.setattr(SessionPool, '_create_session', lambda self, session_id, proxy=None: requests.Session())
+    pool = SessionPool(max_sessions=3)
+    pool.set_target_rate(0.1)  # 세션마다 30초 간격
+    assert pool.wait_until_ready(timeout=5)
+
+    first = pool.get_session()
+    assert pool.get_session() is not first
+    third = pool.get_session()
+    # 모든 세션이 방금 사용되었으면 순서대로 다음 세션 사용
+    assert pool.get_session() is first
+    assert third is pool.sessions[2].session
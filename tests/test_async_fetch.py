@@ -0,0 +1,95 @@
+"""
+비동기 요청 백엔드 테스트
+
+로컬 HTTP 서버를 대상으로 fetch()와 동기 어댑터의 동작을 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.extractors import URLExtractor
+from src.utils.config import get_config
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """경로별로 정해진 응답을 돌려주는 테스트 핸들러"""
+
+    hits = {}
+
+    def do_GET(self):
+        count = FlakyHandler.hits.get(self.path, 0) + 1
+        FlakyHandler.hits[self.path] = count
+
+        # /flaky 는 첫 요청만 500 응답
+        if self.path == '/flaky' and count == 1:
+            status = 500
+        elif self.path == '/missing':
+            status = 404
+        else:
+            status = 200
+
+        body = f"<html><body>{self.path} {count}</body></html>".encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FlakyHandler.hits = {}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def extractor(fresh_rate_limiter):
+    """세션 풀 없이 단일 세션을 쓰고 요청 간격 제한이 없는 추출기"""
+    config = get_config()
+    original = (config.network.backoff_factor, config.network.fetch_backend)
+    config.network.backoff_factor = 0.01
+
+    instance = URLExtractor.parser_only()
+    instance._session = requests.Session()
+    yield instance
+
+    config.network.backoff_factor, config.network.fetch_backend = original
+
+
+def test_fetch_retries_like_sync_path(server_url, extractor):
+    """비동기 fetch가 동기 경로와 같은 재시도 규칙을 따르는지 확인"""
+    html = asyncio.run(extractor.fetch(f"{server_url}/flaky"))
+    assert html is not None and '/flaky 2' in html
+
+    assert asyncio.run(extractor.fetch(f"{server_url}/missing")) is None
+    assert FlakyHandler.hits['/missing'] == get_config().network.retries
+
+
+def test_fetch_many_keeps_order(server_url, extractor):
+    """동시 요청 결과가 입력 순서를 유지하는지 확인"""
+    urls = [f"{server_url}/page{i}" for i in range(8)]
+    pages = asyncio.run(extractor.fetch_many(urls, concurrency=4))
+    assert [f"/page{i} 1" in page for i, page in enumerate(pages)] == [True] * 8
+
+
+def test_sync_adapter_uses_async_backend(server_url, extractor):
+    """fetch_backend=async 설정 시 get_page_content가 동일한 결과를 반환하는지 확인"""
+    extractor.config.network.fetch_backend = 'async'
+    html = extractor.get_page_content(f"{server_url}/adapter")
+    assert html is not None and '/adapter 1' in html
@@ -0,0 +1,182 @@
+"""
+동시 본문 추출 테스트
+
+네트워크 요청 없이 작업자 풀 기반 본문 추출의 순서 보장과
+전체 요청 속도 제한을 확인합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.crawler import NewsCrawler
+from src.models.news import NewsURL, NewsArticle
+from src.utils.config import get_config
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeContentExtractor:
+    """요청 지연을 흉내내는 가짜 본문 추출기"""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def extract_news_content(self, url: str, interval=None) -> NewsArticle:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        return NewsArticle(url=url, title=f"제목 {url}", content="본문 " * 30)
+
+
+@pytest.fixture
+def no_rate_limit():
+    """테스트 중 전체 초당 요청 수 제한 해제"""
+    config = get_config()
+    original_rps = config.crawling.max_requests_per_second
+    config.crawling.max_requests_per_second = 0
+    yield
+    config.crawling.max_requests_per_second = original_rps
+
+
+def make_crawler(extractor) -> NewsCrawler:
+    """네트워크 초기화 없이 크롤러 생성"""
+    crawler = NewsCrawler.__new__(NewsCrawler)
+    crawler.config = get_config()
+    crawler.content_extractor = extractor
+    return crawler
+
+
+def test_rate_limiter_spacing():
+    """초당 요청 수 제한 확인"""
+    limiter = RateLimiter(rate=20, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    # 첫 요청은 즉시, 이후 5건은 0.05초 간격
+    assert elapsed >= 0.2
+
+
+def test_concurrent_extraction_keeps_order(no_rate_limit):
+    """동시 추출 결과가 입력 순서를 유지하는지 확인"""
+    extractor = FakeContentExtractor()
+    crawler = make_crawler(extractor)
+    urls = [NewsURL(url=f"https://n.news.naver.com/mnews/article/001/{i:010d}", type="naver")
+            for i in range(12)]
+
+    articles = crawler._extract_contents(urls, 10, "sequential", 0, max_workers=4)
+
+    assert [a.url for a in articles] == [u.url for u in urls[:10]]
+    assert extractor.max_active > 1
+
+
+class FakeURLExtractor:
+    """페이지마다 지연이 있는 가짜 검색 결과 수집기"""
+
+    def __init__(self, pages: int = 4, per_page: int = 5, latency: float = 0.05):
+        self.pages = pages
+        self.per_page = per_page
+        self.latency = latency
+        self.finished_at = None
+
+    def iter_search_pages(self, search_url, max_pages=0, delay_sec=0, max_urls=0,
+                          url_type_filter=None, search_date=None):
+        count = 0
+        for page in range(self.pages):
+            time.sleep(self.latency)
+            page_urls = []
+            for i in range(self.per_page):
+                page_urls.append(NewsURL(
+                    url=f"https://n.news.naver.com/mnews/article/001/{page * 100 + i:010d}",
+                    type="naver"
+                ))
+                count += 1
+                if max_urls > 0 and count >= max_urls:
+                    yield page_urls
+                    self.finished_at = time.monotonic()
+                    return
+            yield page_urls
+        self.finished_at = time.monotonic()
+
+
+class RecordingContentExtractor(FakeContentExtractor):
+    """첫 추출 시각을 기록하는 가짜 본문 추출기"""
+
+    def __init__(self, latency: float = 0.01):
+        super().__init__(latency)
+        self.first_started_at = None
+
+    def extract_news_content(self, url: str, interval=None) -> NewsArticle:
+        if self.first_started_at is None:
+            self.first_started_at = time.monotonic()
+        return super().extract_news_content(url)
+
+
+def test_pipelined_crawl_overlaps_phases(no_rate_limit):
+    """URL 수집이 끝나기 전에 본문 추출이 시작되고 순서가 유지되는지 확인"""
+    crawler = make_crawler(RecordingContentExtractor())
+    crawler.url_extractor = FakeURLExtractor()
+
+    urls, articles = crawler._crawl_pipelined(
+        "https://search.naver.com/search.naver?query=test",
+        max_pages=0, max_urls=0, url_type_filter=None, search_date=None,
+        request_delay=0, content_limit=0, content_delay=0, max_workers=3
+    )
+
+    assert len(urls) == 20
+    assert [a.url for a in articles] == [u.url for u in urls]
+    assert crawler.content_extractor.first_started_at < crawler.url_extractor.finished_at
+
+
+def test_pipelined_crawl_respects_limits(no_rate_limit):
+    """max_urls와 content_limit이 파이프라인에서도 적용되는지 확인"""
+    crawler = make_crawler(RecordingContentExtractor())
+    crawler.url_extractor = FakeURLExtractor()
+
+    urls, articles = crawler._crawl_pipelined(
+        "https://search.naver.com/search.naver?query=test",
+        max_pages=0, max_urls=12, url_type_filter=None, search_date=None,
+        request_delay=0, content_limit=7, content_delay=0, max_workers=2
+    )
+
+    assert len(urls) == 12
+    assert [a.url for a in articles] == [u.url for u in urls[:7]]
+
+
+def test_pipelined_crawl_survives_accept_errors(no_rate_limit, monkeypatch):
+    """수집 기록 저장 오류가 나도 작업자가 멈추지 않고 파이프라인이 끝나는지 확인"""
+    crawler = make_crawler(RecordingContentExtractor())
+    crawler.url_extractor = FakeURLExtractor()
+    monkeypatch.setattr(crawler.config.crawling, 'pipeline_queue_size', 1)
+
+    def flaky_accept(article, url_obj):
+        if url_obj.url.endswith('1'):
+            raise RuntimeError("seen store unavailable")
+        return True
+
+    monkeypatch.setattr(crawler, '_accept_article', flaky_accept)
+
+    result = []
+    thread = threading.Thread(target=lambda: result.append(crawler._crawl_pipelined(
+        "https://search.naver.com/search.naver?query=test",
+        max_pages=0, max_urls=0, url_type_filter=None, search_date=None,
+        request_delay=0, content_limit=0, content_delay=0, max_workers=2
+    )), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    urls, articles = result[0]
+    assert len(urls) == 20
+    assert [a.url for a in articles] == [u.url for u in urls if not u.url.endswith('1')]
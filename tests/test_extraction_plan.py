@@ -0,0 +1,72 @@
+"""
+추출 계획 테스트
+
+설정이 바뀔 때만 추출 계획이 다시 생성되는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bs4 import BeautifulSoup
+
+from src.core import extraction_plan
+from src.core.extraction_plan import get_extraction_plan
+from src.utils.config import get_config
+
+
+def test_plan_reused_until_config_changes():
+    """설정 변경이 없으면 같은 계획을 재사용하는지 확인"""
+    config = get_config()
+    plan = get_extraction_plan()
+    assert get_extraction_plan() is plan
+
+    original = config.extraction.min_content_length
+    config.extraction.min_content_length = original + 1
+    try:
+        rebuilt = get_extraction_plan()
+        assert rebuilt is not plan
+        assert rebuilt.min_content_length == original + 1
+        assert get_extraction_plan() is rebuilt
+    finally:
+        config.extraction.min_content_length = original
+
+
+def test_hot_path_does_not_read_config(monkeypatch):
+    """기사 파싱 시 설정 조회나 선택자 재로드가 없는지 확인"""
+    from src.core.content_extractor import NaverNewsContentExtractor
+
+    extractor = NaverNewsContentExtractor.parser_only()
+    get_extraction_plan()
+
+    calls = []
+    real_get_config = extraction_plan.get_config
+
+    def counting_get_config():
+        calls.append(1)
+        return real_get_config()
+
+    monkeypatch.setattr(extraction_plan, 'get_config', counting_get_config)
+    monkeypatch.setattr(extraction_plan, 'ExtractionPlan',
+                        lambda *args: (_ for _ in ()).throw(AssertionError("재생성됨")))
+
+    html = ('<html><body><h2 class="media_end_head_headline">제목</h2>'
+            '<div id="newsct_article">' + '본문 ' * 60 + '</div></body></html>')
+    for _ in range(3):
+        article = extractor.parse_news_content("https://n.news.naver.com/mnews/article/001/0000000001", html)
+        assert article.title == "제목"
+    # 계획 버전 확인용 조회만 허용
+    assert len(calls) == 3
+
+
+def test_combined_removal_handles_nested_matches():
+    """합쳐진 제거 선택자가 중첩된 제거 대상도 안전하게 처리하는지 확인"""
+    plan = get_extraction_plan()
+    soup = BeautifulSoup(
+        '<div id="body">앞<div class="ad_wrap">광고<script>x()</script></div>뒤'
+        '<style>p{}</style></div>', 'lxml'
+    )
+    element = soup.select_one('#body')
+    plan.remove_unwanted(element)
+    assert element.get_text(strip=True) == "앞뒤"
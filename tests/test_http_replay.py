@@ -0,0 +1,168 @@
+"""
+HTTP 기록/재생 테스트
+
+로컬 원본 서버의 응답을 기록한 뒤, 원본 없이 재생 서버만으로 같은 결과를 얻는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.crawler import NewsCrawler
+from src.core.extractors import URLExtractor
+from src.utils import http_archive, response_cache
+from src.utils.config import get_config
+from src.utils.http_archive import HttpArchive
+from src.utils.response_cache import ResponseCache
+from tests.conftest import make_search_page
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    """경로를 본문에 담아 돌려주는 원본 서버"""
+
+    def do_GET(self):
+        status = 404 if self.path == '/missing' else 200
+        body = f"<html><body>origin {self.path}</body></html>".encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_mode(tmp_path, monkeypatch, fresh_rate_limiter):
+    """아카이브 경로와 HTTP 모드를 테스트용으로 설정"""
+    config = get_config()
+    monkeypatch.setattr(http_archive, '_archive', None)
+    monkeypatch.setattr(http_archive, '_replay_server', None)
+    monkeypatch.setattr(config.advanced, 'http_archive', {
+        'archive_path': str(tmp_path / 'archive.jsonl.gz'),
+        'replay_latency_ms': 0, 'replay_403_rate': 0.0, 'replay_5xx_rate': 0.0, 'replay_seed': 0
+    })
+    monkeypatch.setattr(config.network, 'fetch_backend', 'sync')
+    monkeypatch.setattr(config.network, 'backoff_factor', 0.01)
+
+    def set_mode(mode):
+        config.network.http_mode = mode
+
+    yield set_mode
+    http_archive.stop_replay_server()
+    config.network.http_mode = 'live'
+
+
+def test_archive_keeps_one_writer_open(tmp_path):
+    """기록할 때마다 파일을 다시 열지 않고, 닫은 뒤에는 모든 응답을 읽을 수 있는지 확인"""
+    archive = HttpArchive(str(tmp_path / 'archive.jsonl.gz'))
+    archive.record("https://example.com/0", 200, 'text/html', "<html>0</html>")
+    writer = archive._writer
+    for i in range(1, 50):
+        archive.record(f"https://example.com/{i}", 200, 'text/html', f"<html>{i}</html>")
+    assert archive._writer is writer
+    # 기록한 응답은 파일에만 쓰고 메모리에 두지 않음
+    assert len(archive) == 0
+    archive.close()
+
+    # 닫은 뒤 다시 기록하면 이어 씀
+    archive.record("https://example.com/50", 200, 'text/html', "<html>50</html>")
+    archive.close()
+    assert len(HttpArchive(archive.path).load()) == 51
+
+
+def test_record_then_replay(http_mode):
+    """기록한 응답이 원본 서버 없이 재생되는지 확인"""
+    origin = ThreadingHTTPServer(('127.0.0.1', 0), OriginHandler)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{origin.server_address[1]}"
+
+    http_mode('record')
+    extractor = URLExtractor.parser_only()
+    extractor._session = requests.Session()
+    recorded = [extractor.get_page_content(f"{base}/page{i}") for i in range(3)]
+    assert extractor.get_page_content(f"{base}/missing") is None
+    origin.shutdown()
+    origin.server_close()
+    http_archive.close_http_archive()
+
+    archive = HttpArchive(get_config().advanced.http_archive['archive_path']).load()
+    assert len(archive) == 4 and archive.lookup(f"{base}/missing")[0] == 404
+
+    http_mode('replay')
+    replayer = URLExtractor.parser_only()
+    assert [replayer.get_page_content(f"{base}/page{i}") for i in range(3)] == recorded
+    assert replayer.get_page_content(f"{base}/unknown") is None
+
+
+def test_record_bypasses_response_cache(http_mode, tmp_path, monkeypatch):
+    """기록 모드에서는 응답 캐시에 있는 페이지도 실제로 요청해 아카이브에 남기는지 확인"""
+    origin = ThreadingHTTPServer(('127.0.0.1', 0), OriginHandler)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{origin.server_address[1]}/cached"
+    cache = ResponseCache(str(tmp_path / 'cache'), compression='gzip')
+    cache.put(url, "<html>stale</html>")
+    monkeypatch.setattr(response_cache, '_response_cache', cache)
+    monkeypatch.setattr(response_cache, '_cache_initialized', True)
+
+    http_mode('record')
+    extractor = URLExtractor.parser_only()
+    extractor._session = requests.Session()
+    try:
+        assert extractor.get_page_content(url) == "<html><body>origin /cached</body></html>"
+    finally:
+        origin.shutdown()
+        origin.server_close()
+    http_archive.close_http_archive()
+
+    archive = HttpArchive(get_config().advanced.http_archive['archive_path']).load()
+    assert archive.lookup(url)[0] == 200
+    assert cache.stats()['hits'] == 0
+
+
+def test_replay_injects_errors(http_mode, monkeypatch):
+    """설정한 비율로 403/5xx 오류가 주입되는지 확인"""
+    config = get_config()
+    archive = HttpArchive(config.advanced.http_archive['archive_path'])
+    archive.record("https://example.com/a", 200, 'text/html', "<html>a</html>")
+    archive.close()
+    config.advanced.http_archive['replay_5xx_rate'] = 1.0
+    monkeypatch.setattr(config.network, 'retries', 2)
+
+    http_mode('replay')
+    assert URLExtractor.parser_only().get_page_content("https://example.com/a") is None
+    assert http_archive.get_replay_server().stats['injected_5xx'] == 2
+
+
+def test_crawl_end_to_end_from_archive(http_mode):
+    """NewsCrawler.crawl 전체가 재생 모드에서 네트워크 없이 동작하는지 확인"""
+    with open(os.path.join(FIXTURE_DIR, 'naver_article.html'), encoding='utf-8') as f:
+        article_html = f.read()
+
+    config = get_config()
+    archive = HttpArchive(config.advanced.http_archive['archive_path'])
+    article_ids = [f"{i:010d}" for i in range(1, 4)]
+
+    http_mode('replay')
+    crawler = NewsCrawler()
+    search_url = crawler._build_search_option("테스트", "1d", None, None, "relevance", "all").build_url()
+    archive.record(f"{search_url}&start=1", 200, 'text/html', make_search_page(article_ids))
+    for aid in article_ids:
+        archive.record(f"https://n.news.naver.com/mnews/article/001/{aid}", 200, 'text/html', article_html)
+    archive.close()
+
+    result = crawler.crawl("테스트", period="1d", max_pages=1, extract_content=True,
+                           request_delay=0, content_delay=0)
+
+    assert len(result.urls) == 3
+    assert len(result.articles) == 3 and all(a.is_valid() for a in result.articles)
+    assert http_archive.get_replay_server().stats['not_found'] == 0
@@ -0,0 +1,88 @@
+"""
+lxml 추출 엔진 테스트
+
+lxml 엔진의 추출 결과가 BeautifulSoup 경로와 동일한지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import lxml_engine
+from src.core.content_extractor import NaverNewsContentExtractor
+from src.utils.config import get_config
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/001/0015000000"
+
+# 다양한 구조의 기사 HTML (단락형 본문, 대체 선택자, 짧은 본문 등)
+EXTRA_PAGES = [
+    '<html><body><h1>대체 제목 <b>굵게</b></h1>'
+    '<div id="articleBodyContents"><p>첫 문단입니다. ' + '가' * 60 + '</p>'
+    '<div>둘째 문단 <script>x()</script>입니다. ' + '나' * 60 + '</div>'
+    '<p> </p><span>단락이 아닌 요소</span></div>'
+    '<div class="article_info"><em>2025.05.20 09:00</em></div>'
+    '<span class="byline">김기자 기자</span></body></html>',
+
+    '<html><body><h2 class="media_end_head_headline">짧은 본문</h2>'
+    '<div id="newsct_article">너무 짧음</div>'
+    '<div class="news_content">' + '대체 본문 ' * 30 + '이순신 특파원</div></body></html>',
+
+    '<?xml version="1.0" encoding="utf-8"?><html><body><h3>인코딩 선언 문서</h3></body></html>',
+]
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def make_extractor():
+    """네트워크 초기화 없이 본문 추출기 생성"""
+    return NaverNewsContentExtractor.parser_only()
+
+
+def parse_with(engine, html):
+    config = get_config()
+    original = config.extraction.engine
+    config.extraction.engine = engine
+    try:
+        article = make_extractor().parse_news_content(ARTICLE_URL, html)
+    finally:
+        config.extraction.engine = original
+    data = article.to_dict()
+    data.pop('extracted_at')
+    return data
+
+
+@pytest.fixture(params=['cssselect', 'builtin'])
+def translator(request, monkeypatch):
+    """cssselect 변환기와 내장 변환기 모두에서 테스트"""
+    if request.param == 'cssselect' and not lxml_engine.CSSSELECT_AVAILABLE:
+        pytest.skip("cssselect 미설치")
+    if request.param == 'builtin':
+        monkeypatch.setattr(lxml_engine, 'CSSSELECT_AVAILABLE', False)
+    return request.param
+
+
+def test_fixture_article_matches_beautifulsoup(translator):
+    """실제 구조의 기사에서 두 엔진 결과가 같은지 확인"""
+    html = load_fixture('naver_article.html')
+    expected = parse_with('beautifulsoup', html)
+    assert expected['title'] and expected['content'] and expected['press']
+    assert parse_with('lxml', html) == expected
+
+
+@pytest.mark.parametrize('html', EXTRA_PAGES)
+def test_varied_pages_match_beautifulsoup(translator, html):
+    """다양한 구조의 기사에서 두 엔진 결과가 같은지 확인"""
+    assert parse_with('lxml', html) == parse_with('beautifulsoup', html)
+
+
+def test_builtin_translator_rejects_unsupported_selector():
+    """내장 변환기가 지원하지 않는 선택자를 거부하는지 확인"""
+    with pytest.raises(ValueError):
+        lxml_engine._translate_simple("div:nth-child(2)", "descendant-or-self::")
@@ -0,0 +1,105 @@
+"""
+실행 지표 테스트
+
+카운터/히스토그램 집계, Prometheus 텍스트 형식 출력, 주요 단계 계측을 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.extractors import NaverNewsURLExtractor
+from src.models.news import NewsArticle
+from src.utils import metrics
+from src.utils.config import get_config
+from src.utils.file_saver import FileSaver
+from src.utils.metrics import MetricsRegistry
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """테스트마다 새 지표 저장소 사용"""
+    fresh = MetricsRegistry()
+    monkeypatch.setattr(metrics, '_registry', fresh)
+    return fresh
+
+
+def test_counters_and_histograms_are_keyed_by_labels(registry):
+    """라벨이 다르면 별도 지표로 집계되는지 확인"""
+    registry.counter('http_requests_total', status=200).inc()
+    registry.counter('http_requests_total', status=200).inc()
+    registry.counter('http_requests_total', status=403).inc()
+    for value in (0.002, 0.02, 0.2, 2.0):
+        registry.histogram('http_request_seconds').observe(value)
+
+    snapshot = registry.snapshot()
+    assert snapshot['http_requests_total{status="200"}']['value'] == 2
+    assert snapshot['http_requests_total{status="403"}']['value'] == 1
+    histogram = snapshot['http_request_seconds']
+    assert histogram['count'] == 4
+    assert histogram['sum'] == pytest.approx(2.222)
+    assert histogram['max'] == 2.0
+    assert histogram['p50'] == 0.025
+    assert 'http_request_seconds' in registry.summary()
+
+
+def test_prometheus_export(registry, tmp_path):
+    """Prometheus 텍스트 형식 (누적 구간, 합계, 개수) 확인"""
+    registry.counter('http_cache_hits_total', '응답 캐시 적중 수').inc(3)
+    histogram = registry.histogram('sleep_seconds', buckets=(0.1, 1.0), reason='rate_limit')
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    path = tmp_path / 'metrics.prom'
+    registry.write_prometheus(str(path))
+    lines = path.read_text(encoding='utf-8').splitlines()
+
+    assert '# HELP naver_crawler_http_cache_hits_total 응답 캐시 적중 수' in lines
+    assert '# TYPE naver_crawler_http_cache_hits_total counter' in lines
+    assert 'naver_crawler_http_cache_hits_total 3' in lines
+    assert '# TYPE naver_crawler_sleep_seconds histogram' in lines
+    assert 'naver_crawler_sleep_seconds_bucket{reason="rate_limit",le="0.1"} 1' in lines
+    assert 'naver_crawler_sleep_seconds_bucket{reason="rate_limit",le="1"} 2' in lines
+    assert 'naver_crawler_sleep_seconds_bucket{reason="rate_limit",le="+Inf"} 3' in lines
+    assert 'naver_crawler_sleep_seconds_count{reason="rate_limit"} 3' in lines
+
+
+def test_crawl_stages_are_instrumented(registry, tmp_path):
+    """검색 결과 파싱, 대기, 파일 저장이 지표에 기록되는지 확인"""
+    with open(os.path.join(FIXTURE_DIR, 'naver_search.html'), encoding='utf-8') as f:
+        html = f.read()
+    NaverNewsURLExtractor.parser_only().extract_news_urls(html)
+    metrics.sleep(0.01, 'content_delay')
+    metrics.sleep(0, 'content_delay')
+
+    article = NewsArticle(url="https://n.news.naver.com/mnews/article/001/0000000001",
+                          title="제목", content="본문 " * 100)
+    files = FileSaver().save_articles([article], query='metrics', period='1d', output_dir=str(tmp_path))
+
+    snapshot = registry.snapshot()
+    assert snapshot['search_parse_seconds']['count'] == 1
+    assert snapshot['sleep_seconds{reason="content_delay"}']['count'] == 1
+    assert snapshot['file_write_seconds{kind="articles"}']['count'] == 1
+    assert snapshot['file_bytes_written_total{kind="articles"}']['value'] == os.path.getsize(files[0])
+
+
+def test_export_writes_configured_file(registry, tmp_path):
+    """advanced.metrics.prometheus_file 설정 시 실행 종료 내보내기에서 파일을 쓰는지 확인"""
+    options = get_config().advanced.metrics
+    original = dict(options)
+    path = tmp_path / 'run.prom'
+    try:
+        options['prometheus_file'] = str(path)
+        registry.counter('fetch_failures_total').inc()
+        metrics.export_metrics()
+    finally:
+        options.clear()
+        options.update(original)
+
+    assert 'naver_crawler_fetch_failures_total 1' in path.read_text(encoding='utf-8')
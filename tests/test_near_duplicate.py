@@ -0,0 +1,71 @@
+"""
+유사 제목 색인 테스트
+
+MinHash/LSH 색인이 SequenceMatcher 기반 판정과 같은 결과를 내는지 확인합니다.
+"""
+
+import os
+import random
+import sys
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.near_duplicate import NearDuplicateIndex
+
+
+def brute_force_similar(title, titles, threshold):
+    """기존 방식의 쌍별 비교"""
+    for other in titles:
+        if len(title) <= 6 or len(other) <= 6:
+            if title == other:
+                return True
+        elif SequenceMatcher(None, title, other).ratio() >= threshold:
+            return True
+    return False
+
+
+def test_rewritten_titles_are_detected():
+    """통신사 재전송 기사 제목이 유사 제목으로 판정되는지 확인"""
+    index = NearDuplicateIndex(threshold=0.8)
+    assert index.add("삼성전자, 3분기 영업이익 10조 돌파…반도체 회복세", "001/0000000001")
+
+    assert index.find_similar("삼성전자 3분기 영업이익 10조원 돌파…반도체 회복세") == "001/0000000001"
+    assert not index.add("[속보] 삼성전자, 3분기 영업이익 10조 돌파…반도체 회복세")
+    assert index.add("정부, 내년 원전 수출 지원 예산 대폭 확대 방침")
+    assert len(index) == 2
+
+
+def test_short_titles_require_exact_match():
+    """6자 이하 제목은 완전히 같아야 유사 판정되는지 확인"""
+    index = NearDuplicateIndex()
+    assert index.add("속보 원전")
+    assert not index.add("속보 원전")
+    assert index.add("속보 원자")
+
+
+def test_matches_pairwise_semantics():
+    """무작위 제목 집합에서 쌍별 비교와 판정이 일치하는지 확인"""
+    rng = random.Random(7)
+    words = ["정부", "원전", "수출", "확대", "삼성", "반도체", "금리", "인상", "발표", "속보",
+             "서울", "부동산", "대책", "국회", "예산", "통과", "기업", "실적", "개선", "전망"]
+    base_titles = [" ".join(rng.sample(words, 7)) for _ in range(60)]
+    # 일부 제목은 조금만 바꾼 변형 추가
+    titles = []
+    for title in base_titles:
+        titles.append(title)
+        if rng.random() < 0.5:
+            titles.append(title.replace(" ", ", ", 1) + "…")
+
+    index = NearDuplicateIndex(threshold=0.8)
+    kept = []
+    mismatches = 0
+    for title in titles:
+        expected_new = not brute_force_similar(title, kept, 0.8)
+        added = index.add(title)
+        if added:
+            kept.append(title)
+        if added != expected_new:
+            mismatches += 1
+
+    assert mismatches <= 1
@@ -0,0 +1,213 @@
+"""
+날짜별 동시 수집 테스트
+
+여러 날짜를 동시에 수집해도 순차 수집과 같은 날짜별 결과와 중간 파일이 만들어지는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import daily_collector
+from src.core.daily_collector import NaverNewsDailyCollector
+from src.models.news import NewsArticle, NewsURL
+from src.utils import rate_limiter
+from src.utils.config import get_config
+
+SHARED_ARTICLE = "https://n.news.naver.com/mnews/article/001/0000000001"
+PAGE_SIZE = 2
+
+
+class FakeSearch:
+    """
+    날짜마다 모든 날짜에 나오는 기사 shared개 뒤에 날짜 고유 기사 unique개를 돌려주는 가짜 검색
+    
+    실제 검색처럼 PAGE_SIZE건씩 페이지를 넘기며 이미 본 기사는 건너뛰고, max_urls건을 모으면 멈춥니다.
+    """
+
+    def __init__(self, shared=1, unique=2):
+        self.shared = [SHARED_ARTICLE] + [f"https://n.news.naver.com/mnews/article/002/{n:010d}"
+                                          for n in range(1, shared)]
+        self.unique = unique
+        self.active = 0
+        self.peak = 0
+        self.pages = 0
+        self._lock = threading.Lock()
+
+    def collect_from_search(self, search_url, max_pages=0, delay_sec=1.0, max_urls=0,
+                            seen_keys=None, title_index=None):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(search_url).query)
+        day = query['ds'][0].replace('.', '')
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        # 뒤 날짜가 먼저 끝나도록 응답 시간을 다르게 함
+        time.sleep(0.05 * (5 - int(day[-1])))
+
+        urls = []
+        candidates = self.shared + [f"https://n.news.naver.com/mnews/article/001/{day}{n}"
+                                    for n in range(1, self.unique + 1)]
+        for start in range(0, len(candidates), PAGE_SIZE):
+            with self._lock:
+                self.pages += 1
+            for url in candidates[start:start + PAGE_SIZE]:
+                news_url = NewsURL(url, 'naver', title=f"제목 {url[-10:]}")
+                if news_url.key not in seen_keys:
+                    seen_keys.add(news_url.key)
+                    urls.append(news_url)
+                    if max_urls and len(urls) >= max_urls:
+                        break
+            if max_urls and len(urls) >= max_urls:
+                break
+        with self._lock:
+            self.active -= 1
+        return urls
+
+
+def extract_news_content(url, interval=None):
+    return NewsArticle(url=url, title=f"제목 {url[-10:]}", content="본문 " * 100)
+
+
+@pytest.fixture
+def collector_factory(tmp_path, monkeypatch, fresh_rate_limiter):
+    config = get_config()
+    monkeypatch.setattr(config.crawling, 'skip_similar_titles', False)
+
+    def make(name, **search_options):
+        monkeypatch.setattr(config.storage, 'news_data_dir', str(tmp_path / name / 'news'))
+        collector = NaverNewsDailyCollector()
+        search = FakeSearch(**search_options)
+        monkeypatch.setattr(collector.url_extractor, 'collect_from_search', search.collect_from_search)
+        monkeypatch.setattr(collector.content_extractor, 'extract_news_content', extract_news_content)
+        return collector, search
+
+    return make
+
+
+def run(collector, parallel_days, daily_limit=10):
+    return collector.collect_date_range(
+        query='테스트',
+        start_date=datetime(2025, 6, 1),
+        end_date=datetime(2025, 6, 4),
+        extract_content=True,
+        daily_limit=daily_limit,
+        parallel_days=parallel_days
+    )
+
+
+def url_files(stats):
+    result = {}
+    for day in stats['daily_results']:
+        with open(day['url_file'], 'r', encoding='utf-8') as f:
+            result[day['date']] = [item['url'] for item in json.load(f)]
+    return result
+
+
+def test_parallel_days_match_sequential_results(collector_factory):
+    """동시 수집 결과가 날짜 순서, 날짜 간 중복 제거, 중간 파일까지 순차 수집과 같은지 확인"""
+    sequential, _ = collector_factory('sequential')
+    parallel, search = collector_factory('parallel')
+
+    expected = run(sequential, 1)
+    stats = run(parallel, 3)
+
+    assert search.peak > 1
+    assert [d['date'] for d in stats['daily_results']] == ['2025-06-01', '2025-06-02', '2025-06-03', '2025-06-04']
+    assert [d['urls_collected'] for d in stats['daily_results']] == [3, 2, 2, 2]
+    assert stats['total_urls'] == expected['total_urls'] == 9
+    assert stats['total_contents'] == expected['total_contents'] == 9
+    # 모든 날짜에 나온 기사는 순차 수집과 마찬가지로 첫 날짜에만 남음
+    assert url_files(stats) == url_files(expected)
+    assert SHARED_ARTICLE in url_files(stats)['2025-06-01']
+    for day in stats['daily_results']:
+        assert os.path.exists(day['content_file'])
+
+
+def test_overlapping_days_still_reach_daily_limit(collector_factory):
+    """앞 날짜와 겹친 기사를 뺀 날짜도 순차 수집처럼 daily_limit만큼 새 기사로 채워지는지 확인"""
+    sequential, _ = collector_factory('sequential', shared=2, unique=4)
+    parallel, search = collector_factory('parallel', shared=2, unique=4)
+
+    expected = run(sequential, 1, daily_limit=3)
+    stats = run(parallel, 3, daily_limit=3)
+
+    assert search.peak > 1
+    assert [d['urls_collected'] for d in stats['daily_results']] == [3, 3, 3, 3]
+    assert stats['total_urls'] == expected['total_urls'] == 12
+    assert url_files(stats) == url_files(expected)
+    # 첫 날짜만 겹친 기사를 가져가고 나머지 날짜는 고유 기사로 채움
+    assert url_files(stats)['2025-06-02'] == [
+        f"https://n.news.naver.com/mnews/article/001/20250602{n}" for n in (1, 2, 3)
+    ]
+
+
+def test_parallel_article_requests_keep_the_configured_delay(collector_factory, monkeypatch):
+    """동시 수집에서도 기사 요청 사이에 순차 수집과 같은 delay_between_requests 간격을 지키는지 측정"""
+    config = get_config()
+    monkeypatch.setattr(config.crawling, 'delay_between_requests', 0.1)
+    monkeypatch.setattr(config.crawling, 'max_requests_per_second', 40)
+    sent = []
+    lock = threading.Lock()
+
+    def paced_extract(url, interval=None):
+        # 스레드가 깨어난 시각 대신 속도 제한기가 예약한 전송 시각을 기록
+        with lock:
+            now = time.monotonic()
+            wait_time = rate_limiter.get_rate_limiter().reserve(url, interval=interval)
+            sent.append(now + wait_time)
+        time.sleep(wait_time)
+        return extract_news_content(url)
+
+    for name, parallel_days in (('sequential', 1), ('parallel', 4)):
+        collector, _ = collector_factory(name)
+        monkeypatch.setattr(collector.content_extractor, 'extract_news_content', paced_extract)
+        sent.clear()
+        run(collector, parallel_days)
+        assert len(sent) == 9
+        # 날짜가 동시에 진행되어도 같은 기사 호스트의 요청 간격은 설정값 이상
+        gaps = [b - a for a, b in zip(sent, sent[1:])]
+        assert min(gaps) >= 0.1 - 0.01, name
+
+
+def test_progress_advances_as_each_day_finishes(collector_factory, monkeypatch):
+    """앞 날짜의 본문 추출이 오래 걸려도 먼저 끝난 날짜부터 진행 표시가 갱신되는지 확인"""
+    bars = []
+
+    class RecordingProgress:
+        def __init__(self, iterable=None, desc=None):
+            self.descriptions = []
+            self.n = 0
+            bars.append(self)
+
+        def set_description(self, desc):
+            self.descriptions.append(desc)
+
+        def update(self, n=1):
+            self.n += n
+
+        def close(self):
+            pass
+
+    def slow_first_day(url, interval=None):
+        if '20250601' in url:
+            time.sleep(0.3)
+        return extract_news_content(url)
+
+    monkeypatch.setattr(daily_collector, 'tqdm', RecordingProgress, raising=False)
+    monkeypatch.setattr(daily_collector, 'TQDM_AVAILABLE', True)
+    collector, _ = collector_factory('parallel')
+    monkeypatch.setattr(collector.content_extractor, 'extract_news_content', slow_first_day)
+    run(collector, 4)
+
+    progress = bars[0]
+    assert progress.n == 4
+    assert progress.descriptions[-1].endswith('2025-06-01')
+    assert not progress.descriptions[0].endswith('2025-06-01')
@@ -0,0 +1,95 @@
+"""
+파싱 프로세스 풀 테스트
+
+별도 프로세스에서 파싱한 결과가 요청 스레드에서 직접 파싱한 결과와 같은지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import parse_pool
+from src.core.content_extractor import NaverNewsContentExtractor
+from src.core.extractors import NaverNewsURLExtractor
+from src.utils import selector_stats
+from src.utils.config import get_config
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/001/0015000000"
+
+
+@pytest.fixture(scope='module')
+def pool():
+    config = get_config()
+    original = config.crawling.parse_workers
+    config.crawling.parse_workers = 2
+    yield parse_pool.get_parse_pool()
+    parse_pool.shutdown_parse_pool()
+    config.crawling.parse_workers = original
+
+
+def test_article_parse_matches_local(pool):
+    """프로세스 풀의 기사 파싱 결과가 직접 파싱한 결과와 같은지 확인"""
+    with open(os.path.join(FIXTURE_DIR, 'naver_article.html'), encoding='utf-8') as f:
+        html = f.read()
+
+    local = NaverNewsContentExtractor.parser_only().parse_news_content(ARTICLE_URL, html)
+    remote = pool.parse_article(ARTICLE_URL, html)
+
+    assert remote is not None and remote.title
+    assert {k: v for k, v in remote.to_dict().items() if k != 'extracted_at'} == \
+           {k: v for k, v in local.to_dict().items() if k != 'extracted_at'}
+
+
+def test_search_parse_matches_local(pool):
+    """프로세스 풀의 검색 결과 파싱 결과가 직접 파싱한 결과와 같은지 확인"""
+    cards = ''.join(
+        f'<li class="bx"><div class="news_area">'
+        f'<a href="https://n.news.naver.com/mnews/article/001/{i:010d}?sid=101">네이버뉴스</a>'
+        f'<div class="news_tit">{i}번 기사에 대한 충분히 긴 검색 결과 제목입니다</div></div></li>'
+        for i in range(10)
+    )
+    html = f'<html><body><ul class="list_news">{cards}</ul></body></html>'
+
+    local = NaverNewsURLExtractor.parser_only().extract_news_urls(html)
+    remote = pool.parse_search(html)
+
+    assert [(u.url, u.type, u.title) for u in remote] == [(u.url, u.type, u.title) for u in local]
+
+
+def test_worker_selector_hits_reach_parent_stats(tmp_path, monkeypatch):
+    """파서 프로세스에서 적중한 선택자가 부모 프로세스의 통계에 반영되고 저장되는지 확인"""
+    config = get_config()
+    monkeypatch.setattr(selector_stats, '_selector_stats', None)
+    monkeypatch.setattr(config.extraction, 'selector_stats_file', str(tmp_path / "selector_stats.json"))
+    monkeypatch.setattr(config.extraction, 'adaptive_selectors', True)
+    monkeypatch.setattr(config.crawling, 'parse_workers', 1)
+    page = ('<html><body><h1>구형 템플릿 제목</h1>'
+            '<div id="articleBodyContents">' + '본문 ' * 60 + '</div></body></html>')
+
+    pool = parse_pool.get_parse_pool()
+    try:
+        for i in range(4):
+            article = pool.parse_article(f"https://n.news.naver.com/mnews/article/001/{i:010d}", page)
+            assert article.title == "구형 템플릿 제목"
+    finally:
+        parse_pool.shutdown_parse_pool()
+
+    stats = selector_stats.get_selector_stats()
+    assert stats.hit_counts('001')['title'] == {'h1': 4}
+    selector_stats.save_selector_stats()
+    assert selector_stats.SelectorStats(config.extraction.selector_stats_file).hit_counts('001')['title'] == {'h1': 4}
+
+
+def test_pool_disabled_by_default():
+    """parse_workers가 0이면 풀을 사용하지 않는지 확인"""
+    config = get_config()
+    original = config.crawling.parse_workers
+    config.crawling.parse_workers = 0
+    try:
+        assert parse_pool.get_parse_pool() is None
+    finally:
+        config.crawling.parse_workers = original
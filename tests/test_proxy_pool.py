@@ -0,0 +1,183 @@
+"""
+프록시 풀 테스트
+
+프록시별 상태 추적, 지수 격리, 세션 분배와 로컬 대리 프록시 서버를 거친 요청 우회를 확인합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.proxy_pool import ProxyPool, proxy_of
+from src.utils.session_pool import SessionPool
+
+
+def make_proxy_handler(name, status, hits):
+    """모든 요청에 status로 응답하고 프록시 이름을 본문에 담는 대리 프록시"""
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(name)
+            body = f"{name} {self.path}".encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ProxyHandler
+
+
+@pytest.fixture
+def stand_in_proxies(monkeypatch, fresh_rate_limiter):
+    """403만 돌려주는 프록시와 정상 프록시 두 개를 로컬에서 실행"""
+    hits = []
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), make_proxy_handler(name, status, hits))
+               for name, status in (('blocked', 403), ('healthy', 200))]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_address[1]}" for server in servers]
+    yield urls, hits
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_quarantine_doubles_and_resets_after_success():
+    """403마다 격리 시간이 두 배로 늘고(상한 적용), 성공하면 처음으로 돌아가는지 확인"""
+    pool = ProxyPool(['http://a:1', 'http://b:1'], quarantine_seconds=10, max_quarantine_seconds=25)
+    proxy = pool.proxies[0]
+
+    for expected in (10, 20, 25):
+        pool.record('http://a:1', 403, 0.1)
+        assert not pool.is_available('http://a:1')
+        assert proxy.quarantined_until - time.monotonic() == pytest.approx(expected, abs=0.5)
+        proxy.quarantined_until = 0.0  # 격리 시간이 지난 것으로 처리
+
+    pool.record('http://a:1', 200, 0.1)
+    pool.record('http://a:1', 403, 0.1)
+    assert proxy.quarantined_until - time.monotonic() == pytest.approx(10, abs=0.5)
+    assert pool.get_stats()[0]['forbidden_rate'] == pytest.approx(0.8)
+
+
+def test_consecutive_errors_quarantine():
+    """403이 아닌 오류는 연속 failure_threshold회부터 격리하는지 확인"""
+    pool = ProxyPool(['http://a:1'], failure_threshold=3)
+    pool.record('http://a:1', 502, 0.1)
+    pool.record('http://a:1', None, 5.0)
+    assert pool.is_available('http://a:1')
+    pool.record('http://a:1', 503, 0.1)
+    assert not pool.is_available('http://a:1')
+    assert pool.assign() is None
+
+
+def test_assign_spreads_sessions_then_prefers_healthy():
+    """세션을 프록시마다 고르게 나누고, 같은 수면 빠르고 성공률 높은 프록시를 고르는지 확인"""
+    pool = ProxyPool(['http://a:1', 'http://b:1', 'http://c:1'])
+    pool.record('http://a:1', 200, 2.5)
+    pool.record('http://b:1', 500, 0.1)
+    pool.record('http://c:1', 200, 0.1)
+
+    assert sorted(pool.assign() for _ in range(3)) == ['http://a:1', 'http://b:1', 'http://c:1']
+    assert pool.assign() == 'http://c:1'
+    # 기존 연결을 옮길 때는 원래 프록시의 연결 수를 빼고 비교하므로 그대로 유지
+    assert pool.assign(previous='http://c:1') == 'http://c:1'
+    assert [p['bound_sessions'] for p in pool.get_stats()] == [1, 1, 2]
+
+
+def test_sessions_route_around_blocked_proxy(stand_in_proxies):
+    """403을 돌려준 프록시는 격리되고, 그 프록시에 연결된 세션은 정상 프록시로 옮겨지는지 확인"""
+    urls, hits = stand_in_proxies
+    proxy_pool = ProxyPool(urls, quarantine_seconds=60)
+    pool = SessionPool(max_sessions=2, proxy_pool=proxy_pool)
+    assert pool.wait_until_ready(timeout=10)
+    assert sorted(proxy_of(s.session) for s in pool.sessions) == sorted(urls)
+
+    statuses = []
+    for _ in range(6):
+        session = pool.get_session()
+        start = time.perf_counter()
+        response = session.get('http://news.example/article', timeout=5)
+        pool.record_result(session, response.status_code, time.perf_counter() - start)
+        statuses.append(response.status_code)
+
+    assert hits.count('blocked') <= 1
+    assert statuses[-4:] == [200] * 4
+    assert all(proxy_of(s.session) == urls[1] for s in pool.sessions)
+    stats = pool.get_stats()['proxies']
+    assert stats[0]['quarantined_seconds'] > 0
+    assert stats[1]['bound_sessions'] == 2
+
+
+def plain_sessions(monkeypatch):
+    """네트워크 요청 없이 빈 세션을 만드는 _create_session"""
+    monkeypatch.setattr(SessionPool, '_create_session',
+                        lambda pool, session_id, proxy=None: requests.Session())
+
+
+def test_session_waits_for_quarantined_proxy_instead_of_direct(monkeypatch):
+    """모든 프록시가 격리 중이면 직접 연결 세션을 만들지 않고 격리가 풀릴 때까지 기다리는지 확인"""
+    plain_sessions(monkeypatch)
+    proxy_pool = ProxyPool(['http://a:1'], quarantine_seconds=0.3)
+    proxy_pool.record('http://a:1', 403, 0.1)
+
+    pool = SessionPool(max_sessions=1, proxy_pool=proxy_pool)
+    start = time.monotonic()
+    session = pool.get_session()
+    assert time.monotonic() - start >= 0.25
+    assert proxy_of(session) == 'http://a:1'
+    assert pool.sessions[0].proxy == 'http://a:1'
+    assert proxy_pool.get_stats()[0]['bound_sessions'] == 1
+
+
+def test_direct_fallback_only_when_allowed(monkeypatch):
+    """allow_direct_fallback이면 직접 연결하고, 격리가 풀리면 다시 프록시로 옮기는지 확인"""
+    plain_sessions(monkeypatch)
+    proxy_pool = ProxyPool(['http://a:1'], quarantine_seconds=60)
+    proxy_pool.record('http://a:1', 403, 0.1)
+
+    pool = SessionPool(max_sessions=1, proxy_pool=proxy_pool, allow_direct_fallback=True)
+    start = time.monotonic()
+    session = pool.get_session()
+    assert time.monotonic() - start < 0.2
+    assert proxy_of(session) is None and pool.sessions[0].proxy is None
+
+    proxy_pool.proxies[0].quarantined_until = 0.0
+    assert pool.get_session() is session
+    assert proxy_of(session) == 'http://a:1' and pool.sessions[0].proxy == 'http://a:1'
+
+
+def test_replacement_is_deferred_while_every_proxy_is_quarantined(monkeypatch):
+    """교체할 프록시가 없으면 기존 세션을 차단 상태로 두고, 교체 시 실제 연결한 프록시를 기록하는지 확인"""
+    plain_sessions(monkeypatch)
+    proxy_pool = ProxyPool(['http://a:1', 'http://b:1'], quarantine_seconds=60)
+    pool = SessionPool(max_sessions=2, proxy_pool=proxy_pool)
+    assert pool.wait_until_ready(timeout=2)
+    info = next(s for s in pool.sessions if s.proxy == 'http://a:1')
+    blocked = info.session
+    for url in ('http://a:1', 'http://b:1'):
+        proxy_pool.record(url, 403, 0.1)
+
+    for _ in range(3):
+        pool.mark_error(blocked, 403)
+    assert pool.wait_until_ready(timeout=2)
+    assert info.session is blocked and info.is_blocked and not info.replacing
+    assert info.proxy == 'http://a:1' and proxy_of(blocked) == 'http://a:1'
+
+    # 격리가 풀린 뒤 다시 교체되면 새 프록시로 연결하고 연결 수도 옮겨짐
+    proxy_pool.proxies[1].quarantined_until = 0.0
+    pool.mark_error(blocked, 403)
+    assert pool.wait_until_ready(timeout=2)
+    assert info.session is not blocked
+    assert info.proxy == 'http://b:1' and proxy_of(info.session) == 'http://b:1'
+    assert [p['bound_sessions'] for p in proxy_pool.get_stats()] == [0, 2]
@@ -0,0 +1,112 @@
+"""
+공용 속도 제한기 테스트
+
+호스트별 요청 간격, 전체 초당 요청 수, 스레드/asyncio 동시 사용 시 대기 시간을 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.rate_limiter import HostRateLimiter, jittered_interval
+
+SEARCH_URL = "https://search.naver.com/search.naver?where=news&query=test"
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/001/0000000001"
+
+
+def test_host_interval_is_jittered_and_per_host():
+    """같은 호스트 요청은 [최소, 최대] 간격으로 예약되고 다른 호스트는 영향을 받지 않는지 확인"""
+    limiter = HostRateLimiter(0.1, 0.2, seed=1)
+
+    waits = [limiter.reserve(SEARCH_URL) for _ in range(4)]
+    assert waits[0] == 0
+    for before, after in zip(waits, waits[1:]):
+        assert 0.09 <= after - before <= 0.21
+
+    assert limiter.reserve(ARTICLE_URL) == 0
+
+    limiter.set_interval(*jittered_interval(0, 1.0), host='n.news.naver.com')
+    assert limiter.interval_for('n.news.naver.com') == (0.0, 0.0)
+    assert limiter.interval_for('search.naver.com') == (0.1, 0.2)
+
+
+def test_concurrent_workers_get_exactly_the_global_rate():
+    """여러 스레드가 함께 요청해도 전체 초당 요청 수만큼만 기다리는지 확인"""
+    limiter = HostRateLimiter(global_rate=40)
+    count = 12
+
+    def worker(n):
+        for i in range(n):
+            limiter.acquire(f"https://n.news.naver.com/mnews/article/001/{i:010d}")
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(count // 4,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # 첫 요청은 즉시, 이후 11건은 0.025초 간격
+    assert elapsed == pytest.approx((count - 1) / 40, abs=0.08)
+
+
+def test_async_acquire_does_not_block_event_loop():
+    """asyncio 작업이 대기하는 동안 이벤트 루프가 다른 작업을 처리하는지 확인"""
+    limiter = HostRateLimiter(0.05)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(ticker(), *(limiter.acquire_async(SEARCH_URL) for _ in range(4)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(main())
+    assert 0.14 <= elapsed < 0.4
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.1
+
+
+def test_intervals_are_per_proxy():
+    """같은 호스트라도 다른 프록시를 거치는 요청은 서로 기다리지 않는지 확인"""
+    limiter = HostRateLimiter(1.0)
+
+    assert limiter.reserve(SEARCH_URL) == 0
+    assert limiter.reserve(SEARCH_URL, identity='http://proxy-a:8080') == 0
+    assert limiter.reserve(SEARCH_URL, identity='http://proxy-b:8080') == 0
+    assert limiter.reserve(SEARCH_URL, identity='http://proxy-a:8080') == pytest.approx(1.0, abs=0.05)
+
+
+def test_global_rate_is_reserved_at_send_time():
+    """호스트 간격으로 뒤에 보낼 요청도 실제 전송 시각 기준으로 전체 요청 수 제한을 지키는지 확인"""
+    limiter = HostRateLimiter(0.5, global_rate=10)
+    start = time.monotonic()
+
+    send_times = [limiter.reserve(SEARCH_URL) for _ in range(3)]
+    send_times += [limiter.reserve(f"https://host{i}.example.com/") for i in range(12)]
+    send_times = sorted(start + wait for wait in send_times)
+
+    # 어느 두 요청도 0.1초(초당 10건)보다 가깝게 예약되지 않음
+    assert min(b - a for a, b in zip(send_times, send_times[1:])) >= 0.1 - 0.01
+    # 다른 호스트 요청은 검색 요청 사이의 빈 자리를 사용하므로 전체 시간이 늘어나지 않음
+    assert send_times[-1] - start == pytest.approx(1.4, abs=0.05)
+
+
+def test_interval_can_be_given_per_call():
+    """호출마다 넘긴 간격이 공용 설정을 바꾸지 않고 그 요청에만 적용되는지 확인"""
+    limiter = HostRateLimiter(0.0)
+
+    assert limiter.reserve(SEARCH_URL, interval=(1.0, 1.0)) == 0
+    assert limiter.reserve(SEARCH_URL) == pytest.approx(1.0, abs=0.05)
+    assert limiter.reserve(SEARCH_URL) == pytest.approx(1.0, abs=0.05)
+    assert limiter.interval_for('search.naver.com') == (0.0, 0.0)
@@ -0,0 +1,86 @@
+"""
+HTTP 응답 캐시 테스트
+
+압축 저장, 기사/검색 페이지별 보관 시간, 크기 제한, 적중 통계를 확인합니다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.extractors import URLExtractor
+from src.utils import response_cache
+from src.utils.response_cache import ResponseCache
+
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/001/0000000001?sid=101"
+SEARCH_URL = "https://search.naver.com/search.naver?where=news&query=test"
+
+
+def test_roundtrip_is_compressed_and_keyed_by_article_id(tmp_path):
+    """압축 저장 후 같은 기사의 다른 URL 형태로도 조회되는지 확인"""
+    cache = ResponseCache(str(tmp_path), compression='gzip')
+    html = "<html><body>" + "기사 본문 " * 500 + "</body></html>"
+    cache.put(ARTICLE_URL, html)
+
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith('.gz')
+    assert os.path.getsize(tmp_path / files[0]) < len(html.encode('utf-8')) / 5
+
+    assert cache.get("https://n.news.naver.com/article/001/0000000001") == html
+    assert cache.get("https://n.news.naver.com/mnews/article/001/0000000002") is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+
+def test_search_pages_expire_before_articles(tmp_path, monkeypatch):
+    """검색 결과 페이지는 짧은 보관 시간이 지나면 만료되는지 확인"""
+    cache = ResponseCache(str(tmp_path), search_ttl=60, article_ttl=3600, compression='gzip')
+    cache.put(ARTICLE_URL, "article")
+    cache.put(SEARCH_URL, "search")
+
+    now = time.time()
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now + 120)
+    assert cache.get(SEARCH_URL) is None
+    assert cache.get(ARTICLE_URL) == "article"
+    assert cache.stats()['expired'] == 1
+
+
+def test_lru_eviction_and_reload(tmp_path):
+    """최대 크기를 넘으면 오래 사용하지 않은 항목부터 삭제되고, 다시 열어도 유지되는지 확인"""
+    page = os.urandom(3000).hex()  # 압축이 거의 되지 않는 본문
+    urls = [f"https://n.news.naver.com/mnews/article/001/{i:010d}" for i in range(4)]
+
+    cache = ResponseCache(str(tmp_path), max_size_bytes=int(len(page) * 0.6 * 3), compression='gzip')
+    for url in urls[:3]:
+        cache.put(url, page)
+    assert cache.get(urls[0]) == page  # 첫 항목을 최근 사용으로 표시
+    cache.put(urls[3], page)
+
+    assert cache.stats()['evictions'] >= 1
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[0]) == page
+
+    reopened = ResponseCache(str(tmp_path), compression='gzip')
+    assert reopened.get(urls[3]) == page
+
+
+class FailingSession:
+    def get(self, url, timeout=None):
+        raise AssertionError("캐시 적중 시 네트워크 요청이 없어야 합니다")
+
+
+def test_get_page_content_uses_cache(tmp_path, monkeypatch):
+    """캐시에 있는 페이지는 네트워크 요청 없이 반환되는지 확인"""
+    cache = ResponseCache(str(tmp_path), compression='gzip')
+    cache.put(ARTICLE_URL, "<html>cached</html>")
+    monkeypatch.setattr(response_cache, '_response_cache', cache)
+    monkeypatch.setattr(response_cache, '_cache_initialized', True)
+
+    extractor = URLExtractor.parser_only()
+    extractor._session = FailingSession()
+    monkeypatch.setattr(extractor.config.network, 'fetch_backend', 'sync')
+
+    assert extractor.get_page_content(ARTICLE_URL) == "<html>cached</html>"
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,142 @@
+"""
+검색 결과 페이지 파싱 테스트
+
+한 번의 순회로 찾은 결과 카드 제목이 기존의 조상별 전체 탐색 결과와 같은지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bs4 import BeautifulSoup
+
+import pytest
+
+from src.core.extractors import NaverNewsURLExtractor
+
+
+def make_nested_search_page(count):
+    """중첩된 컨테이너와 짧은 텍스트, 주석, 스크립트가 섞인 검색 결과 HTML 생성"""
+    cards = []
+    for i in range(count):
+        link = f'https://n.news.naver.com/mnews/article/{i % 3:03d}/{i:010d}?sid=101'
+        if i % 4 == 0:
+            # 제목이 링크보다 앞에 있고 여러 단계 위에 있는 카드
+            cards.append(
+                f'<li class="bx"><div class="news_wrap"><div class="news_info">'
+                f'<span>언론사 {i}</span></div>'
+                f'<div class="news_contents"><a class="news_tit">검색 결과 {i}번 기사의 충분히 긴 제목입니다</a>'
+                f'<div class="dsc"><span><a href="{link}">네이버뉴스</a></span></div></div></div></li>'
+            )
+        elif i % 4 == 1:
+            # 카드 안에 제목 후보가 없어 바깥 목록까지 올라가는 카드
+            cards.append(f'<li><div><p><a href="{link}">네이버뉴스</a></p></div></li>')
+        elif i % 4 == 2:
+            # 주석과 스크립트 텍스트가 제목보다 먼저 나오는 카드
+            cards.append(
+                f'<div class="card"><!-- 광고 영역 시작 표시용 주석입니다 ({i}) -->'
+                f'<script>var trackingCode = "abcdefghijklmnopqrstuvwxyz{i}";</script>'
+                f'<a href="{link}">네이버뉴스</a><div>{i}번째 카드의 본문 요약 텍스트가 여기에 있습니다</div></div>'
+            )
+        else:
+            # http로 시작하는 텍스트와 중복 링크가 있는 카드
+            cards.append(
+                f'<article><div><a href="{link}">{link}</a>'
+                f'<a href="{link}&amp;type=1">네이버뉴스</a>'
+                f'<em>{i}번 기사 제목입니다 - 두 번째 형식의 카드 제목</em></div></article>'
+            )
+    return f'<html><body><section><ul class="list_news">{"".join(cards)}</ul></section></body></html>'
+
+
+def legacy_find_title(link):
+    """기존 구현: 조상마다 모든 텍스트 노드를 다시 탐색"""
+    current = link
+    for _ in range(5):
+        parent = current.parent
+        if parent is None:
+            break
+        if parent.name in ['div', 'li', 'article']:
+            texts = []
+            for elem in parent.find_all(string=True, recursive=True):
+                text = elem.strip()
+                if text and len(text) > 20 and not text.startswith('http') and '네이버뉴스' not in text:
+                    texts.append(text)
+            if texts:
+                return texts[0]
+        current = parent
+    return None
+
+
+def test_single_pass_titles_match_legacy_search():
+    """모든 링크에 대해 기존 방식과 같은 제목을 찾는지 확인"""
+    soup = BeautifulSoup(make_nested_search_page(24), 'lxml')
+    first_texts = NaverNewsURLExtractor._index_first_texts(soup)
+
+    links = soup.find_all("a", href=NaverNewsURLExtractor.NAVER_PATTERN)
+    assert len(links) > 24
+    for link in links:
+        assert NaverNewsURLExtractor._find_card_title(link, first_texts) == legacy_find_title(link)
+
+
+def make_extractor():
+    """네트워크 초기화 없이 URL 추출기 생성"""
+    return NaverNewsURLExtractor.parser_only()
+
+
+def wrap_in_full_page(body):
+    """머리말 스크립트와 광고, 사이드 패널이 포함된 검색 결과 페이지로 감싸기"""
+    scripts = ''.join(f'<script>var config{i} = {{"key": "{"x" * 200}"}};</script>' for i in range(20))
+    side = ''.join(f'<div class="side"><a href="https://search.naver.com/?q={i}">연관 검색어 {i}번 항목의 긴 설명 문구</a></div>'
+                   for i in range(30))
+    return (f'<html><head><title>검색</title>{scripts}</head><body>'
+            f'<div id="wrap"><div id="header"><div class="ad">광고 영역에 들어가는 충분히 긴 문구입니다</div></div>'
+            f'<div id="container"><div id="content"><div class="main_pack">'
+            f'<div class="api_subject_bx"><div class="group_news">{body}</div></div>'
+            f'</div></div><div id="sub_pack">{side}</div></div></div></body></html>')
+
+
+def extract(html, partial):
+    extractor = make_extractor()
+    original = extractor.config.crawling.partial_search_parse
+    extractor.config.crawling.partial_search_parse = partial
+    try:
+        return [u.to_dict() for u in extractor.extract_news_urls(html)]
+    finally:
+        extractor.config.crawling.partial_search_parse = original
+
+
+@pytest.mark.parametrize('html', [
+    wrap_in_full_page(make_nested_search_page(12)[len('<html><body>'):-len('</body></html>')]),
+    make_nested_search_page(12),
+    '<html><body><a href="https://n.news.naver.com/mnews/article/001/0000000001">네이버뉴스</a>'
+    '<p>얕은 위치의 링크 옆에 있는 충분히 긴 제목 텍스트</p></body></html>',
+    '<html><body><div class="news_area"><a class="news_tit" href="https://www.example.com/news/1">'
+    '기존 구조의 원문 기사 제목</a></div></body></html>',
+])
+def test_partial_parse_matches_full_parse(html):
+    """검색 결과 영역만 파싱해도 전체 파싱과 같은 결과인지 확인"""
+    full = extract(html, partial=False)
+    assert full
+    partial = extract(html, partial=True)
+    for item in full + partial:
+        item.pop('collected_at')
+    assert partial == full
+
+
+def test_partial_parse_region_excludes_page_chrome():
+    """부분 파싱 영역에 머리말 스크립트와 사이드 패널이 빠지는지 확인"""
+    html = wrap_in_full_page(make_nested_search_page(12)[len('<html><body>'):-len('</body></html>')])
+    region = make_extractor()._search_result_region(html)
+    assert region is not None and len(region) < len(html) / 2
+    assert 'config0' not in region and '연관 검색어' not in region
+
+
+def test_extract_news_urls_keeps_titles():
+    """extract_news_urls 결과에 카드 제목이 채워지는지 확인"""
+    extractor = make_extractor()
+    results = extractor.extract_news_urls(make_nested_search_page(8))
+
+    titles = {u.url.split('?')[0].rsplit('/', 1)[1]: u.title for u in results}
+    assert titles['0000000000'] == "검색 결과 0번 기사의 충분히 긴 제목입니다"
+    assert titles['0000000003'] == "3번 기사 제목입니다 - 두 번째 형식의 카드 제목"
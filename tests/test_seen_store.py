@@ -0,0 +1,60 @@
+"""
+수집 기록 저장소 테스트
+
+SQLite 기반 기사 기록이 실행 간에 유지되는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.news import NewsArticle
+from src.utils.seen_store import BloomFilter, SeenArticleStore
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """추가한 항목은 항상 포함으로 판정되는지 확인"""
+    bloom = BloomFilter(expected_items=1000)
+    items = [f"001/{i:010d}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"002/{i:010d}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_store_persists_between_runs(tmp_path):
+    """기록이 배치 저장되고 다음 실행에서 다시 로드되는지 확인"""
+    db_path = str(tmp_path / "seen.db")
+
+    store = SeenArticleStore(db_path, batch_size=2)
+    store.add("001/0000000001")
+    assert store.contains("001/0000000001")  # 아직 기록 대기 중이어도 조회 가능
+    store.add("001/0000000002", "hash-2")
+    store.add("001/0000000003")
+    store.close()
+
+    reopened = SeenArticleStore(db_path)
+    assert reopened.contains("001/0000000001")
+    assert reopened.contains("001/0000000003")
+    assert not reopened.contains("001/0000000004")
+    assert reopened.has_content_hash("hash-2")
+    reopened.close()
+
+
+def test_record_article_skips_same_content(tmp_path):
+    """본문 해시 비교 시 다른 ID의 동일 본문 기사를 걸러내는지 확인"""
+    store = SeenArticleStore(str(tmp_path / "seen.db"))
+    body = "같은 통신사 기사 본문입니다. " * 10
+
+    first = NewsArticle(url="https://n.news.naver.com/mnews/article/001/0000000001",
+                        title="제목", content=body)
+    rewrite = NewsArticle(url="https://n.news.naver.com/mnews/article/421/0000000009",
+                          title="제목", content="  " + body.replace(" ", "  "))
+
+    assert store.record_article(first, use_content_hash=True)
+    assert not store.record_article(rewrite, use_content_hash=True)
+    assert store.contains("421/0000000009")
+    store.close()
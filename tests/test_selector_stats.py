@@ -0,0 +1,82 @@
+"""
+선택자 적중 통계 테스트
+
+언론사별 적중 수에 따라 선택자 순서가 바뀌고 파일에 저장되는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.content_extractor import NaverNewsContentExtractor
+from src.utils import selector_stats
+from src.utils.config import get_config
+from src.utils.selector_stats import SelectorStats
+
+# 기본 제목 선택자(h2.media_end_head_headline)가 없고 h1만 있는 언론사 페이지
+LEGACY_PAGE = ('<html><body><h1>구형 템플릿 제목</h1>'
+               '<div id="articleBodyContents">' + '본문 ' * 60 + '</div></body></html>')
+
+
+def test_ordering_follows_hit_counts():
+    """적중 수가 많은 선택자가 먼저 오고, 표본이 적으면 설정 순서를 유지하는지 확인"""
+    stats = SelectorStats(min_samples=3)
+    candidates = [('h2.headline', None), ('h1', None), ('h3', None)]
+
+    stats.record('title', '001', 'h1', 2)
+    stats.record('title', '001', 'h1', 2)
+    assert stats.ordered('title', '001', candidates) == candidates
+
+    stats.record('title', '001', 'h1', 2)
+    assert [c[0] for c in stats.ordered('title', '001', candidates)] == ['h1', 'h2.headline', 'h3']
+    # 다른 언론사와 항목에는 영향 없음
+    assert stats.ordered('title', '002', candidates) == candidates
+    assert stats.ordered('content', '001', candidates) == candidates
+
+
+def test_stats_persist_between_runs(tmp_path):
+    """저장한 통계를 다음 실행에서 불러오는지 확인"""
+    path = str(tmp_path / "stats" / "selector_stats.json")
+    stats = SelectorStats(path)
+    stats.record('content', '001', 'div#articleBodyContents', 2)
+    stats.save()
+
+    reloaded = SelectorStats(path)
+    assert reloaded.hit_counts('001') == {'content': {'div#articleBodyContents': 1}}
+
+
+@pytest.fixture
+def adaptive(tmp_path, monkeypatch):
+    """적응형 선택자 순서를 켠 설정"""
+    config = get_config()
+    original = (config.extraction.adaptive_selectors, config.extraction.selector_stats_file)
+    monkeypatch.setattr(selector_stats, '_selector_stats', None)
+    config.extraction.selector_stats_file = str(tmp_path / "selector_stats.json")
+    config.extraction.adaptive_selectors = True
+    yield selector_stats.get_selector_stats()
+    config.extraction.adaptive_selectors, config.extraction.selector_stats_file = original
+
+
+@pytest.mark.parametrize('engine', ['beautifulsoup', 'lxml'])
+def test_adaptive_ordering_reduces_evaluations(adaptive, engine):
+    """학습 후 같은 결과를 더 적은 선택자 평가로 얻는지 확인"""
+    config = get_config()
+    original_engine = config.extraction.engine
+    config.extraction.engine = engine
+    try:
+        extractor = NaverNewsContentExtractor.parser_only()
+        url = "https://n.news.naver.com/mnews/article/001/{:010d}"
+
+        first = extractor.parse_news_content(url.format(1), LEGACY_PAGE)
+        before = adaptive.average_evaluations()
+        for i in range(2, 12):
+            article = extractor.parse_news_content(url.format(i), LEGACY_PAGE)
+            assert (article.title, article.content) == (first.title, first.content)
+        assert first.title == "구형 템플릿 제목"
+
+        assert adaptive.average_evaluations() < before
+    finally:
+        config.extraction.engine = original_engine
@@ -0,0 +1,286 @@
+"""
+세션 풀 테스트
+
+세션이 첫 사용 시에만 만들어지고, 나머지 세션의 예열은 백그라운드에서 동시에 진행되는지,
+저장한 세션 상태가 다음 실행에서 복원되는지, 403을 받은 세션만 냉각되는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.extractors import URLExtractor
+from src.utils.config import get_config
+from src.utils.session_pool import SessionPool, SessionUnavailableError
+
+
+class SlowWarmup:
+    """예열 한 번에 delay초가 걸리는 가짜 _create_session"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.created = []
+        self._lock = threading.Lock()
+
+    def install(self, monkeypatch):
+        def create_session(pool, session_id, proxy=None):
+            time.sleep(self.delay)
+            with self._lock:
+                self.created.append(session_id)
+            return requests.Session()
+
+        monkeypatch.setattr(SessionPool, '_create_session', create_session)
+        return self
+
+
+def test_sessions_are_created_lazily(monkeypatch):
+    """풀을 만들 때는 네트워크 요청 없이 세션 자리만 준비하는지 확인"""
+    warmup = SlowWarmup(0).install(monkeypatch)
+
+    pool = SessionPool(max_sessions=3)
+    assert warmup.created == []
+    assert pool.get_stats()['ready_sessions'] == 0
+
+
+def test_first_session_costs_one_warmup_and_rest_warm_in_background(monkeypatch):
+    """첫 세션은 예열 한 번만 기다리고 나머지는 백그라운드에서 동시에 준비되는지 확인"""
+    warmup = SlowWarmup(0.2).install(monkeypatch)
+    pool = SessionPool(max_sessions=4)
+
+    start = time.monotonic()
+    first = pool.get_session()
+    assert first is not None
+    assert time.monotonic() - start < 0.35
+    assert first is pool.sessions[0].session
+
+    # 예열 중인 세션은 건너뛰고 준비된 세션을 사용
+    assert pool.get_session() is first
+
+    start = time.monotonic()
+    assert pool.wait_until_ready(timeout=2)
+    # 나머지 세 세션의 예열은 순차(0.6초)가 아니라 동시에 진행
+    assert time.monotonic() - start < 0.4
+    assert sorted(warmup.created) == [0, 1, 2, 3]
+    assert pool.get_session() is not first
+
+
+def test_get_session_never_returns_none_while_warming(monkeypatch):
+    """첫 세션 생성이 실패하고 나머지가 예열 중이어도 세션을 바로 만들어 반환하는지 확인"""
+    calls = []
+
+    def create_session(pool, session_id, proxy=None):
+        calls.append(session_id)
+        if len(calls) == 1:
+            raise OSError("warm-up failed")
+        if threading.current_thread().name.startswith('session-warmup'):
+            time.sleep(0.5)
+        return requests.Session()
+
+    monkeypatch.setattr(SessionPool, '_create_session', create_session)
+    pool = SessionPool(max_sessions=3)
+
+    start = time.monotonic()
+    session = pool.get_session()
+    assert isinstance(session, requests.Session)
+    assert time.monotonic() - start < 0.3
+    assert pool.sessions[0].session is session
+
+    # 예열 스레드가 끝나도 먼저 채운 세션은 바뀌지 않음
+    assert pool.wait_until_ready(timeout=2)
+    assert pool.sessions[0].session is session
+
+
+def test_snapshot_restores_cookies_and_rewarms_only_stale_sessions(tmp_path, monkeypatch):
+    """저장한 쿠키와 User-Agent를 복원하고 만료/차단된 세션만 다시 예열하는지 확인"""
+    snapshot_file = str(tmp_path / 'sessions.json')
+    warmup = SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=3, snapshot_file=snapshot_file)
+    assert pool.wait_until_ready(timeout=2)
+
+    future = int(time.time()) + 3600
+    pool.sessions[0].session.cookies.set('NNB', 'fresh', domain='.naver.com', expires=future)
+    pool.sessions[1].session.cookies.set('NNB', 'stale', domain='.naver.com', expires=int(time.time()) - 10)
+    pool.sessions[2].session.cookies.set('NNB', 'blocked', domain='.naver.com', expires=future)
+    pool.sessions[2].mark_error(403)
+    user_agent = pool.sessions[0].session.headers['User-Agent']
+    pool.sessions[0].request_count = 7
+    pool.save_snapshot()
+
+    warmup = SlowWarmup(0.3).install(monkeypatch)
+    restored = SessionPool(max_sessions=3, snapshot_file=snapshot_file)
+    assert [s.is_ready for s in restored.sessions] == [True, False, False]
+    assert restored.sessions[0].session.cookies.get('NNB') == 'fresh'
+    assert restored.sessions[0].session.headers['User-Agent'] == user_agent
+    assert restored.sessions[0].request_count == 7
+
+    # 복원된 세션이 있으면 첫 요청은 예열을 기다리지 않음
+    start = time.monotonic()
+    assert restored.get_session() is restored.sessions[0].session
+    assert time.monotonic() - start < 0.2
+    assert restored.wait_until_ready(timeout=2)
+    assert sorted(warmup.created) == [1, 2]
+
+
+def test_old_snapshot_is_ignored(tmp_path, monkeypatch):
+    """저장 시각이 허용 기간보다 오래된 상태는 복원하지 않는지 확인"""
+    snapshot_file = str(tmp_path / 'sessions.json')
+    SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=1, snapshot_file=snapshot_file)
+    pool.get_session().cookies.set('NNB', 'value', domain='.naver.com')
+    pool.save_snapshot()
+
+    with open(snapshot_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['saved_at'] = (datetime.now() - timedelta(days=2)).isoformat()
+    with open(snapshot_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    assert SessionPool(max_sessions=1, snapshot_file=snapshot_file).sessions[0].is_ready is False
+
+
+def test_selection_prefers_healthy_fast_sessions(monkeypatch):
+    """실패가 잦거나 느린 세션보다 성공률이 높고 빠른 세션을 먼저 고르는지 확인"""
+    SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=3)
+    assert pool.wait_until_ready(timeout=2)
+    flaky, slow, healthy = (s.session for s in pool.sessions)
+
+    for _ in range(3):
+        pool.record_result(flaky, 500, 0.2)
+        pool.record_result(slow, 200, 2.5)
+        pool.record_result(healthy, 200, 0.2)
+
+    assert pool.get_session() is healthy
+    # 가장 좋은 세션이 차단되면 실패가 잦은 세션보다 느린 세션을 먼저 사용
+    pool.mark_error(healthy, 403)
+    assert pool.get_session() is slow
+    assert pool.get_stats()['sessions'][0]['success_rate'] < 0.6
+
+
+def test_replacement_is_built_outside_the_lock(monkeypatch):
+    """차단된 세션 교체는 백그라운드에서 진행되어 403을 받은 작업자와 다른 작업자 모두 기다리지 않는지 확인"""
+    SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=2)
+    assert pool.wait_until_ready(timeout=2)
+    blocked = pool.sessions[0].session
+
+    SlowWarmup(0.5).install(monkeypatch)
+    start = time.monotonic()
+    for _ in range(3):
+        pool.mark_error(blocked, 403)
+    assert time.monotonic() - start < 0.1
+    assert pool.sessions[0].replacing
+
+    start = time.monotonic()
+    assert pool.get_session() is pool.sessions[1].session
+    assert time.monotonic() - start < 0.1
+
+    assert pool.wait_until_ready(timeout=2)
+    replaced = pool.sessions[0]
+    assert replaced.session is not blocked
+    assert replaced.is_available() and replaced.error_count == 0
+    # 교체된 세션도 오류 마킹 대상 조회에 등록됨
+    pool.mark_error(replaced.session, 500)
+    assert replaced.error_count == 1
+
+
+class CookieGateHandler(BaseHTTPRequestHandler):
+    """sid=blocked 쿠키로 온 요청에만 403을 돌려주는 원본 서버"""
+
+    def do_GET(self):
+        blocked = 'sid=blocked' in self.headers.get('Cookie', '')
+        body = b"<html><body>ok</body></html>"
+        self.send_response(403 if blocked else 200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def origin(monkeypatch, fresh_rate_limiter):
+    config = get_config()
+    monkeypatch.setattr(config.network, 'fetch_backend', 'sync')
+    monkeypatch.setattr(config.network, 'http_mode', 'live')
+    monkeypatch.setattr(config.network, 'retries', 3)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CookieGateHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_extractor(pool):
+    extractor = URLExtractor.parser_only()
+    extractor._use_session_pool = True
+    extractor._session_pool = pool
+    return extractor
+
+
+def test_forbidden_session_cools_down_and_request_moves_on(origin, monkeypatch):
+    """403을 받은 세션만 냉각시키고 다른 세션으로 기다리지 않고 재시도하는지 확인"""
+    SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=2, cooldown_seconds=60)
+    assert pool.wait_until_ready(timeout=2)
+    blocked, healthy = (s.session for s in pool.sessions)
+    blocked.cookies.set('sid', 'blocked')
+    # 차단될 세션이 먼저 선택되도록 함
+    pool.sessions[1].last_used = datetime.now()
+
+    start = time.monotonic()
+    assert make_extractor(pool).get_page_content(f"{origin}/article") is not None
+    assert time.monotonic() - start < 1.0
+
+    assert pool.sessions[0].is_blocked and not pool.sessions[1].is_blocked
+    assert pool.cooldown_remaining() == 0
+    assert pool.get_session() is healthy
+
+
+def test_request_retries_when_pool_cannot_build_a_session(origin, monkeypatch):
+    """세션 생성이 잠시 실패해도 요청이 중단되지 않고 백오프 후 재시도되는지 확인"""
+    calls = []
+
+    def create_session(pool, session_id, proxy=None):
+        calls.append(session_id)
+        if len(calls) <= 2:
+            raise OSError("warm-up failed")
+        return requests.Session()
+
+    monkeypatch.setattr(SessionPool, '_create_session', create_session)
+    waits = []
+    monkeypatch.setattr('src.utils.metrics.sleep', lambda seconds, reason: waits.append(reason))
+    pool = SessionPool(max_sessions=1)
+
+    # 첫 시도의 세션 생성 두 번(시작, 즉시 생성)이 실패하면 요청 오류처럼 백오프 후 다시 시도
+    assert make_extractor(pool).get_page_content(f"{origin}/article") is not None
+    assert waits.count('retry_backoff') == 1 and len(calls) == 3
+    assert issubclass(SessionUnavailableError, requests.RequestException)
+
+
+def test_wait_only_when_every_session_is_cooling(origin, monkeypatch):
+    """모든 세션이 냉각 중일 때만 가장 먼저 풀리는 세션까지 기다리는지 확인"""
+    SlowWarmup(0).install(monkeypatch)
+    pool = SessionPool(max_sessions=2, cooldown_seconds=0.3)
+    assert pool.wait_until_ready(timeout=2)
+    for info in pool.sessions:
+        info.session.cookies.set('sid', 'blocked')
+    waits = []
+    monkeypatch.setattr('src.utils.metrics.sleep', lambda seconds, reason: waits.append((reason, seconds)))
+
+    assert make_extractor(pool).get_page_content(f"{origin}/article") is None
+    forbidden_waits = [seconds for reason, seconds in waits if reason == 'forbidden_backoff']
+    # 첫 403 이후에는 다른 세션으로 바로 재시도, 두 번째 403 이후에만 냉각 시간만큼 대기
+    assert len(forbidden_waits) == 1
+    assert 0 < forbidden_waits[0] <= 0.3
@@ -0,0 +1,81 @@
+"""
+URL 중복 제거 테스트
+
+네트워크 요청 없이 검색 결과 수집 시 해시 기반 중복 제거 동작을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.extractors import NaverNewsURLExtractor
+from tests.conftest import make_search_page
+
+
+def make_extractor(pages):
+    """주어진 페이지 HTML을 순서대로 반환하는 추출기"""
+    extractor = NaverNewsURLExtractor.parser_only()
+    html_pages = iter(pages)
+    extractor.get_page_content = lambda url, interval=None: next(html_pages, None)
+    return extractor
+
+
+def test_duplicates_across_pages_are_skipped():
+    """페이지 간 중복 기사가 한 번만 수집되는지 확인"""
+    pages = [
+        make_search_page(['0000000001', '0000000002']),
+        make_search_page(['0000000002', '0000000003']),
+    ]
+    extractor = make_extractor(pages)
+
+    urls = extractor.collect_from_search("https://search.naver.com/search.naver?query=test",
+                                         max_pages=2, delay_sec=0)
+
+    assert [u.url.split('?')[0][-3:] for u in urls] == ['001', '002', '003']
+
+
+def test_preseeded_seen_keys_are_skipped_and_updated():
+    """미리 채운 seen_keys의 기사는 건너뛰고 새 기사 키는 추가되는지 확인"""
+    first = make_extractor([make_search_page(['0000000001', '0000000002'])])
+    seen_keys = set()
+    first_urls = first.collect_from_search("https://search.naver.com/search.naver?query=a",
+                                           max_pages=1, delay_sec=0, seen_keys=seen_keys)
+    assert len(first_urls) == 2 and len(seen_keys) == 2
+
+    second = make_extractor([make_search_page(['0000000002', '0000000003'])])
+    second_urls = second.collect_from_search("https://search.naver.com/search.naver?query=a",
+                                             max_pages=1, delay_sec=0, seen_keys=seen_keys)
+    assert len(second_urls) == 1 and second_urls[0].url.startswith(
+        "https://n.news.naver.com/mnews/article/001/0000000003")
+    assert len(seen_keys) == 3
+
+
+def test_url_shapes_share_canonical_article_id():
+    """같은 기사의 여러 URL 형태가 같은 기사 ID로 정규화되는지 확인"""
+    from src.models.news import NewsURL, canonical_article_id
+
+    variants = [
+        "https://n.news.naver.com/mnews/article/001/0014874563?sid=101",
+        "https://n.news.naver.com/article/001/0014874563",
+        "https://m.news.naver.com/article/001/0014874563?type=main#comment",
+        "https://news.naver.com/main/read.naver?mode=LSD&oid=001&aid=0014874563",
+    ]
+    assert {canonical_article_id(u) for u in variants} == {"001/0014874563"}
+    assert canonical_article_id("https://example.com/article/001/0014874563") is None
+    assert NewsURL(url=variants[0], type="naver").to_dict()['article_id'] == "001/0014874563"
+
+
+def test_url_variants_are_collected_once():
+    """다른 URL 형태의 같은 기사가 한 번만 수집되는지 확인"""
+    page = make_search_page(['0000000001']).replace(
+        '</ul>',
+        '<li><div><a href="https://n.news.naver.com/article/001/0000000001">네이버뉴스</a>'
+        '<span>같은 기사를 가리키는 다른 형태의 링크 제목입니다</span></div></li></ul>'
+    )
+    extractor = make_extractor([page])
+
+    urls = extractor.collect_from_search("https://search.naver.com/search.naver?query=test",
+                                         max_pages=1, delay_sec=0)
+
+    assert len(urls) == 1 and urls[0].article_id == "001/0000000001"